@@ -0,0 +1,342 @@
+"""
+Archetype classes, part of the glGA SDK ECSS
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+The Archetype classes provide the columnar (structure-of-arrays) storage behind the ECSSManager.
+
+All Entities that share the same set of Component types live in one Archetype table, one row per Entity.
+Components that declare matrix columns (e.g. BasicTransform trs, l2world, l2cam) have their data
+stored in contiguous (N,4,4) numpy arrays and the Component objects become thin views into these columns,
+so that Systems can operate with a handful of bulk array operations instead of per-object Python calls.
+
+"""
+
+from __future__ import annotations
+from typing import List, Dict, Tuple, FrozenSet
+
+import numpy as np
+
+
+class Archetype():
+    """
+    A table of Entities that all have exactly the same set of Component types (the signature).
+
+    Each row holds one Entity and its Components. Matrix columns of the Components are kept
+    in contiguous numpy arrays of shape (capacity,4,4), keyed by (Component type, attribute name).
+    """
+
+    def __init__(self, signature: FrozenSet[str], capacity=16, dtype=np.float32):
+        self._signature = signature
+        self._capacity = max(int(capacity), 1)
+        self._dtype = np.dtype(dtype)
+        self._entities: List = []
+        # one list of Components per Component type, aligned with _entities rows
+        self._components: Dict[str, List] = {typeName: [] for typeName in signature}
+        # (Component type, attribute) -> (capacity,4,4) numpy array
+        self._columns: Dict[Tuple[str, str], np.ndarray] = {}
+
+    @property #signature
+    def signature(self) -> FrozenSet[str]:
+        """ Get Archetype's signature, the set of its Component type names """
+        return self._signature
+
+    @property #dtype
+    def dtype(self) -> np.dtype:
+        """ Get Archetype's matrix column element type """
+        return self._dtype
+
+    @property #entities
+    def entities(self) -> List:
+        """ Get Archetype's Entities, one per row """
+        return self._entities
+
+    @property #capacity
+    def capacity(self) -> int:
+        """ Get Archetype's allocated number of rows """
+        return self._capacity
+
+    def __len__(self):
+        return len(self._entities)
+
+    def components(self, typeName: str) -> List:
+        """
+        Get the Components of a specific type, aligned with the Archetype rows
+
+        :param typeName: Component class name e.g. "BasicTransform"
+        :type typeName: str
+        """
+        return self._components[typeName]
+
+    def column(self, typeName: str, attribute: str) -> np.ndarray:
+        """
+        Get the contiguous (N,4,4) array view of a Component matrix attribute for all rows.
+        The view is only valid until the next append(), remove() or reserve() of the Archetype:
+        growing reallocates the columns and removing reorders the rows, so fetch the column again afterwards
+
+        :param typeName: Component class name e.g. "BasicTransform"
+        :type typeName: str
+        :param attribute: Component matrix attribute e.g. "l2world"
+        :type attribute: str
+        :return: (N,4,4) view of the column, writes go straight to the Components but are not detected: 
+            call markDirty() after writing, or write() instead
+        :rtype: numpy.array
+        """
+        return self._columns[(typeName, attribute)][:len(self._entities)]
+    
+    def markDirty(self, typeName: str, rows=None):
+        """
+        Flag the Components of some rows for recalculation after a bulk write to their columns, 
+        e.g. markDirty("BasicTransform") so that the next TransformSystem traversal updates l2world
+
+        :param typeName: Component class name e.g. "BasicTransform"
+        :type typeName: str
+        :param rows: row indices, defaults to None for all rows
+        :type rows: Iterable[int] or slice, optional
+        """
+        components = self._components[typeName]
+        if rows is None:
+            selected = components
+        elif isinstance(rows, slice):
+            selected = components[rows]
+        else:
+            selected = [components[row] for row in np.asarray(rows).reshape(-1)]
+        for component in selected:
+            component.markDirty()
+    
+    def write(self, typeName: str, attribute: str, values, rows=None):
+        """
+        Bulk write a Component matrix attribute of some rows and flag them for recalculation
+
+        :param typeName: Component class name e.g. "BasicTransform"
+        :type typeName: str
+        :param attribute: Component matrix attribute e.g. "trs"
+        :type attribute: str
+        :param values: the new matrices, broadcast against the rows
+        :type values: (N,4,4) or (4,4) array_like
+        :param rows: row indices, defaults to None for all rows
+        :type rows: Iterable[int] or slice, optional
+        """
+        column = self.column(typeName, attribute)
+        column[slice(None) if rows is None else rows] = values
+        self.markDirty(typeName, rows)
+
+    def hasColumn(self, typeName: str, attribute: str) -> bool:
+        return (typeName, attribute) in self._columns
+
+    def reserve(self, capacity: int):
+        """
+        Grow the Archetype columns to at least capacity rows and rebind all Component views.
+        Arrays previously returned by column() or by the Components' matrix getters no longer alias the storage
+
+        :param capacity: number of rows
+        :type capacity: int
+        """
+        if capacity <= self._capacity:
+            return
+        self._capacity = capacity
+        count = len(self._entities)
+        for key, column in self._columns.items():
+            grown = np.empty((capacity,) + column.shape[1:], dtype=column.dtype)
+            grown[:count] = column[:count]
+            self._columns[key] = grown
+        for row in range(count):
+            self._bindRow(row)
+
+    def append(self, entity, components: Dict) -> int:
+        """
+        Add a new row with an Entity and its Components (one per signature type).
+        The Components' matrix data are copied in the columns and the Components become views of them.
+
+        :param entity: the Entity of the new row
+        :type entity: Entity
+        :param components: Component type name -> Component
+        :type components: Dict
+        :return: the row index
+        :rtype: int
+        """
+        row = len(self._entities)
+        if row >= self._capacity:
+            self.reserve(self._capacity * 2)
+        self._entities.append(entity)
+        for typeName, component in components.items():
+            self._components[typeName].append(component)
+            for attribute in component._columns:
+                key = (typeName, attribute)
+                if key not in self._columns:
+                    value = getattr(component, "_" + attribute)
+                    self._columns[key] = np.zeros((self._capacity,) + np.shape(value), dtype=self._dtype)
+                self._columns[key][row] = getattr(component, "_" + attribute)
+        self._bindRow(row)
+        return row
+
+    def replace(self, row: int, component):
+        """
+        Replace the Component of the same type at a row, e.g. when an Entity gets a new BasicTransform
+
+        :param row: row index
+        :type row: int
+        :param component: the new Component
+        :type component: Component
+        :return: the replaced Component, unbound from the columns
+        :rtype: Component
+        """
+        typeName = component.getClassName()
+        previous = self._components[typeName][row]
+        previous.unbindColumns()
+        self._components[typeName][row] = component
+        for attribute in component._columns:
+            self._columns[(typeName, attribute)][row] = getattr(component, "_" + attribute)
+        component.bindColumns(self, row)
+        return previous
+
+    def remove(self, row: int):
+        """
+        Remove a row by moving the last row in its place (swap-remove), so that columns stay contiguous.
+        The Components of the removed row get their own copies of the matrix data.
+
+        :param row: row index
+        :type row: int
+        :return: the Entity that was moved into row, or None if the last row was removed
+        :rtype: Entity
+        """
+        last = len(self._entities) - 1
+        for components in self._components.values():
+            components[row].unbindColumns()
+        moved = None
+        if row != last:
+            moved = self._entities[last]
+            self._entities[row] = moved
+            for components in self._components.values():
+                components[row] = components[last]
+            for column in self._columns.values():
+                column[row] = column[last]
+        self._entities.pop()
+        for components in self._components.values():
+            components.pop()
+        if moved is not None:
+            self._bindRow(row)
+        return moved
+
+    def rowComponents(self, row: int) -> Dict:
+        """ Get a Component type name -> Component dict of a row """
+        return {typeName: components[row] for typeName, components in self._components.items()}
+
+    def _bindRow(self, row: int):
+        for components in self._components.values():
+            components[row].bindColumns(self, row)
+
+    def __str__(self):
+        return f"\n Archetype signature: {sorted(self._signature)}, rows: {len(self._entities)}, capacity: {self._capacity}"
+
+
+class ArchetypeStorage():
+    """
+    The columnar Entity-Component store of an ECSSManager.
+
+    Keeps one Archetype per distinct Component type set and moves an Entity's row between Archetypes
+    whenever a Component type is added to or removed from it.
+    """
+
+    def __init__(self, dtype=np.float32):
+        self._dtype = np.dtype(dtype) # element type of all matrix columns
+        self._archetypes: Dict[FrozenSet[str], Archetype] = {}
+        # Entity -> (Archetype, row)
+        self._locations: Dict = {}
+
+    @property #dtype
+    def dtype(self) -> np.dtype:
+        """ Get the matrix column element type of all Archetypes """
+        return self._dtype
+
+    @property #archetypes
+    def archetypes(self) -> List[Archetype]:
+        """ Get all Archetypes of this storage """
+        return list(self._archetypes.values())
+
+    def getArchetype(self, signature: FrozenSet[str]) -> Archetype:
+        """
+        Get or create the Archetype of a specific Component type signature
+        """
+        archetype = self._archetypes.get(signature)
+        if archetype is None:
+            archetype = Archetype(signature, dtype=self._dtype)
+            self._archetypes[signature] = archetype
+        return archetype
+
+    def location(self, entity) -> Tuple[Archetype, int]:
+        """ Get the (Archetype, row) of an Entity, or None if it is not stored """
+        return self._locations.get(entity)
+
+    def addEntity(self, entity, components: Dict = None):
+        """
+        Add an Entity, by default with no Components yet in the empty-signature Archetype, 
+        or directly in the Archetype of its initial Components
+
+        :param components: Component type name -> Component, defaults to None
+        :type components: Dict, optional
+        """
+        if entity not in self._locations:
+            components = {} if components is None else components
+            archetype = self.getArchetype(frozenset(components))
+            self._locations[entity] = (archetype, archetype.append(entity, components))
+
+    def removeEntity(self, entity):
+        """
+        Remove an Entity row; its Components keep their own copy of their data
+        """
+        archetype, row = self._locations.pop(entity)
+        moved = archetype.remove(row)
+        if moved is not None:
+            self._locations[moved] = (archetype, row)
+
+    def addComponent(self, entity, component):
+        """
+        Add a Component to an Entity's row. If the Entity has already a Component of the same type
+        it is replaced in place, otherwise the Entity moves to the Archetype with the extended signature.
+
+        :return: the replaced Component or None
+        :rtype: Component
+        """
+        typeName = component.getClassName()
+        archetype, row = self._locations[entity]
+        if typeName in archetype.signature:
+            return archetype.replace(row, component)
+        components = archetype.rowComponents(row)
+        components[typeName] = component
+        self._move(entity, archetype, row, components)
+        return None
+
+    def removeComponent(self, entity, typeName: str):
+        """
+        Remove the Component of a specific type from an Entity's row
+
+        :return: the removed Component or None
+        :rtype: Component
+        """
+        archetype, row = self._locations[entity]
+        if typeName not in archetype.signature:
+            return None
+        components = archetype.rowComponents(row)
+        component = components.pop(typeName)
+        self._move(entity, archetype, row, components)
+        return component
+
+    def query(self, *typeNames: str) -> List[Archetype]:
+        """
+        Get all non-empty Archetypes whose Entities have at least all the given Component types
+
+        :param typeNames: Component class names e.g. "BasicTransform", "Camera"
+        :type typeNames: str
+        """
+        required = frozenset(typeNames)
+        return [archetype for signature, archetype in self._archetypes.items()
+                if required <= signature and len(archetype) > 0]
+
+    def _move(self, entity, archetype: Archetype, row: int, components: Dict):
+        moved = archetype.remove(row)
+        if moved is not None:
+            self._locations[moved] = (archetype, row)
+        target = self.getArchetype(frozenset(components))
+        self._locations[entity] = (target, target.append(entity, components))
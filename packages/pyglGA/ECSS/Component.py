@@ -22,13 +22,41 @@ The following is example restructured text doc example
 
 from __future__         import annotations
 from abc                import ABC, abstractmethod
-from typing             import List
+from typing             import List, Set
 from collections.abc    import Iterable, Iterator
+import logging
+
+import numpy as np
 
 import pyglGA.ECSS.System
-import uuid  
+import itertools
 import pyglGA.ECSS.utilities as util
 
+logger = logging.getLogger(__name__)
+
+# cheap, increasing default ids of all Components and Entities, ids of destroyed ones are reused first
+_componentIds = itertools.count(1)
+_freeIds: List[int] = []
+_issuedIds: Set[int] = set() # ids handed out by allocateId() and not released yet
+_typeNames = {} # Component class -> frozenset of its and its base classes' names, see Component.getTypeNames()
+
+def allocateId() -> int:
+    """ Get a new Component id, reusing released ids first """
+    try:
+        id = _freeIds.pop()
+    except IndexError: # also safe when worlds on other threads take the last free id
+        id = next(_componentIds)
+    _issuedIds.add(id)
+    return id
+
+def releaseId(id):
+    """ Return the id of a destroyed Component for reuse, only ids issued by allocateId() are reused, once """
+    try:
+        _issuedIds.remove(id) # one atomic step, so that concurrent releases of the same id cannot both succeed
+    except (KeyError, TypeError):
+        return
+    _freeIds.append(id)
+
 
 class Component(ABC, Iterable):
     """
@@ -39,6 +67,12 @@ class Component(ABC, Iterable):
     Concrete Subclass Components typically are e.g. BasicTransform, RenderMesh, Shader, RigidBody etc.
     """
     
+    # fixed attributes instead of a per instance __dict__, subclasses declare only their own attributes
+    __slots__ = ("_name", "_type", "_id", "_parent", "_children", "_worldManager", "_eventManager", "_archetype", "_row", "_handle")
+    
+    # names of 4x4 matrix attributes that are kept in ECSSManager Archetype columns
+    _columns = ()
+    
     def __init__(self, name=None, type=None, id=None):
         
         if (name is None):
@@ -52,7 +86,7 @@ class Component(ABC, Iterable):
             self._type = type
         
         if id is None:
-            self._id = uuid.uuid1().int #assign unique ID on Component
+            self._id = allocateId() #assign unique ID on Component
         else:
             self._id = id
         
@@ -60,6 +94,9 @@ class Component(ABC, Iterable):
         self._children = None
         self._worldManager = None
         self._eventManager = None
+        self._archetype = None
+        self._row = None
+        self._handle = None
     
     #define properties for id, name, type, parent
     @property #name
@@ -85,6 +122,14 @@ class Component(ABC, Iterable):
     @id.setter
     def id(self, value):
         self._id = value
+    
+    @property #handle
+    def handle(self) -> int:
+        """ Get Component's generational ECSSManager handle, None if not created via an ECSSManager """
+        return self._handle
+    @handle.setter
+    def handle(self, value):
+        self._handle = value
         
     @property #parent
     def parent(self) -> Component:
@@ -122,10 +167,60 @@ class Component(ABC, Iterable):
     def getNumberOfChildren(self) -> int:
         return len(self._children)
     
+    def markDirty(self, spread=True):
+        """
+        Flag this Component for recalculation by the Systems. A plain Component has nothing to recalculate.
+
+        :param spread: also flag what depends on this Component in the hierarchy, defaults to True
+        :type spread: bool, optional
+        :return: True if newly flagged, False if it was already flagged, None if there is nothing to flag
+        """
+        return None
+    
+    def release(self):
+        """
+        Release resources held outside Python e.g. GPU buffers, called when the ECSSManager destroys the Component
+        """
+        pass
+    
+    def bindColumns(self, archetype, row):
+        """
+        Turn this Component's matrix attributes into views of an Archetype row, called by the ECSSManager storage
+
+        :param archetype: the Archetype that stores this Component
+        :type archetype: Archetype
+        :param row: the Archetype row of this Component's Entity
+        :type row: int
+        """
+        typeName = self.getClassName()
+        for attribute in self._columns:
+            setattr(self, "_" + attribute, archetype.column(typeName, attribute)[row])
+        self._archetype = archetype
+        self._row = row
+    
+    def unbindColumns(self):
+        """
+        Give back to this Component its own copy of its matrix attributes, when it leaves an Archetype row
+        """
+        for attribute in self._columns:
+            setattr(self, "_" + attribute, np.array(getattr(self, "_" + attribute)))
+        self._archetype = None
+        self._row = None
+    
     @classmethod
     def getClassName(cls):
         return cls.__name__
     
+    def getTypeNames(self) -> frozenset:
+        """
+        Get the class names this Component matches in a System's queryTypes: its class and all its base classes
+        """
+        cls = type(self)
+        names = _typeNames.get(cls)
+        if names is None:
+            names = _typeNames[cls] = frozenset(base.__name__ for base in cls.__mro__)
+        return names
+    
     @abstractmethod
     def init(self):
         """
@@ -178,6 +273,8 @@ class ComponentDecorator(Component):
     :rtype: [type]
     """
     
+    __slots__ = ("_component",)
+    
     def __init__(self, comp, name=None, type=None, id=None):
         super().__init__(name, type, id)
         self._component = comp
@@ -186,12 +283,19 @@ class ComponentDecorator(Component):
     def component(self):
         return self._component
     
+    def getTypeNames(self) -> frozenset:
+        """ a decorator also matches the queryTypes of the Component it wraps, as it passes Systems on to it """
+        return super().getTypeNames() | self._component.getTypeNames()
+    
     def init(self):
         self._component.init()
     
     def update(self, **kwargs):
         self._component.update(**kwargs)
     
+    def release(self):
+        self._component.release()
+    
     #def accept(self, system: pyglGA.ECSS.System):
        # we want the decorator first to accept the visitor and only if needed the wrappe to accept it too
        # each component decorator has to override this method
@@ -233,6 +337,10 @@ class BasicTransform(Component):
     :param Component: [description]
     :type Component: [type]
     """
+    
+    __slots__ = ("_trs", "_l2world", "_l2cam", "_dirty", "_camDirty")
+    
+    _columns = ("trs", "l2world", "l2cam")
    
     def __init__(self, name=None, type=None, id=None, trs=None):
         
@@ -247,6 +355,45 @@ class BasicTransform(Component):
         self._l2cam = util.identity()
         self._parent = self
         self._children = []
+        # l2world needs recalculation, set when trs changes or the BasicTransform is attached in a hierarchy
+        self._dirty = False
+        # l2cam needs recalculation, set when l2world changes
+        self._camDirty = True
+    
+    @property #dirty
+    def dirty(self) -> bool:
+        """ Get if Component's l2world needs to be recalculated """
+        return self._dirty
+    @dirty.setter
+    def dirty(self, value):
+        self._dirty = value
+    
+    @property #camDirty
+    def camDirty(self) -> bool:
+        """ Get if Component's l2cam needs to be recalculated """
+        return self._camDirty
+    @camDirty.setter
+    def camDirty(self, value):
+        self._camDirty = value
+    
+    def markDirty(self, spread=True):
+        """
+        Flag l2world for recalculation, and also the BasicTransforms of all the descendant Entities. 
+        If this BasicTransform was already flagged, so are its descendants and nothing more is done.
+        Note that in-place edits of the trs array (or the Archetype column) are not detected, call this instead.
+
+        :param spread: also flag the descendant BasicTransforms, defaults to True
+        :type spread: bool, optional
+        :return: True if newly flagged, False if it was already flagged
+        """
+        if self._dirty:
+            return False
+        self._dirty = True
+        if spread and self._parent is not self and self._parent is not None:
+            for node in self._parent._children:
+                if node is not self:
+                    node.markDirty()
+        return True
          
     @property #trs
     def trs(self):
@@ -254,7 +401,11 @@ class BasicTransform(Component):
         return self._trs
     @trs.setter
     def trs(self, value):
-        self._trs = value
+        if self._archetype is not None:
+            self._trs[...] = value #write through to the Archetype column
+        else:
+            self._trs = value
+        self.markDirty()
 
     @property #l2world
     def l2world(self):
@@ -262,7 +413,11 @@ class BasicTransform(Component):
         return self._l2world
     @l2world.setter
     def l2world(self, value):
-        self._l2world = value
+        if self._archetype is not None:
+            self._l2world[...] = value #write through to the Archetype column
+        else:
+            self._l2world = value
+        self._camDirty = True
         
     @property #l2cam
     def l2cam(self):
@@ -270,7 +425,10 @@ class BasicTransform(Component):
         return self._l2cam
     @l2cam.setter
     def l2cam(self, value):
-        self._l2cam = value                 
+        if self._archetype is not None:
+            self._l2cam[...] = value #write through to the Archetype column
+        else:
+            self._l2cam = value                 
     
     def update(self, **kwargs):
         """ Local 2 world transformation calculation
@@ -278,19 +436,19 @@ class BasicTransform(Component):
         
         Arguments could be "l2world=" or "trs=" or "l2cam=" to set respective matrices 
         """
-        print(self.getClassName(), ": update() called")
+        logger.debug("%s: update() called", self.getClassName())
         arg1 = "l2world"
         arg2 = "trs"
         arg3 = "l2cam"
         if arg1 in kwargs:
-            print("Setting: ", arg1," with: \n", kwargs[arg1])
-            self._l2world = kwargs[arg1]
+            logger.debug("Setting: %s with: \n%s", arg1, kwargs[arg1])
+            self.l2world = kwargs[arg1]
         if arg2 in kwargs:
-            print("Setting: ", arg2," with: \n", kwargs[arg2])
-            self._trs = kwargs[arg2]
+            logger.debug("Setting: %s with: \n%s", arg2, kwargs[arg2])
+            self.trs = kwargs[arg2]
         if arg3 in kwargs:
-            print("Setting: ", arg3," with: \n", kwargs[arg3])
-            self._l2cam = kwargs[arg3]
+            logger.debug("Setting: %s with: \n%s", arg3, kwargs[arg3])
+            self.l2cam = kwargs[arg3]
         
        
     def accept(self, system: pyglGA.ECSS.System, event = None):
@@ -332,46 +490,141 @@ class Camera(Component):
     
     Contains a basic Projection matrices (otrhographic or perspective)
     
+    The projection parameters (the ortho box or fovy/aspect/near/far) are kept, so that the projection matrix
+    and its inverse are cached and only rebuilt, on next use, when one of them changes e.g. the aspect on window resize.
+    
     :param Component: [description]
     :type Component: [type]
     """
    
-    def __init__(self, projMatrix=None, name=None, type=None, id=None, left=-100.0, right=100.0, bottom=-100.0, top=100.0, near=1.0, far=100.0):
+    __slots__ = ("_projMat", "_root2cam", "_projection", "_projParams", "_projDirty", "_invProjMat")
+    
+    _columns = ("projMat", "root2cam")
+    
+    def __init__(self, projMatrix=None, name=None, type=None, id=None, left=-100.0, right=100.0, bottom=-100.0, top=100.0, near=1.0, far=100.0, fovy=None, aspect=1.0):
         super().__init__(name, type, id)
         
+        self._invProjMat = None
+        self._projDirty = False
         if projMatrix is not None:
+            self._projection = None
+            self._projParams = {}
             self._projMat = projMatrix
         else:
-            self._projMat = util.ortho(left, right, bottom, top, near, far)
+            if fovy is not None:
+                self._projection = "perspective"
+                self._projParams = dict(fovy=fovy, aspect=aspect, near=near, far=far)
+            else:
+                self._projection = "ortho"
+                self._projParams = dict(left=left, right=right, bottom=bottom, top=top, near=near, far=far)
+            self._projMat = self._buildProjMat()
         self._root2cam = util.identity()
         self._parent = self
-         
+    
+    def _buildProjMat(self):
+        if self._projection == "perspective":
+            return util.perspective(**self._projParams)
+        return util.ortho(**self._projParams)
+    
+    def _writeProjMat(self, value):
+        if self._archetype is not None:
+            self._projMat[...] = value #write through to the Archetype column
+        else:
+            self._projMat = value
+        self._invProjMat = None
+    
+    def _setProjection(self, projection, params):
+        # only a real parameter change invalidates the cached matrices
+        if projection != self._projection or params != self._projParams:
+            self._projection = projection
+            self._projParams = params
+            self._projDirty = True
+    
     @property #projMat
     def projMat(self):
-        """ Get Component's camera Projection matrix """
+        """ Get Component's camera Projection matrix, rebuilt here if a projection parameter changed """
+        if self._projDirty:
+            self._projDirty = False
+            self._writeProjMat(self._buildProjMat())
         return self._projMat
     @projMat.setter
     def projMat(self, value):
-        self._projMat = value
+        self._projection = None
+        self._projParams = {}
+        self._projDirty = False
+        self._writeProjMat(value)
+    
+    @property #invProjMat
+    def invProjMat(self):
+        """ Get the cached inverse of the Projection matrix (in-place edits of projMat are not detected) """
+        projMat = self.projMat
+        if self._invProjMat is None:
+            self._invProjMat = util.inverse_affine(projMat)
+        return self._invProjMat
+    
+    @property #projection
+    def projection(self):
+        """ Get the projection type: "ortho", "perspective" or None for a projection matrix set directly """
+        return self._projection
+    
+    @property #projParams
+    def projParams(self) -> dict:
+        """ Get a copy of the projection parameters """
+        return dict(self._projParams)
+    
+    def setOrtho(self, left, right, bottom, top, near, far):
+        """
+        Use an orthographic projection, see util.ortho(). The matrix is rebuilt on next use only if a value changed
+        """
+        self._setProjection("ortho", dict(left=left, right=right, bottom=bottom, top=top, near=near, far=far))
+    
+    def setPerspective(self, fovy, aspect, near, far):
+        """
+        Use a perspective projection, see util.perspective(). The matrix is rebuilt on next use only if a value changed
+        """
+        self._setProjection("perspective", dict(fovy=fovy, aspect=aspect, near=near, far=far))
+    
+    @property #aspect
+    def aspect(self):
+        """ Get the width/height aspect ratio of the projection, None for a projection matrix set directly """
+        params = self._projParams
+        if self._projection == "perspective":
+            return params["aspect"]
+        if self._projection == "ortho":
+            return (params["right"] - params["left"]) / (params["top"] - params["bottom"])
+        return None
+    @aspect.setter
+    def aspect(self, value):
+        # e.g. on window resize, an ortho box keeps its height and centre
+        if self._projection == "perspective":
+            self._setProjection("perspective", dict(self._projParams, aspect=value))
+        elif self._projection == "ortho":
+            params = self._projParams
+            centre = (params["right"] + params["left"]) / 2.0
+            halfWidth = (params["top"] - params["bottom"]) * value / 2.0
+            self._setProjection("ortho", dict(params, left=centre - halfWidth, right=centre + halfWidth))
     
     @property #_root2cam
     def root2cam(self):
         """ Get Component's root to camera matrix """
         return self._root2cam
     @root2cam.setter
-    def orthoroot2camMat(self, value):
-        self._root2cam = value                   
+    def root2cam(self, value):
+        if self._archetype is not None:
+            self._root2cam[...] = value #write through to the Archetype column
+        else:
+            self._root2cam = value                   
     
     def update(self, **kwargs):
         """ Update Camera matrices
         
         Arguments could be "root2cam=" to set respective matrices 
         """
-        print(self.getClassName(), ": update() called")
+        logger.debug("%s: update() called", self.getClassName())
         arg1 = "root2cam"
         if arg1 in kwargs:
-            print("Setting: ", arg1," with: \n", kwargs[arg1])
-            self._root2cam = kwargs[arg1]
+            logger.debug("Setting: %s with: \n%s", arg1, kwargs[arg1])
+            self.root2cam = kwargs[arg1]
        
        
     def accept(self, system: pyglGA.ECSS.System, event = None):
@@ -411,6 +664,8 @@ class RenderMesh(Component):
 
     Accepts a dedicated RenderSystem to initiate rendering of the RenderMesh, using its vertex attributes (property)
     """
+    __slots__ = ("_vertex_attributes", "_vertex_index")
+    
     def __init__(self, name=None, type=None, id=None, vertex_attributes=None, vertex_index=None):
         """ Initialize the generic RenderMesh component with the vertex attribute arrays
         this is the generic place to store all vertex attributes (vertices, colors, normals, bone weights etc.)
@@ -449,7 +704,7 @@ class RenderMesh(Component):
         self._vertex_index = value
         
     def update(self):
-        print(self.getClassName(), ": update() called")
+        logger.debug("%s: update() called", self.getClassName())
    
    
     def accept(self, system: pyglGA.ECSS.System, event = None):
@@ -493,6 +748,8 @@ class BasicTransformDecorator(ComponentDecorator):
     :param ComponentDecorator: [description]
     :type ComponentDecorator: [type]
     """
+    __slots__ = ()
+    
     def init(self):
         """
         example of a decorator
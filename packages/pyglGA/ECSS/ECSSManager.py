@@ -9,42 +9,56 @@ glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
-from typing import List, Dict
+from typing import List, Dict, Set
 import pprint
 import time
+import logging
+import numbers
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from pyglGA.ECSS.Entity import Entity
+from pyglGA.ECSS.Archetype import Archetype, ArchetypeStorage
+from pyglGA.ECSS.Handle import HandleTable
 import pyglGA.ECSS.Component
 import pyglGA.ECSS.System
 import pyglGA.ECSS.utilities as util
 import pyglGA.ECSS.Event 
 
+logger = logging.getLogger(__name__)
+
 class ECSSManager():
     """
-    Singleton Manager class to provide factory creation methods for
+    Manager class to provide factory creation methods for
     all Entities, Components, Systems, as an alternative way and hide the scenegraph complexity.
+    
+    Each ECSSManager is an independent world with its own scenegraph, storage, EventManager and scheduler,
+    so that several worlds can run in one process (e.g. one per thread).
+    
+    The world is also the subscriber of the built-in OnUpdateTRS Event, see updateTRS(), so that UI and network 
+    sources move Entities through the EventManager queue.
+    
+    The world dtype is the precision policy of all its matrix data (BasicTransform trs, l2world, l2cam and 
+    Camera projMat, root2cam), float32 by default so that it can be sent to OpenGL without per-frame conversions.
 
     """
-    _instance = None
-
-    def __new__(cls):
-        """
-        Special singleton class method, returns single instance of ECSSManager
-
-        :return: single class instance
-        :rtype: ECSSManagger
-        """
-        if cls._instance is None:
-            print('Creating Scene Singleton Object')
-            cls._instance = super(ECSSManager, cls).__new__(cls)
-            # add further init here
-        return cls._instance
 
-    def __init__(self):
+    def __init__(self, dtype=np.float32):
         """
         Construct initial data structures for scenegraph elements
+
+        :param dtype: element type of all the world's matrices, defaults to np.float32
+        :type dtype: numpy dtype, optional
         """
+        self._dtype = np.dtype(dtype)
         self._systems: List[pyglGA.ECSS.System.System] = []  # list for all systems
+        # list of systems run every frame by tick(), in registration order
+        self._scheduledSystems: List[pyglGA.ECSS.System.System] = []
+        self._executor = None # thread pool of tick(), created on first concurrent stage
+        self._maxWorkers = None
+        self._dt = 0.0 # time step of the last tick()
+        self._time = 0.0 # sum of all tick() time steps
         # list with all scenegraph components
         self._components: List[pyglGA.ECSS.Component.Component] = []
         self._entities: List[Entity] = []  # list of all scenegraph entities
@@ -52,8 +66,25 @@ class ECSSManager():
         self._cameras: List[pyglGA.ECSS.Component.Component] = []
         # dict with keys entities and values list of components per entity
         self._entities_components = {}
+        # dict with keys entities and values dict of component type name -> component, for O(1) lookups
+        self._entities_types: Dict[Entity, Dict[str, pyglGA.ECSS.Component.Component]] = {}
+        # dict with keys component type names and values the set of entities that have such a component
+        self._types_entities: Dict[str, Set[Entity]] = {}
         # the ECSSManager creates one main EventManager for the whole world
         self._eventManager = pyglGA.ECSS.Event.EventManager()
+        # built-in OnUpdateTRS route: this world accept()s a TransformSystem that writes the new trs
+        self._eventManager.getPool(pyglGA.ECSS.Event.TRSEvent, dtype=self._dtype)
+        self._trsActuator = pyglGA.ECSS.System.TransformSystem("OnUpdateTRS")
+        updateTRS = pyglGA.ECSS.Event.TRSEvent(self._dtype)
+        self._eventManager.subscribe(updateTRS, self)
+        self._eventManager.actuate(updateTRS, self._trsActuator)
+        # columnar storage: Entities with the same Component types share one Archetype table
+        self._storage = ArchetypeStorage(self._dtype)
+        # generational handle -> Entity/Component table
+        self._handles = HandleTable()
+        # dict with keys (start entity, component type names) and values (hierarchy structure version, 
+        # flattened pre-order descendants), see getTraversalOrder()
+        self._traversalOrders: Dict[tuple, tuple] = {}
         self._root = None
 
     # define properties
@@ -91,6 +122,103 @@ class ECSSManager():
     def entities_components(self) -> Dict:
         return self._entities_components
     
+    @property # Component type per Entity getter
+    def entities_types(self) -> Dict:
+        return self._entities_types
+    
+    @property # Entities per Component type getter
+    def types_entities(self) -> Dict:
+        return self._types_entities
+    
+    def getComponent(self, entity: Entity, typeName: str):
+        """
+        Get in O(1) the Component of a specific type (class name) of an Entity, or None
+
+        :param entity: the Entity to look into
+        :type entity: Entity
+        :param typeName: Component class name e.g. "BasicTransform"
+        :type typeName: str
+        """
+        components = self._entities_types.get(entity)
+        if components is None:
+            return None
+        return components.get(typeName)
+    
+    def getEntitiesByType(self, typeName: str) -> Set[Entity]:
+        """
+        Get in O(1) the set of Entities that have a Component of a specific type (class name)
+
+        :param typeName: Component class name e.g. "Camera"
+        :type typeName: str
+        """
+        return self._types_entities.get(typeName, set())
+    
+    @property # time step of the last tick() getter
+    def dt(self) -> float:
+        return self._dt
+    
+    @property # total time of all tick() calls getter
+    def time(self) -> float:
+        return self._time
+    
+    @property # Systems run by tick() getter
+    def scheduledSystems(self) -> List[pyglGA.ECSS.System.System]:
+        return self._scheduledSystems
+    
+    @property # generational handle table getter
+    def handles(self) -> HandleTable:
+        return self._handles
+    
+    def resolve(self, handle: int):
+        """
+        Get in O(1) the Entity or Component of a generational handle, see Component.handle
+
+        :param handle: the handle
+        :type handle: int
+        :return: the Entity or Component, or None if it was destroyed (stale handle)
+        """
+        return self._handles.resolve(handle)
+    
+    def isAlive(self, handle: int) -> bool:
+        """
+        Check if a generational handle refers to a live Entity or Component
+
+        :param handle: the handle
+        :type handle: int
+        """
+        return self._handles.isAlive(handle)
+    
+    def _createHandle(self, obj):
+        if self._handles.resolve(obj.handle) is not obj:
+            obj.handle = self._handles.create(obj)
+    
+    def _destroyHandle(self, obj):
+        if self._handles.resolve(obj.handle) is obj:
+            self._handles.destroy(obj.handle)
+        obj.handle = None
+    
+    @property # matrix precision getter
+    def dtype(self) -> np.dtype:
+        return self._dtype
+    
+    @property # Archetype columnar storage getter
+    def storage(self) -> ArchetypeStorage:
+        return self._storage
+    
+    def query(self, *typeNames: str) -> List[Archetype]:
+        """
+        Get the Archetypes of all Entities that have at least the given Component types, 
+        e.g. query("BasicTransform") to access all trs, l2world, l2cam matrices as (N,4,4) arrays via
+        Archetype.column("BasicTransform", "l2world"). Write them with Archetype.write(), or call 
+        Archetype.markDirty() after writing to a column, so that the Systems recalculate what depends on them
+
+        :param typeNames: Component class names
+        :type typeNames: str
+        :return: list of matching Archetypes
+        :rtype: List[Archetype]
+        """
+        return self._storage.query(*typeNames)
+    
 
     def createEntity(self, entity: Entity):
         """
@@ -105,6 +233,10 @@ class ECSSManager():
             # add an empty list for components with the new Entity
             self._entities.append(entity)
             self._entities_components[entity] = [None]
+            self._entities_types[entity] = {}
+            self._storage.addEntity(entity)
+            self._createHandle(entity)
+            entity.worldManager = self
 
             # @@@GPTODO: refactor so that only first entity is set to root
             # now it is hardcoded with the name root 
@@ -118,15 +250,208 @@ class ECSSManager():
         return entity
         # we return that created Entity in case it is needed
 
-    def createSystem(self, system: pyglGA.ECSS.System.System):
+    def createEntities(self, parents, names=None, trs=None, parent: Entity = None) -> List[Entity]:
+        """
+        Creates a whole subtree or crowd of Entities in one call, optionally each with a BasicTransform.
+
+        Skips the per object checks and lookups of createEntity(), addEntityChild() and addComponent(), 
+        and sizes the BasicTransform Archetype columns once for all new Entities.
+
+        :param parents: for each new Entity, the index of its parent among the new Entities (lower than its own), 
+            or -1 to attach it to parent
+        :type parents: List[int] or numpy.array
+        :param names: names of the new Entities, defaults to None for the default Entity name
+        :type names: List[str], optional
+        :param trs: (N,4,4) initial trs matrices, defaults to None for no BasicTransforms
+        :type trs: numpy.array, optional
+        :param parent: Entity to attach the new top level Entities to, defaults to None for the root
+        :type parent: Entity, optional
+        :return: the new Entities
+        :rtype: List[Entity]
+        """
+        parent = self._root if parent is None else parent
+        if not isinstance(parent, Entity):
+            raise Exception("createEntities(): no parent Entity and no root node")
+        parents = np.asarray(parents, dtype=np.intp)
+        count = len(parents)
+        if np.any(parents >= np.arange(count)):
+            raise ValueError("createEntities(): each parent index should be -1 or of a previous entity")
+        if names is not None and len(names) != count:
+            raise ValueError("createEntities(): names and parents differ in length")
+        if trs is not None:
+            trs = np.asarray(trs)
+            if trs.shape != (count, 4, 4):
+                raise ValueError("createEntities(): trs should be an (N,4,4) array")
+            # pre-size the columns of all new rows at once instead of doubling per append
+            archetype = self._storage.getArchetype(frozenset(("BasicTransform",)))
+            archetype.reserve(len(archetype) + count)
+            transforms = self._types_entities.setdefault("BasicTransform", set())
+        
+        entities: List[Entity] = []
+        for i in range(count):
+            entity = Entity(name=None if names is None else names[i])
+            entityParent = parent if parents[i] < 0 else entities[parents[i]]
+            components = {}
+            if trs is None:
+                self._entities_components[entity] = [None]
+            else:
+                transform = pyglGA.ECSS.Component.BasicTransform(trs=trs[i].copy())
+                entity.add(transform)
+                components["BasicTransform"] = transform
+                self._components.append(transform)
+                self._entities_components[entity] = [transform]
+                transforms.add(entity)
+            self._entities_types[entity] = dict(components)
+            self._storage.addEntity(entity, components)
+            entity.handle = self._handles.create(entity)
+            entity.worldManager = self
+            if trs is not None:
+                transform.handle = self._handles.create(transform)
+                transform.worldManager = self
+            self._entities.append(entity)
+            
+            entityParent.add(entity)
+            siblings = self._entities_components.get(entityParent)
+            if siblings is not None:
+                if siblings[0] is None:
+                    siblings[0] = entity
+                else:
+                    siblings.append(entity)
+            entities.append(entity)
+        return entities
+
+    def createSystem(self, system: pyglGA.ECSS.System.System, scheduled=False):
         """
         Creates a System and adds it in the ECSS data structures
 
+        :param system: the System to add
+        :type system: System
+        :param scheduled: run the System on every tick(), defaults to False for Systems that are 
+            traversed explicitly e.g. once-off GL initialisation or rendering within the GL context
+        :type scheduled: bool, optional
         """
         if isinstance(system, pyglGA.ECSS.System.System):
             self._systems.append(system)
+            if scheduled:
+                self._scheduledSystems.append(system)
 
         return system
+    
+    def getSchedule(self) -> List[List[pyglGA.ECSS.System.System]]:
+        """
+        Get the scheduled Systems grouped in stages that run one after the other. 
+        
+        Systems are ordered by priority (lower first), then by registration order. Each System is placed 
+        in the first stage after all the previous Systems it conflicts with (see System.conflicts()), 
+        so the Systems of one stage can run concurrently.
+
+        :return: list of stages, each a list of Systems
+        :rtype: List[List[System]]
+        """
+        ordered = sorted(enumerate(self._scheduledSystems), key=lambda item: (item[1].priority, item[0]))
+        stages: List[List[pyglGA.ECSS.System.System]] = []
+        placed = []
+        for index, system in ordered:
+            stage = 0
+            for other, otherStage in placed:
+                if otherStage >= stage and system.conflicts(other):
+                    stage = otherStage + 1
+            if stage == len(stages):
+                stages.append([])
+            stages[stage].append(system)
+            placed.append((system, stage))
+        return stages
+    
+    def accept(self, system: pyglGA.ECSS.System.System, event = None):
+        """
+        Accepts a System as an EventManager subscriber, based on the Visitor pattern
+
+        :param system: [a System object]
+        :type system: [System]
+        """
+        system.apply2ECSSManager(self, event)
+    
+    def getBasicTransform(self, target):
+        """
+        Get the BasicTransform of an Entity, a BasicTransform itself, or the one of a handle of either
+
+        :param target: Entity, BasicTransform or a handle of either, also a numpy integer read from an array
+        :return: the BasicTransform, or None if there is none (e.g. a stale handle)
+        """
+        if isinstance(target, numbers.Integral):
+            target = self.resolve(int(target))
+        if target is None or isinstance(target, pyglGA.ECSS.Component.BasicTransform):
+            return target
+        return self.getComponent(target, "BasicTransform")
+    
+    def updateTRS(self, target, trs, sender=None) -> bool:
+        """
+        Post a new local transform for an Entity, written by the next tick() (or Scene.render()) before the 
+        Systems run. Updates of the same BasicTransform within a frame are coalesced into one write, whichever 
+        form of target they use, and only its subtree is recalculated by the TransformSystem. 
+        From other threads, post a TRSEvent of eventManager.getPool(TRSEvent) with EventManager.postThreadsafe() 
+        instead, keyed by the BasicTransform too.
+
+        :param target: Entity, its BasicTransform or a handle of either
+        :param trs: the new trs
+        :type trs: (4,4) array_like
+        :param sender: [the object sending the event], defaults to None for this world
+        :return: False if the update was dropped because the EventManager queue is full or target has no BasicTransform
+        :rtype: bool
+        """
+        basicTransform = self.getBasicTransform(target)
+        if basicTransform is None:
+            return False
+        event = self._eventManager.getPool(pyglGA.ECSS.Event.TRSEvent).acquire().set(basicTransform, trs)
+        return self._eventManager.post(self if sender is None else sender, event, key=basicTransform)
+    
+    def tick(self, dt: float = 0.0, entity: Entity = None, maxWorkers: int = None):
+        """
+        Run all scheduled Systems once, e.g. once per frame instead of separate traverse_visit() calls.
+        
+        Stages of getSchedule() run in order. Within a stage, thread safe Systems run concurrently on a 
+        thread pool (numpy releases the GIL during the matrix batches), the rest run on the calling thread.
+        The Events posted to the EventManager since the last tick are dispatched first, see EventManager.drain().
+
+        :param dt: time step since the last tick, defaults to 0.0
+        :type dt: float, optional
+        :param entity: start Entity of the traversals, defaults to None for the root
+        :type entity: Entity, optional
+        :param maxWorkers: thread pool size, defaults to None for the ThreadPoolExecutor default
+        :type maxWorkers: int, optional
+        """
+        if entity is None:
+            entity = self._root
+        self._dt = dt
+        self._time += dt
+        self._eventManager.drain()
+        for stage in self.getSchedule():
+            threaded = [system for system in stage if system.threadSafe]
+            if len(threaded) < 2:
+                for system in stage:
+                    self.traverse_visit(system, entity)
+                continue
+            # build the cached traversal orders here, not concurrently in the workers
+            for system in threaded:
+                self.getTraversalOrder(entity, system.queryTypes)
+            if self._executor is None or self._maxWorkers != maxWorkers:
+                self.shutdown()
+                self._executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="ECSSManager")
+                self._maxWorkers = maxWorkers
+            futures = [self._executor.submit(self.traverse_visit, system, entity) for system in threaded]
+            for system in stage:
+                if not system.threadSafe:
+                    self.traverse_visit(system, entity)
+            for future in futures:
+                future.result()
+    
+    def shutdown(self):
+        """
+        Release the thread pool of tick()
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def createIterator(self, entity: Entity, dfs=True):
         """
@@ -141,6 +466,55 @@ class ECSSManager():
         else:
             raise RuntimeError
 
+    def getTraversalOrder(self, entity: Entity, typeNames=None) -> List[pyglGA.ECSS.Component.Component]:
+        """
+        Get the cached depth-first pre-order list of all descendant Entities and Components of an Entity.
+        The cache is rebuilt only after a structural change of the hierarchy of entity (Entity add() / remove()).
+
+        :param entity: start Entity of the traversal
+        :type entity: Entity
+        :param typeNames: only keep Components of these class names, or of subclasses or decorators of them 
+            (e.g. a System's queryTypes), defaults to None for all
+        :type typeNames: Iterable[str], optional
+        :return: flattened traversal order, the same as the EntityDfsIterator without None markers
+        :rtype: List[Component]
+        """
+        if not isinstance(entity, Entity):
+            raise RuntimeError
+        version = entity.getStructureVersion()
+        key = (entity, None if typeNames is None else frozenset(typeNames))
+        cached = self._traversalOrders.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        if typeNames is None:
+            order = entity.flatten()
+        else:
+            order = [comp for comp in self.getTraversalOrder(entity) if not key[1].isdisjoint(comp.getTypeNames())]
+        # the version read before flattening, so that a concurrent change makes the next call rebuild
+        self._traversalOrders[key] = (version, order)
+        return order
+    
+    def queryComponents(self, entity: Entity, *typeNames: str, grouped=False):
+        """
+        Get the Components of specific class names under an Entity, in traversal order
+
+        :param entity: start Entity of the traversal
+        :type entity: Entity
+        :param typeNames: Component class names e.g. "VertexArray", subclasses and decorators match too
+        :type typeNames: str
+        :param grouped: group the Components by their parent Entity, defaults to False
+        :type grouped: bool, optional
+        :return: list of Components, or dict of parent Entity -> list of Components if grouped
+        :rtype: List[Component] or Dict[Entity, List[Component]]
+        """
+        order = self.getTraversalOrder(entity, typeNames)
+        if not grouped:
+            return order
+        groups: Dict[Entity, List[pyglGA.ECSS.Component.Component]] = {}
+        for comp in order:
+            groups.setdefault(comp.parent, []).append(comp)
+        return groups
+
     def addComponent(self, entity: Entity, component: pyglGA.ECSS.Component.Component):
         """
         Adds a component to an Entity in a scenegraph and in the ECSS data structures
@@ -159,43 +533,54 @@ class ECSSManager():
         :type component: Component
         """
         if isinstance(entity, Entity) and isinstance(component, pyglGA.ECSS.Component.Component):
+            if isinstance(component, Entity):
+                # Entities are children and not Components of an Entity
+                self.addEntityChild(entity, component)
+                return component
+            
+            components = self._entities_components.get(entity)
+            typeName = component.getClassName()
+            previous = None
+            if components is not None:
+                previous = self._entities_types[entity].get(typeName)
+                if previous is component:
+                    return component
+            
             if isinstance(component, pyglGA.ECSS.Component.Camera):
                 self._cameras.append(component)
             else:  # add the component in the _components []
                 self._components.append(component)
-
-            # loop through all dictionary elements of _entities_components
-            for key, value in self._entities_components.items():
-                if key is entity:  # find key [entity]
-                    # el are Components (but can also be Entities)
-                    for index, el in enumerate(value):
-                        # check if the value list() of that entity has already that component type
-                        # we only add Components here and not Entities
-                        if isinstance(el, type(component)) and not isinstance(el, Entity):
-                            # if it has it, replace previous component with same type
-                            # bur first remove previous from scenegraph and add new one
-                            # remove it from scenegraph Entity's children list
-                            key.remove(el)
-                            # remove previous component from _entities_components list
-                            value.remove(el)
-                            # remove component from ECSSManager _components list
-                            self._components.remove(el)
-                            # insert new component at same index
-                            value.insert(index, component)
-                            # add it in the scenegraph as child of the Entity
-                            key.add(component)
-                        else:  # otherwise add it in ECSSManager and in Scenegraph
-                            key.add(component)
-                            # check if there is a list of components and add it there otherwise create one
-                            if isinstance(value, list):
-                                # check if first element is None
-                                if (value[0] == None):
-                                    value[0] = component
-                                elif component not in value:
-                                    value.append(component)
-                            else:
-                                value = list(component)
-                            return component
+            self._createHandle(component)
+            component.worldManager = self
+            
+            if components is None:
+                return component
+            
+            if previous is not None:
+                # the Entity has already that component type: replace previous component with new one
+                # remove it from scenegraph Entity's children list
+                entity.remove(previous)
+                # insert new component at same index in _entities_components list
+                components[components.index(previous)] = component
+                # remove previous component from ECSSManager _components or _cameras list
+                if previous in self._components:
+                    self._components.remove(previous)
+                elif previous in self._cameras:
+                    self._cameras.remove(previous)
+                self._destroyHandle(previous)
+            else:
+                # check if first element is None
+                if components[0] is None:
+                    components[0] = component
+                else:
+                    components.append(component)
+                self._types_entities.setdefault(typeName, set()).add(entity)
+            
+            self._entities_types[entity][typeName] = component
+            # add it in the scenegraph as child of the Entity
+            entity.add(component)
+            # add (or replace) the component in the Entity's Archetype row
+            self._storage.addComponent(entity, component)
             return component
 
     def addEntityChild(self, entity_parent: Entity, entity_child: Entity):
@@ -217,16 +602,72 @@ class ECSSManager():
                 # if not, create one
                 entity_parent.add(entity_child)
             # add entity_child in the _entities_components dictionary
-            # loop through all dictionary elements of _entities_components
-            for key, value in self._entities_components.items():
-                if key is entity_parent:  # find key [entity]
-                    if (value[0] == None):
-                        # replace None with the entity_child
-                        value[0] = entity_child
-                    else:
-                        # just add entity_child in the children's components list
-                        value.append(entity_child)
+            value = self._entities_components.get(entity_parent)
+            if value is not None:
+                if (value[0] == None):
+                    # replace None with the entity_child
+                    value[0] = entity_child
+                elif entity_child not in value:
+                    # just add entity_child in the children's components list
+                    value.append(entity_child)
+
+    def destroyEntity(self, entity: Entity, recursive=True):
+        """
+        Destroys an Entity and its Components: unlinks it from the scenegraph, removes it from all 
+        ECSSManager data structures and its Archetype row, releases the Components' GPU resources 
+        and returns their ids for reuse. Destroying an Entity that is not (or no longer) in this world does nothing.
 
+        :param entity: Entity to destroy
+        :type entity: Entity
+        :param recursive: destroy also all descendant Entities, defaults to True. 
+            If False, the child Entities are attached to the parent of the destroyed Entity
+        :type recursive: bool, optional
+        """
+        if not isinstance(entity, Entity) or entity not in self._entities_components:
+            return
+        parent = entity.getParent()
+        if recursive:
+            destroyed = [entity] + [node for node in entity.flatten() if isinstance(node, Entity)]
+        else:
+            destroyed = [entity]
+            for child in [node for node in entity._children if isinstance(node, Entity)]:
+                entity.remove(child)
+                if parent is not None:
+                    self.addEntityChild(parent, child)
+        
+        if parent is not None:
+            parent.remove(entity)
+            siblings = self._entities_components.get(parent)
+            if siblings is not None and entity in siblings:
+                siblings.remove(entity)
+                if not siblings:
+                    siblings.append(None)
+        
+        destroyedComponents = set()
+        for node in destroyed:
+            for comp in [comp for comp in node._children if not isinstance(comp, Entity)]:
+                comp.release()
+                destroyedComponents.add(comp)
+                pyglGA.ECSS.Component.releaseId(comp.id)
+                self._destroyHandle(comp)
+                node.remove(comp)
+            for typeName in self._entities_types.pop(node, {}):
+                self._types_entities[typeName].discard(node)
+            self._entities_components.pop(node, None)
+            if self._storage.location(node) is not None:
+                self._storage.removeEntity(node)
+            pyglGA.ECSS.Component.releaseId(node.id)
+            self._destroyHandle(node)
+            if node is self._root:
+                self._root = None
+        
+        # compact the ECSSManager lists in one pass
+        destroyedEntities = set(destroyed)
+        self._entities = [node for node in self._entities if node not in destroyedEntities]
+        self._traversalOrders = {key: cached for key, cached in self._traversalOrders.items() if key[0] not in destroyedEntities}
+        if destroyedComponents:
+            self._components = [comp for comp in self._components if comp not in destroyedComponents]
+            self._cameras = [cam for cam in self._cameras if cam not in destroyedComponents]
     
     def traverse_visit_pre_camera(self, camUpdate: pyglGA.ECSS.System, camera: pyglGA.ECSS.Component.Camera):
         """
@@ -244,40 +685,42 @@ class ECSSManager():
         Traverse whole scenegraph by iterating every Entity/Component and calling 
         a specific System on each different element.   
 
+        The traversal order is the cached, flattened depth-first order of getTraversalOrder(), 
+        filtered to the Component types the System declares in its queryTypes.
+
         :param system: [description]
         :type system: System.System
-        :param iterator: [description]
-        :type iterator: Iterator
+        :param entity: start Entity of the traversal
+        :type entity: Entity
         """
 
-        iterator = None
+        traversal = None
         try:
             if dfs:
-                iterator = self.createIterator(entity)
+                traversal = self.getTraversalOrder(entity, system.queryTypes)
         except RuntimeError:
-            print("ECSSManager::traverse_visit() Could Not Create Iterator")
-
-        if isinstance(system, pyglGA.ECSS.System.System) and iterator is not None:
-            tic1 = time.perf_counter()
-            print(f"\nthis is the {system.name} traversal START".center(100, '-'))
-            done_traversing = False
-            while(not done_traversing):
-                try:
-                    traversedComp = next(iterator)
-                except StopIteration:
-                    print("\n--- end of Scene reached, traversed all Components!---")
-                    done_traversing = True
-                else:
-                    # only if we reached end of Entity's children traversedComp is None
-                    if (traversedComp is not None):
-                        #print(traversedComp)
-                        # accept a visitor System for each Component that can accept it
-                        # calls specific concrete Visitor's apply2Component(), which calls specific concrete Component's methods
-                        traversedComp.accept(system)
-
-            toc1 = time.perf_counter()
-            print(
-                f"\n{system.name} traversal took {(toc1 - tic1)*1000:0.4f} msecs".center(100, '-'))
+            logger.error("ECSSManager::traverse_visit() Could Not Create Iterator")
+
+        if isinstance(system, pyglGA.ECSS.System.System) and traversal is not None:
+            # timing only when debugging, no per frame cost otherwise
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                tic1 = time.perf_counter()
+                logger.debug("this is the %s traversal START", system.name)
+            system.startTraversal(entity)
+            # batched Systems process the whole hierarchy at once, e.g. l2world per depth level
+            if system.batched:
+                system.apply2Hierarchy(entity)
+            else:
+                # accept a visitor System for each Component that can accept it
+                # calls specific concrete Visitor's apply2Component(), which calls specific concrete Component's methods
+                for traversedComp in traversal:
+                    traversedComp.accept(system)
+                logger.debug("--- end of Scene reached, traversed all Components!---")
+
+            if debug:
+                toc1 = time.perf_counter()
+                logger.debug("%s traversal took %0.4f msecs", system.name, (toc1 - tic1)*1000)
 
     def print(self):
         """
@@ -311,7 +754,7 @@ if __name__ == "__main__":
     s1 = ECSSManager()
     s2 = ECSSManager()
 
-    if id(s1) == id(s2):
-        print("Singleton works, both variables contain the same instance.")
+    if s1.eventManager is not s2.eventManager:
+        print("Both variables contain independent worlds.")
     else:
-        print("Singleton failed, variables contain different instances.")
+        print("Worlds failed, variables share their state.")
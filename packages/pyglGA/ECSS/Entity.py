@@ -10,12 +10,15 @@ The Entity class is the based aggregation of Components in the glGA ECS.
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
-from typing import Any, List
-import uuid
+from typing import Any, List, Dict
+import itertools
 
 from pyglGA.ECSS.Component import Component, ComponentIterator
 from pyglGA.ECSS.System import System
 
+# source of structure versions: each next() is atomic and never repeats, so concurrent bumps cannot be lost
+_structureVersions = itertools.count(1)
+
 
 
 class EntityDfsIterator(Iterator, ComponentIterator):
@@ -68,6 +71,8 @@ class Entity(Component):
     It is an actual data aggregator container of Components. All the actuall operations and logic is performed by 
     Systems and not the Components or Entity itself.
     """
+    
+    __slots__ = ("_childrenByType", "_structureVersion")
 
     def __init__(self, name=None, type=None, id=None) -> None:
         """
@@ -78,7 +83,11 @@ class Entity(Component):
         super().__init__(name, type, id)
         
         self._children: List[Component]=[]
+        # type -> first child of that type, maintained by add() and remove() for O(1) getChildByType()
+        self._childrenByType: Dict[str, Component] = {}
         self._parent = None
+        # renewed on every add() / remove() in the hierarchy while this Entity is its root, see getStructureVersion()
+        self._structureVersion = next(_structureVersions)
         
     
     def print(self):
@@ -104,10 +113,32 @@ class Entity(Component):
     def add(self, object: Component) ->None:
         self._children.append(object)
         object._parent = self
+        self.getRoot()._structureVersion = next(_structureVersions)
+        if object.type not in self._childrenByType:
+            self._childrenByType[object.type] = object
+        # the new child (and for a BasicTransform, its new siblings' subtrees) need l2world recalculation
+        if isinstance(object, Entity):
+            object.markDirty()
+        elif object.markDirty() is False:
+            # an already flagged BasicTransform does not spread by itself
+            for node in self._children:
+                if isinstance(node, Entity):
+                    node.markDirty()
 
     def remove(self, object: Component) ->None:
         self._children.remove(object)
         object._parent = None
+        self.getRoot()._structureVersion = next(_structureVersions)
+        if isinstance(object, Entity):
+            # the removed subtree is a hierarchy of its own now
+            object._structureVersion = next(_structureVersions)
+        if self._childrenByType.get(object.type) is object:
+            # promote the next child of the same type, if any
+            del self._childrenByType[object.type]
+            for node in self._children:
+                if node.type == object.type:
+                    self._childrenByType[node.type] = node
+                    break
         
     def getChild(self, index) ->Component:
         if index < len(self._children):
@@ -116,11 +147,53 @@ class Entity(Component):
             return None
     
     def getChildByType(self, type) ->Component:
+        return self._childrenByType.get(type)
+    
+    def markDirty(self, spread=True):
+        """
+        Flag the BasicTransforms of this Entity and of all its descendants for l2world recalculation.
+        Stops at Entities whose BasicTransform was already flagged, as their descendants are flagged too.
+        """
         for node in self._children:
-            if node.type == type:
-                return node
+            if not isinstance(node, Entity) and node.markDirty(spread=False) is False:
+                return None
+        if spread:
+            for node in self._children:
+                if isinstance(node, Entity):
+                    node.markDirty()
         return None
     
+    def getRoot(self) -> Entity:
+        """ Get the top Entity of the hierarchy this Entity belongs to """
+        node = self
+        while node._parent is not None:
+            node = node._parent
+        return node
+    
+    def getStructureVersion(self) -> int:
+        """
+        Get a version of the hierarchy this Entity belongs to, which changes whenever a child is added to or 
+        removed from any of its Entities, and only then: other hierarchies (e.g. of other worlds) do not affect it
+        """
+        return self.getRoot()._structureVersion
+    
+    def flatten(self) -> List[Component]:
+        """
+        Get all descendant Entities and Components of this Entity in depth-first pre-order, 
+        i.e. in the same order as the EntityDfsIterator but without its None end-of-children markers.
+        """
+        order = []
+        stack = [iter(self._children)]
+        while stack:
+            for node in stack[-1]:
+                order.append(node)
+                if isinstance(node, Entity):
+                    stack.append(iter(node._children))
+                    break
+            else:
+                stack.pop()
+        return order
+    
     def getParent(self) ->Component:
             return self._parent
     
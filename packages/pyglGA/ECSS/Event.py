@@ -12,6 +12,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 from dataclasses import dataclass
+from collections import deque
+import copy
+import itertools
+import logging
 
 import numpy as np
 
@@ -20,14 +24,151 @@ import pyglGA.ECSS.utilities as util
 #from pyglGA.ECSS.Component import BasicTransform, Camera, Component
 #from pyglGA.ECSS.System import System, TransformSystem, CameraSystem, RenderSystem
 
+logger = logging.getLogger(__name__)
+
+BUILTIN_IDS = 1 << 20 # Event ids from here on are reserved for the Events built into pyglGA, e.g. TRSEvent
+
 
 @dataclass
 class Event:
     """A simple dataclass that encapsulates an Event
+    
+    Slotted, so that Events are small and have no per instance __dict__. High frequency Events 
+    (per frame transforms, mouse motion) use the typed PooledEvent subclasses below instead of a generic value.
     """
+    __slots__ = ("name", "id", "value")
     name: str
     id: Any
     value: Any
+    
+    def copy(self) -> Event:
+        """ 
+        Copy of the Event, as queued by EventManager.post(). A numpy array value is copied too, any other value 
+        (e.g. an Entity, a list or a dict) is shared with the original: post a new value object instead of 
+        changing a posted one in place.
+        """
+        event = copy.copy(self)
+        if isinstance(self.value, np.ndarray):
+            event.value = self.value.copy()
+        return event
+
+
+class PooledEvent(Event):
+    """
+    Base class of typed Events with structured payload fields, recycled through an EventPool:
+    
+        event = eventManager.getPool(TRSEvent).acquire().set(entity, trs)
+        eventManager.post(sender, event, key=entity)
+    
+    A pooled Event posted to the EventManager is not copied: the EventManager owns it and releases it back 
+    to its pool after dispatch (or when it is coalesced or dropped), so steady state posting allocates nothing.
+    Subclasses define NAME and ID, their payload __slots__ and a set() method that fills the payload in place.
+    """
+    __slots__ = ("pool",)
+    NAME = None
+    ID = None
+    
+    def __init__(self):
+        super().__init__(type(self).NAME, type(self).ID, None)
+        self.pool = None # the EventPool that owns the Event while it is acquired
+    
+    def copy(self) -> PooledEvent:
+        event = copy.copy(self)
+        event.pool = None
+        return event
+
+
+class TRSEvent(PooledEvent):
+    """
+    OnUpdateTRS with the target Entity and its new 4x4 local transform. 
+    The trs array is allocated once per Event and set() copies into it, so the queued value cannot change 
+    after posting even if the publisher reuses its own matrix.
+    """
+    __slots__ = ("entity", "trs")
+    NAME = "OnUpdateTRS"
+    ID = BUILTIN_IDS
+    
+    def __init__(self, dtype=np.float32):
+        super().__init__()
+        self.entity = None
+        self.trs = util.identity(4, dtype)
+    
+    def set(self, entity, trs) -> TRSEvent:
+        """
+        :param entity: the Entity (or its BasicTransform) to update
+        :param trs: the new local transform
+        :type trs: (4,4) array_like
+        :return: self
+        """
+        self.entity = entity
+        self.trs[...] = trs
+        return self
+    
+    def copy(self) -> TRSEvent:
+        event = super().copy()
+        event.trs = self.trs.copy()
+        return event
+
+
+class MouseMotionEvent(PooledEvent):
+    """ OnMouseMotion with the window position, relative motion and the pressed buttons mask """
+    __slots__ = ("x", "y", "dx", "dy", "buttons")
+    NAME = "OnMouseMotion"
+    ID = BUILTIN_IDS + 1
+    
+    def __init__(self):
+        super().__init__()
+        self.x = self.y = self.dx = self.dy = self.buttons = 0
+    
+    def set(self, x: int, y: int, dx: int = 0, dy: int = 0, buttons: int = 0) -> MouseMotionEvent:
+        self.x, self.y, self.dx, self.dy, self.buttons = x, y, dx, dy, buttons
+        return self
+
+
+class EventPool:
+    """
+    Free list of PooledEvents of one class. acquire() and release() are safe to call from producer threads 
+    as they only pop from and append to a list.
+    """
+    
+    def __init__(self, eventClass, capacity: int = 0, **kwargs):
+        """
+        :param eventClass: PooledEvent subclass
+        :type eventClass: type
+        :param capacity: Events to preallocate, defaults to 0
+        :type capacity: int, optional
+        :param kwargs: constructor arguments of the Events, e.g. dtype for TRSEvent
+        """
+        self._eventClass = eventClass
+        self._kwargs = kwargs
+        self._free: List[PooledEvent] = [eventClass(**kwargs) for _ in range(capacity)]
+        self._created = capacity
+    
+    @property #free
+    def free(self) -> int:
+        """ Get the number of Events ready to be acquired """
+        return len(self._free)
+    
+    @property #created
+    def created(self) -> int:
+        """ Get the number of Events allocated by the pool so far """
+        return self._created
+    
+    def acquire(self) -> PooledEvent:
+        """ a recycled Event, or a new one if none is free, fill it with its set() """
+        try:
+            event = self._free.pop()
+        except IndexError:
+            event = self._eventClass(**self._kwargs)
+            self._created += 1
+        event.pool = self
+        return event
+    
+    def release(self, event: PooledEvent):
+        """ give an acquired Event back, releasing it twice is ignored """
+        if event.pool is self:
+            event.pool = None
+            self._free.append(event)
 
 
 class EventPublisher(ABC):
@@ -53,68 +194,358 @@ class EventManager(EventPublisher):
     """
     Main Mediator (Subject/Publisher) class that contains list of Observers/Subscribers (Components) that is being 
     subscribed (notified) from and delegates to Systems to act upon these events invoked from these Components.
+    
+    Every Event name has lists of publishers, subscribers and actuators (Systems). For each name the 
+    (subscriber, actuator) pairs are precomputed in a dispatch list whenever these lists change, so that notify() 
+    is one dict lookup by the integer Event id (checked against the Event name, or by name for Events that were 
+    not registered or reuse another Event's id) and a loop over subscriber.accept(actuator, event) calls. 
+    Ids from BUILTIN_IDS on are reserved for the Events built into pyglGA and never assigned automatically.
+    
+    Typed PooledEvents come from getPool(eventClass) and are released to it once dispatched by drain(); 
+    an acquired Event passed to notify() directly stays owned by the caller, who releases it.
+    
+    Publishers that must not run actuators immediately (e.g. from inside GUI widget code, mid-frame) post() the Event 
+    instead: it is queued and dispatched with all others at a defined point of the frame by drain(), which 
+    ECSSManager.tick() and Scene.render() call. Queued Events with the same coalescing key keep only the latest value, 
+    and the queue holds at most maxQueued Events, see post() for the overflow policies.
+    
+    The registries, notify() and post() belong to the world (render) thread. Network or worker threads use 
+    postThreadsafe() or the asyncio coroutine postAsync() instead: these only append to an inbox deque (a single atomic 
+    operation, no lock is taken) and the inbox is moved into the queue by drain(), so that every Event is delivered 
+    on the world thread.
     """
     
-    def __init__(self):
-        self._publishers: Dict[str,Any] = {}
-        self._subscribers: Dict[str,Any] = {}
-        self._actuators: Dict[str,Any] = {}
+    DROP_OLDEST = "dropOldest" # overflow policy: evict the oldest queued Event
+    DROP_NEWEST = "dropNewest" # overflow policy: reject the posted Event
+    RAISE = "raise"            # overflow policy: raise OverflowError so that the publisher backs off
+    
+    def __init__(self, maxQueued: int = 1024, overflow: str = "dropOldest", maxDrained: int = None):
+        """
+        :param maxQueued: capacity of the deferred Event queue, defaults to 1024
+        :type maxQueued: int, optional
+        :param overflow: policy when the queue is full, DROP_OLDEST, DROP_NEWEST or RAISE, defaults to DROP_OLDEST
+        :type overflow: str, optional
+        :param maxDrained: Events dispatched per drain(), the rest wait for the next frame, defaults to None for all
+        :type maxDrained: int, optional
+        """
+        if overflow not in (EventManager.DROP_OLDEST, EventManager.DROP_NEWEST, EventManager.RAISE):
+            raise ValueError(f"unknown overflow policy {overflow}")
+        self._publishers: Dict[str,List] = {}
+        self._subscribers: Dict[str,List] = {}
+        self._actuators: Dict[str,List] = {}
         self._events: Dict[str,Event] = {}
+        # Event name -> tuple of (subscriber, actuator) pairs, see _rebuild()
+        self._dispatch: Dict[str,tuple] = {}
+        # registered Event id -> (Event name, the same pairs)
+        self._dispatchById: Dict[Any,tuple] = {}
+        self._nextId = 0 # next automatic Event id, above all registered ids below BUILTIN_IDS
+        # deferred Events: (name, coalescing key) or post number -> (sender, Event copy), in posting order
+        self._queue: Dict[Any,tuple] = {}
+        self._postIds = itertools.count()
+        self._maxQueued = maxQueued
+        self._overflow = overflow
+        self._maxDrained = maxDrained
+        self._dropped = 0
+        # Events posted from other threads: (sender, Event copy, key), moved into _queue by drain()
+        self._inbox = deque()
+        self._pools: Dict[type,EventPool] = {}
     
-    def notify(self, sender: Any, event: Event):
+    @property #queued
+    def queued(self) -> int:
+        """ Get the number of Events waiting for drain(), including those posted from other threads """
+        return len(self._queue) + len(self._inbox)
+    
+    @property #dropped
+    def dropped(self) -> int:
+        """ Get the number of posted Events lost to the overflow policy """
+        return self._dropped
+    
+    @property #maxQueued
+    def maxQueued(self) -> int:
+        return self._maxQueued
+    @maxQueued.setter
+    def maxQueued(self, value):
+        self._maxQueued = value
+    
+    @property #maxDrained
+    def maxDrained(self) -> int:
+        return self._maxDrained
+    @maxDrained.setter
+    def maxDrained(self, value):
+        self._maxDrained = value
+    
+    def getPool(self, eventClass, **kwargs) -> EventPool:
+        """ Get the EventPool of a PooledEvent subclass, created on first use with the Event constructor kwargs """
+        pool = self._pools.get(eventClass)
+        if pool is None:
+            pool = self._pools.setdefault(eventClass, EventPool(eventClass, **kwargs))
+        return pool
+    
+    def registerEvent(self, event: Event) -> int:
+        """
+        Register an Event so that it is routed by its integer id, an Event with id None gets the next free id
+
+        :param event: the Event to register
+        :type event: Event
+        :raises ValueError: if another registered Event already uses the same id
+        :return: the Event id
+        :rtype: int
+        """
+        registered = self._events.get(event.name)
+        if registered is event:
+            return event.id
+        if event.id is None:
+            event.id = self._nextId
+        for other in self._events.values():
+            if other.id == event.id and other.name != event.name:
+                raise ValueError(f"Event id {event.id} of {event.name} is already used by {other.name}")
+        if registered is not None:
+            self._dispatchById.pop(registered.id, None)
+        self._events[event.name] = event
+        if isinstance(event.id, int) and event.id < BUILTIN_IDS:
+            self._nextId = max(self._nextId, event.id + 1)
+        self._rebuild(event.name)
+        return event.id
+    
+    def getEvent(self, name: str) -> Event:
+        """ Get a registered Event by name, None if not registered """
+        return self._events.get(name)
+    
+    def _key(self, event) -> str:
+        """ the Event name of a str or an Event, Events are registered on first use """
+        if isinstance(event, str):
+            return event
+        if event.name not in self._events:
+            self.registerEvent(event)
+        return event.name
+    
+    def _rebuild(self, name: str):
+        """ precompute the dispatch list of an Event name, keyed both by name and by its registered id """
+        pairs = tuple((subscriber, actuator) 
+                      for subscriber in self._subscribers.get(name, ()) 
+                      for actuator in self._actuators.get(name, ()))
+        self._dispatch[name] = pairs
+        event = self._events.get(name)
         if event is not None:
-            print(f'\n{EventManager.getClassName()}: notify() reacts from {sender} with {event}\n')
-        
-            # hardcode it for now, in a refactored version search if there is a match in the dictionaries
-            # i.e. no need to hardcode this in the future:
-            # just add event name and appropriate subscribers, publishers, actuators
-            # and run matchmaking here between event names and subscribers-actuators
-            # all needed data are passed from the Event.value
-            # and the appopriate actuator (System) will know what to do
-            if event.name == "OnUpdateBackground":
-                print(f'\n{event.name}: will be actuated from the appropriate system\n')
-            elif event.name == "OnUpdateWireframe":
-                print(f'\n{event.name}: will be actuated from the appropriate system\n')
-                
-            if event.name in self._subscribers:
-                subscriber  = self._subscribers[event.name] 
-                print(f'\n{EventManager.getClassName()}: notify() subscriber: {subscriber} for {event}\n')
-                if event.name in self._actuators:
-                    systemActuator = self._actuators[event.name]
-                    print(f'\n{EventManager.getClassName()}: notify() actuator: {systemActuator} for {event}\n')
-                    subscriber.accept(systemActuator, event)
-        
-        print("EventManager:notify() ended")
-       
-        
-    '''
-    @GPTODO NEED REFACTORING these methods once API is stable
-    # value should be a List
-    # any new subscriber to same key::Event of the Dict should be appended on the value:: List
-    #
-    def subscribe(self, component: Any):
-        self._subscribers.append(component)
-        
-    def unsubscribe(self, component: Any):
-        self._subscribers.remove(component)
-    '''
-    def subscribe(self, component: Any):
-        pass
+            self._dispatchById[event.id] = (name, pairs)
+    
+    def _add(self, registry: Dict[str,List], event, item):
+        name = self._key(event)
+        items = registry.setdefault(name, [])
+        if item not in items:
+            items.append(item)
+        self._rebuild(name)
+    
+    def _remove(self, registry: Dict[str,List], event, item):
+        name = event if isinstance(event, str) else event.name
+        items = registry.get(name)
+        if items is not None and item in items:
+            items.remove(item)
+            self._rebuild(name)
+    
+    def notify(self, sender: Any, event: Event):
+        """
+        Dispatch an Event to all its subscribers, once per actuator System: subscriber.accept(actuator, event)
+
+        :param sender: [the object sending the event]
+        :type sender: Component or RenderWindow
+        :param event: [the Event name, id and value]
+        :type event: Event
+        """
+        if event is None:
+            return
+        entry = self._dispatchById.get(event.id)
+        if entry is not None and entry[0] == event.name:
+            pairs = entry[1]
+        else:
+            pairs = self._dispatch.get(event.name, ())
+        for subscriber, actuator in pairs:
+            subscriber.accept(actuator, event)
+    
+    def post(self, sender: Any, event: Event, key: Any = None) -> bool:
+        """
+        Queue an Event for the next drain() instead of dispatching it now. 
+        The Event is copied, so the publisher can keep reusing and changing its own Event object, 
+        except for an acquired PooledEvent which the EventManager takes over and releases when done.
+        Coalescing is opt-in: a queued Event with the same name and a given key is replaced by this one 
+        (keeping its place in the queue), e.g. key=entity keeps only the latest OnUpdateTRS per Entity during 
+        a slider drag. Events posted without a key are all dispatched.
+
+        :param sender: [the object sending the event]
+        :type sender: Component or RenderWindow
+        :param event: [the Event name, id and value]
+        :type event: Event
+        :param key: coalescing key within the Event name, defaults to None for no coalescing
+        :type key: Any, optional
+        :raises OverflowError: if the queue is full and the overflow policy is RAISE
+        :return: False if the Event was dropped because the queue is full
+        :rtype: bool
+        """
+        return self._enqueue(sender, self._own(event), key)
+    
+    @staticmethod
+    def _own(event: Event) -> Event:
+        """ the Event itself if it was acquired from an EventPool, a copy otherwise """
+        return event if getattr(event, "pool", None) is not None else event.copy()
+    
+    @staticmethod
+    def _release(event: Event):
+        pool = getattr(event, "pool", None)
+        if pool is not None:
+            pool.release(event)
     
-    def unsubscribe(self, component: Any):
-        pass
+    def _enqueue(self, sender: Any, event: Event, key: Any) -> bool:
+        """ coalesce an owned Event into the queue, see post() """
+        # uncoalesced Events get a unique int key, which never equals a (name, key) tuple
+        queueKey = next(self._postIds) if key is None else (event.name, key)
+        queue = self._queue
+        previous = queue.get(queueKey)
+        if previous is not None:
+            if previous[1] is not event:
+                self._release(previous[1])
+        elif len(queue) >= self._maxQueued:
+            if self._overflow == EventManager.DROP_NEWEST:
+                self._dropped += 1
+                self._release(event)
+                return False
+            if self._overflow == EventManager.RAISE:
+                raise OverflowError(f"EventManager queue is full ({self._maxQueued} Events)")
+            self._release(queue.pop(next(iter(queue)))[1])
+            self._dropped += 1
+        queue[queueKey] = (sender, event)
+        return True
     
-    def publish(self, component: Any):
-        pass
+    def postThreadsafe(self, sender: Any, event: Event, key: Any = None):
+        """
+        Post an Event from any thread. The Event is copied and appended to the inbox without taking a lock, 
+        it is coalesced into the queue and dispatched on the world thread by the next drain().
+        Inbox Events that overflow the queue are dropped and counted, whatever the overflow policy.
+
+        :param sender: [the object sending the event]
+        :type sender: Any
+        :param event: [the Event name, id and value]
+        :type event: Event
+        :param key: coalescing key within the Event name, see post()
+        :type key: Any, optional
+        """
+        self._inbox.append((sender, self._own(event), key))
+    
+    async def postAsync(self, sender: Any, event: Event, key: Any = None):
+        """
+        Coroutine version of postThreadsafe() for producers running in an asyncio event loop, e.g. network clients.
+        It never waits for the world thread: await eventManager.postAsync(client, event)
+        """
+        self.postThreadsafe(sender, event, key)
+    
+    def _ingest(self):
+        """ move the Events posted from other threads into the queue, on the world thread """
+        inbox = self._inbox
+        # only the Events already there, producers may keep appending meanwhile
+        for _ in range(len(inbox)):
+            sender, event, key = inbox.popleft()
+            try:
+                self._enqueue(sender, event, key)
+            except OverflowError:
+                self._dropped += 1
+                self._release(event)
+    
+    def drain(self, maxEvents: int = None) -> int:
+        """
+        Dispatch the queued Events in posting order, called once per frame on the world thread. 
+        Events posted from other threads are queued first, after those posted from the world thread. 
+        Events posted while draining are dispatched by the next drain(). If a subscriber or actuator raises, 
+        the Events after the failing one are put back at the front of the queue and the exception propagates.
+
+        :param maxEvents: most Events to dispatch, the rest stay queued, defaults to None for maxDrained
+        :type maxEvents: int, optional
+        :return: number of dispatched Events
+        :rtype: int
+        """
+        if self._inbox:
+            self._ingest()
+        if not self._queue:
+            return 0
+        if maxEvents is None:
+            maxEvents = self._maxDrained
+        queue = self._queue
+        if maxEvents is None or maxEvents >= len(queue):
+            self._queue = {}
+            batch = list(queue.items())
+        else:
+            keys = list(queue)[:maxEvents]
+            batch = [(queueKey, queue.pop(queueKey)) for queueKey in keys]
+        dispatched = 0
+        try:
+            for _, (sender, event) in batch:
+                dispatched += 1
+                self.notify(sender, event)
+                self._release(event)
+        finally:
+            if dispatched < len(batch):
+                self._release(batch[dispatched - 1][1][1])
+                self._requeue(batch[dispatched:])
+        return len(batch)
     
-    def unpublish(self, component: Any):
-        pass
+    def _requeue(self, entries):
+        """ put undispatched (queue key, (sender, Event)) entries back in front of the queue, 
+        an Event coalesced with them since is kept in their place """
+        queue = dict(entries)
+        for queueKey, entry in self._queue.items():
+            previous = queue.get(queueKey)
+            if previous is not None:
+                self._release(previous[1])
+            queue[queueKey] = entry
+        self._queue = queue
     
-    def actuate(self, system: Any):
-        pass
+    def clear(self):
+        """ Discard all queued Events """
+        for _, event in self._queue.values():
+            self._release(event)
+        while self._inbox:
+            self._release(self._inbox.popleft()[1])
+        self._queue = {}
+    
+    def subscribe(self, event, component: Any):
+        """
+        Add a subscriber of an Event, it accept()s the Event's actuator Systems on every notify()
+
+        :param event: Event or Event name
+        :type event: Event or str
+        :param component: the subscriber, e.g. a Component or a RenderWindow
+        :type component: Any
+        """
+        self._add(self._subscribers, event, component)
+    
+    def unsubscribe(self, event, component: Any):
+        self._remove(self._subscribers, event, component)
+    
+    def publish(self, event, component: Any):
+        """
+        Add a publisher of an Event, i.e. an object that calls notify() with it
+
+        :param event: Event or Event name
+        :type event: Event or str
+        :param component: the publisher, e.g. a Component or a RenderWindow
+        :type component: Any
+        """
+        self._add(self._publishers, event, component)
+    
+    def unpublish(self, event, component: Any):
+        self._remove(self._publishers, event, component)
+    
+    def actuate(self, event, system: Any):
+        """
+        Add an actuator System of an Event, visited by every subscriber of the Event on notify()
+
+        :param event: Event or Event name
+        :type event: Event or str
+        :param system: the actuator System
+        :type system: System
+        """
+        self._add(self._actuators, event, system)
     
-    def unactuate(self, system: Any):
-        pass
+    def unactuate(self, event, system: Any):
+        self._remove(self._actuators, event, system)
     
     @classmethod
     def getClassName(cls):
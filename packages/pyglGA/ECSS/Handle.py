@@ -0,0 +1,97 @@
+"""
+Handle classes, part of the glGA SDK ECSS
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+The HandleTable gives Entities and Components compact generational integer handles.
+
+A handle packs a slot index (low 32 bits) and the generation of that slot (high bits) in one int.
+When an object is destroyed its slot generation is increased and the slot is reused, so that old handles
+of the destroyed object are detected as stale instead of resolving to the new occupant of the slot.
+Handles are plain ints: they can be stored in numpy arrays, serialised or passed to other processes.
+
+"""
+
+from __future__ import annotations
+from typing import List, Any
+
+
+class HandleTable():
+    """
+    An O(1) handle -> object table with a free-list of slots
+    """
+
+    INDEX_BITS = 32
+    INDEX_MASK = (1 << INDEX_BITS) - 1
+
+    def __init__(self):
+        self._slots: List[Any] = []
+        self._generations: List[int] = []
+        self._free: List[int] = []
+
+    def __len__(self):
+        return len(self._slots) - len(self._free)
+
+    @staticmethod
+    def makeHandle(index: int, generation: int) -> int:
+        return (generation << HandleTable.INDEX_BITS) | index
+
+    @staticmethod
+    def index(handle: int) -> int:
+        """ Get the slot index of a handle """
+        return handle & HandleTable.INDEX_MASK
+
+    @staticmethod
+    def generation(handle: int) -> int:
+        """ Get the slot generation of a handle """
+        return handle >> HandleTable.INDEX_BITS
+
+    def create(self, obj) -> int:
+        """
+        Store an object in a free slot
+
+        :param obj: Entity or Component
+        :return: the new handle of the object
+        :rtype: int
+        """
+        if self._free:
+            index = self._free.pop()
+            self._slots[index] = obj
+        else:
+            index = len(self._slots)
+            self._slots.append(obj)
+            self._generations.append(0)
+        return self.makeHandle(index, self._generations[index])
+
+    def destroy(self, handle: int) -> bool:
+        """
+        Free the slot of a handle, all handles to it become stale
+
+        :return: True if the handle was alive
+        :rtype: bool
+        """
+        if not self.isAlive(handle):
+            return False
+        index = handle & self.INDEX_MASK
+        self._slots[index] = None
+        self._generations[index] += 1
+        self._free.append(index)
+        return True
+
+    def isAlive(self, handle: int) -> bool:
+        """ Check if a handle still refers to its object """
+        if handle is None:
+            return False
+        index = handle & self.INDEX_MASK
+        return index < len(self._slots) and self._generations[index] == handle >> self.INDEX_BITS
+
+    def resolve(self, handle: int):
+        """
+        Get the object of a handle
+
+        :return: the object, or None if the handle is stale
+        """
+        if not self.isAlive(handle):
+            return None
+        return self._slots[handle & self.INDEX_MASK]
@@ -16,12 +16,18 @@ The following is example restructured text doc example
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
+import logging
+
+import numpy as np
 
 import pyglGA.ECSS.Component
+import pyglGA.ECSS.Event
 import pyglGA.ECSS.utilities as util
 import uuid  
 
+logger = logging.getLogger(__name__)
+
 class System(ABC):
     """
     Main abstract class of the System part of our ECS
@@ -34,6 +40,14 @@ class System(ABC):
     :type ABC: [type]
     """
     
+    # Component class names visited by the ECSSManager traversals, None to visit all Entities and Components
+    _queryTypes = None
+    # Component class names read / written by the System for the ECSSManager scheduler, None if undeclared
+    _reads = None
+    _writes = None
+    # True if the System may run on a worker thread, e.g. no OpenGL calls
+    _threadSafe = False
+    
     def __init__(self, name=None, type=None, id=None, priority=0):
         if (name is None):
             self._name = self.getClassName()
@@ -105,6 +119,73 @@ class System(ABC):
         """
         pass
     
+    @property #queryTypes
+    def queryTypes(self) -> Tuple[str]:
+        """ Get the Component class names this System visits, None to visit all Entities and Components """
+        return self._queryTypes
+    @queryTypes.setter
+    def queryTypes(self, value):
+        self._queryTypes = None if value is None else tuple(value)
+    
+    @property #reads
+    def reads(self) -> Tuple[str]:
+        """ Get the Component class names this System reads, None if undeclared """
+        return self._reads
+    @reads.setter
+    def reads(self, value):
+        self._reads = None if value is None else tuple(value)
+    
+    @property #writes
+    def writes(self) -> Tuple[str]:
+        """ Get the Component class names this System writes, None if undeclared """
+        return self._writes
+    @writes.setter
+    def writes(self, value):
+        self._writes = None if value is None else tuple(value)
+    
+    @property #threadSafe
+    def threadSafe(self) -> bool:
+        """ True if the System may run concurrently on a worker thread """
+        return self._threadSafe
+    @threadSafe.setter
+    def threadSafe(self, value):
+        self._threadSafe = value
+    
+    def conflicts(self, other: System) -> bool:
+        """
+        Check if this System and another one cannot run concurrently, i.e. one writes Component types 
+        that the other reads or writes. Systems without declared reads and writes conflict with all.
+
+        :param other: the other System
+        :type other: System
+        """
+        if self._reads is None or self._writes is None or other._reads is None or other._writes is None:
+            return True
+        writes = set(self._writes)
+        otherWrites = set(other._writes)
+        return bool(writes & set(other._reads) or writes & otherWrites or otherWrites & set(self._reads))
+    
+    @property #batched
+    def batched(self) -> bool:
+        """ True if the System processes a whole Entity hierarchy at once, via apply2Hierarchy() """
+        return False
+    
+    def startTraversal(self, entity):
+        """
+        method to be subclassed for per traversal setup (e.g. resetting counters), 
+        called by the ECSSManager before visiting the hierarchy under an Entity. 
+        
+        """
+        pass
+    
+    def apply2Hierarchy(self, entity, event = None):
+        """
+        method to be subclassed for batched behavioral or logic computation 
+        on the whole hierarchy under an Entity, instead of visiting its Components one by one. 
+        
+        """
+        pass
+    
     def apply(self, Entity, event = None):
         """
         method to be subclassed for  behavioral or logic computation 
@@ -168,6 +249,9 @@ class System(ABC):
     def apply2ImGUIDecorator(self, imGUIDecorator, event = None):
         pass 
     
+    def apply2ECSSManager(self, world, event = None):
+        pass
+    
 class SystemDecorator(System):
     """Basic System Decorator, based on the Decorator design pattern
 
@@ -202,10 +286,54 @@ class TransformSystem(System):
     :rtype: [type]
     """
     
-    def __init__(self, name=None, type=None, id=None, cameraComponent=None):
+    _queryTypes = ("BasicTransform",)
+    _reads = ("BasicTransform",)
+    _writes = ("BasicTransform",)
+    _threadSafe = True
+    
+    def __init__(self, name=None, type=None, id=None, cameraComponent=None, batched=False):
         super().__init__(name, type, id)
         self._camera = cameraComponent #if Scene has a cameraComponent, specify also l2Camera
+        self._batched = batched #if True, l2world is propagated per hierarchy level with apply2Hierarchy()
+        self._recomputed = 0 #number of l2world matrices recalculated in the last traversal
+        # False while traversing a subtree under a dirty BasicTransform, see startTraversal()
+        self._clearDirty = True
+    
+    @property #batched
+    def batched(self) -> bool:
+        """ Get if TransformSystem propagates l2world per hierarchy level instead of per BasicTransform """
+        return self._batched
+    @batched.setter
+    def batched(self, value):
+        self._batched = value
+    
+    @property #recomputed
+    def recomputed(self) -> int:
+        """ Get the number of BasicTransforms whose l2world was recalculated in the last traversal """
+        return self._recomputed
+    
+    def startTraversal(self, entity):
+        self._recomputed = 0
+        self._clearDirty = self.isAncestryClean(entity)
+    
+    def isAncestryClean(self, entity) -> bool:
+        """
+        Check that no BasicTransform above entity is flagged dirty. 
         
+        A flagged BasicTransform has all its descendants flagged too, which lets markDirty() stop early. 
+        A traversal of a subtree under a flagged BasicTransform therefore recalculates l2world but keeps 
+        the dirty flags, which are cleared by the next traversal from above.
+
+        :param entity: start Entity of a traversal
+        :type entity: Entity
+        """
+        node = entity.parent if entity is not None else None
+        while node is not None:
+            basicTrans = node.getChildByType("BasicTransform")
+            if basicTrans is not None and basicTrans.dirty:
+                return False
+            node = node.parent
+        return True
     
     def update(self):
         """
@@ -228,29 +356,116 @@ class TransformSystem(System):
         
         # get parent Entity this BasicTransform Component belongs to
         componentEntity = leafComp.parent
-        topAccessedEntity = componentEntity
-        parentTRS = util.identity()
-        l2worldTRS = leafComp.l2world
-        # while (p1._parent is not None)
+        # start from identity and not from the previous l2world, so that repeated traversals do not accumulate
+        # (the first TRS found is the identity product, which keeps the world dtype)
+        l2worldTRS = None
+        # while (p1._parent is not None), the root node included
         while(componentEntity is not topComp):
             # get that parent's TRS by type
             parentBasicTrans = componentEntity.getChildByType("BasicTransform")
             if(parentBasicTrans is not None):
-                parentTRS = parentBasicTrans.trs
                 # l2world = multiply current with parent's TRS 
-                l2worldTRS = l2worldTRS @ parentBasicTrans.trs
-            topAccessedEntity = componentEntity
+                l2worldTRS = parentBasicTrans.trs.copy() if l2worldTRS is None else l2worldTRS @ parentBasicTrans.trs
             componentEntity = componentEntity.parent
-        else: #parent is now the root node, so check if it has a Transform component
-            parentBasicTrans = topAccessedEntity.getChildByType("BasicTransform")
-            if(parentBasicTrans is not None):
-                parentTRS = parentBasicTrans.trs
-                # l2world = multiply current with parent's TRS 
-                l2worldTRS = l2worldTRS @ parentBasicTrans.trs
                 
-        return l2worldTRS
+        return util.identity() if l2worldTRS is None else l2worldTRS
+    
+    def getHierarchyLevels(self, entity):
+        """Sort the BasicTransforms under an Entity topologically into depth levels
+        
+        Level 0 has the BasicTransforms without any ancestor BasicTransform under entity, level k 
+        the ones whose nearest ancestor BasicTransform is on level k-1.
+
+        :param entity: top Entity of the hierarchy
+        :type entity: Entity
+        :return: list of levels, each a (BasicTransforms list, parent indices in the previous level numpy array) tuple
+        :rtype: List
+        """
+        from pyglGA.ECSS.Entity import Entity # Entity module imports System, so import it here
+        
+        levels = []
+        # breadth first: (Entity, level of its nearest BasicTransform or -1, index of it in that level)
+        current = [(entity, -1, -1)]
+        while current:
+            following = []
+            for node, parentLevel, parentIndex in current:
+                basicTrans = node.getChildByType("BasicTransform")
+                if basicTrans is not None:
+                    level = parentLevel + 1
+                    if level == len(levels):
+                        levels.append(([], []))
+                    levels[level][0].append(basicTrans)
+                    levels[level][1].append(parentIndex)
+                    parentLevel, parentIndex = level, len(levels[level][0]) - 1
+                for child in node._children:
+                    if isinstance(child, Entity):
+                        following.append((child, parentLevel, parentIndex))
+            current = following
+        return [(transforms, np.array(parents, dtype=np.intp)) for transforms, parents in levels]
+    
+    def apply2Hierarchy(self, entity, event = None):
+        """
+        Batched l2world calculation of all BasicTransforms under an Entity
+        
+        The hierarchy is sorted into depth levels and each level is computed with one np.matmul 
+        over its stacked (k,4,4) trs matrices and the already computed l2world of their parents:
+        Ml2w(child) = Mtrs(child) @ Ml2w(parent), same as getLocal2World() per BasicTransform.
         
+        :param entity: top Entity of the hierarchy, typically the root
+        :type entity: Entity
+        """
+        self._recomputed = 0
+        self._clearDirty = self.isAncestryClean(entity)
+        # l2world of the ancestors above entity, if entity is not the root
+        parentL2World = util.identity()
+        if entity.parent is not None:
+            parentL2World = self.getLocal2World(entity)
+        
+        previous = None
+        for transforms, parents in self.getHierarchyLevels(entity):
+            # only dirty BasicTransforms are recalculated, the dirty flag is already spread to descendants
+            dirty = [index for index, basicTrans in enumerate(transforms) if basicTrans.dirty]
+            if dirty:
+                trs = np.stack([transforms[index].trs for index in dirty])
+                if previous is None: # level 0 is relative to the ancestors above entity
+                    parentsL2World = parentL2World[np.newaxis].astype(trs.dtype, copy=False)
+                else:
+                    parentsL2World = np.stack([previous[parents[index]].l2world for index in dirty])
+                l2world = np.matmul(trs, parentsL2World)
+                for index, matrix in zip(dirty, l2world):
+                    transforms[index].l2world = matrix
+                    transforms[index].dirty = not self._clearDirty
+                self._recomputed += len(dirty)
+            previous = transforms
+        
+        
+    
+    def apply2ECSSManager(self, world, event = None):
+        """
+        Actuator of the built-in OnUpdateTRS route of an ECSSManager, see ECSSManager.updateTRS()
         
+        Writes the new trs of the target BasicTransform, which marks it and its descendants dirty, so that 
+        only that subtree is recalculated by the next TransformSystem traversal.
+
+        :param world: the ECSSManager subscribed to OnUpdateTRS
+        :type world: ECSSManager
+        :param event: a TRSEvent, or an Event whose value is an (Entity, trs) tuple
+        :type event: Event
+        """
+        if event is None or event.name != pyglGA.ECSS.Event.TRSEvent.NAME:
+            return
+        if isinstance(event, pyglGA.ECSS.Event.TRSEvent):
+            target, trs = event.entity, event.trs
+        elif event.value is not None:
+            target, trs = event.value
+        else:
+            return
+        # the target is an Entity, its BasicTransform or a handle of either
+        target = world.getBasicTransform(target)
+        if target is None:
+            return
+        # Archetype rows are written through, a standalone trs must not keep the (pooled) Event array
+        target.trs = trs if target._archetype is not None else np.array(trs, dtype=target.trs.dtype)
     
     def apply2BasicTransform(self, basicTransform: pyglGA.ECSS.Component.BasicTransform):
         """
@@ -264,12 +479,17 @@ class TransformSystem(System):
         #check if the visitor visits a node that it should not
         if (isinstance(basicTransform,pyglGA.ECSS.Component.BasicTransform)) == False:
             return #in Python due to duck typing we need to check this!
-        print(self.getClassName(), ": apply(BasicTransform) called")
+        #only BasicTransforms whose trs or an ancestor's trs changed need recalculation
+        if not basicTransform.dirty:
+            return
+        logger.debug("%s: apply(BasicTransform) called", self.getClassName())
         
         # getLocal2World returns result to be set in BasicTransform::update(**kwargs) below
         l2worldTRS = self.getLocal2World(basicTransform)
         #update l2world of basicTransform
         basicTransform.update(l2world=l2worldTRS) 
+        basicTransform.dirty = not self._clearDirty
+        self._recomputed += 1
 
 
 class CameraSystem(System):
@@ -286,9 +506,31 @@ class CameraSystem(System):
     :rtype: [type]
     """
     
+    _queryTypes = ("Camera", "BasicTransform")
+    _reads = ("Camera", "BasicTransform")
+    _writes = ("Camera", "BasicTransform")
+    _threadSafe = True
+    
     def __init__(self, name=None, type=None, id=None, cameraComponent=None):
         super().__init__(name, type, id)
         self._camera = cameraComponent #if Scene has a cameraComponent, specify also l2Camera
+        self._root2camChanged = True #if root2cam changed, all l2cam matrices need recalculation
+        self._root2camPending = True #root2cam changed since the start of the last traversal
+        self._recomputed = 0 #number of l2cam matrices recalculated in the last traversal
+    
+    @property #recomputed
+    def recomputed(self) -> int:
+        """ Get the number of BasicTransforms whose l2cam was recalculated in the last traversal """
+        return self._recomputed
+    
+    def startTraversal(self, entity):
+        self._recomputed = 0
+        # Mr2c is needed before any Ml2c, so a known camera is updated first as in traverse_visit_pre_camera
+        if self._camera is not None:
+            self._camera.accept(self)
+        # a root2cam change (e.g. from traverse_visit_pre_camera) holds for the whole traversal
+        self._root2camChanged = self._root2camPending
+        self._root2camPending = False
     
     def update(self):
         """
@@ -314,12 +556,12 @@ class CameraSystem(System):
         :return: [description]
         :rtype: [type]
         """
-        r2c = util.identity()
+        r2c = util.identity(dtype=camComp.projMat.dtype)
         componentEntity = camComp.parent
         parentBasicTrans = componentEntity.getChildByType("BasicTransform")
         if(parentBasicTrans is not None):
             parentl2world = parentBasicTrans.l2world
-            inv_parentl2world = util.inverse(parentl2world)
+            inv_parentl2world = util.inverse_affine(parentl2world)
             r2c = inv_parentl2world @ camComp.projMat
         
         return r2c
@@ -335,7 +577,10 @@ class CameraSystem(System):
         """
         if (isinstance(basicTransform,pyglGA.ECSS.Component.BasicTransform)) == False:
             return #in Python due to duck typing we need to check this!
-        print(self.getClassName(), ": apply(BasicTransform) called from CameraSystem - Calc: Local2Cam")
+        #only recalculate if either the l2world or the root2cam changed, once a camera is known
+        if self._camera is None or not (basicTransform.camDirty or self._root2camChanged):
+            return
+        logger.debug("%s: apply(BasicTransform) called from CameraSystem - Calc: Local2Cam", self.getClassName())
         
         #l2world of basicTransform has been calculated by the TransformSystem before this System
         l2w = basicTransform.l2world
@@ -343,6 +588,8 @@ class CameraSystem(System):
         proj = self._camera.projMat
         l2c = l2w @ r2c
         basicTransform.update(l2cam=l2c) 
+        basicTransform.camDirty = False
+        self._recomputed += 1
         
     #first this     
     def apply2Camera(self, cam: pyglGA.ECSS.Component.Camera):
@@ -356,10 +603,13 @@ class CameraSystem(System):
         """
         if (isinstance(cam,pyglGA.ECSS.Component.Camera)) == False:
             return #in Python due to duck typing we need to verify this!
-        print(self.getClassName(), ": apply2Camera called from CameraSystem - Calc: Root2Cam")
+        logger.debug("%s: apply2Camera called from CameraSystem - Calc: Root2Cam", self.getClassName())
         
         # getRoot2Cam returns the one component of the Local2Cam = Local2World * Root2Cam
         r2cam = self.getRoot2Camera(cam)
+        if cam is not self._camera or not np.array_equal(r2cam, cam.root2cam):
+            self._root2camChanged = True
+            self._root2camPending = True
         #update root2cam of Camera
         cam.update(root2cam=r2cam)
         #save camera component if not specified on constructor
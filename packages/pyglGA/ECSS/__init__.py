@@ -0,0 +1,9 @@
+"""
+ECSS (Entity Component System in a Scenegraph) package
+
+Submodules are imported on first attribute access, e.g. pyglGA.ECSS.ECSSManager
+"""
+
+from pyglGA import attachSubmodules
+
+__getattr__, __dir__, __all__ = attachSubmodules(__name__, ["Archetype", "Component", "ECSSManager", "Entity", "Event", "Handle", "System", "quaternions", "utilities"])
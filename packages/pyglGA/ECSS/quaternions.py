@@ -0,0 +1,171 @@
+"""
+Quaternions helper functions, part of the glGA SDK ECSS
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+Array based counterparts of the quaternion_* functions in utilities: every function takes (N,4) arrays
+(or a single (4,) quaternion that broadcasts against them) and works on all N quaternions at once,
+e.g. for blending thousands of skeleton bones per frame.
+
+The element layout is the same as in utilities.quaternion_mul(), quaternion_matrix() and quaternion_slerp(),
+so that mul(q1, q2)[i] == quaternion_mul(q1[i], q2[i]), to_matrix(q)[i] == quaternion_matrix(q[i])
+and slerp(q0, q1, t)[i] == quaternion_slerp(q0[i], q1[i], t[i]).
+"""
+
+# Python external modules
+import numpy as np
+
+DOT_THRESHOLD = 0.9995 # above this cosine slerp falls back to a normalised lerp, as in quaternion_slerp()
+
+
+def _quats(q):
+    """return q as a float (N,4) array"""
+    return np.asarray(q, dtype=np.float64).reshape(-1, 4)
+
+def _fractions(fraction):
+    """return fraction as a float (N,1) array that broadcasts against (N,4)"""
+    return np.asarray(fraction, dtype=np.float64).reshape(-1, 1)
+
+
+def normalise(q):
+    """normalise N quaternions, leaving zero quaternions untouched like utilities.normalise()
+
+    :param q: [quaternions]
+    :type q: (N,4) or (4,) array_like
+    :return: unit quaternions
+    :rtype: (N,4) numpy array
+    """
+    q = _quats(q)
+    norms = np.linalg.norm(q, axis=1, keepdims=True)
+    return np.divide(q, norms, out=q.copy(), where=norms > 0.)
+
+
+def mul(q1, q2):
+    """product of N pairs of quaternions, see utilities.quaternion_mul()
+
+    :param q1: [left quaternions]
+    :type q1: (N,4) or (4,) array_like
+    :param q2: [right quaternions]
+    :type q2: (N,4) or (4,) array_like
+    :return: the N products
+    :rtype: (N,4) numpy array
+    """
+    q1, q2 = np.broadcast_arrays(_quats(q1), _quats(q2))
+    a0, a1, a2, a3 = q1.T
+    b0, b1, b2, b3 = q2.T
+    return np.stack([
+                    a1*b0 + a0*b1 - a3*b2 + a2*b3,
+                    a2*b0 + a3*b1 + a0*b2 - a1*b3,
+                    a3*b0 - a2*b1 + a1*b2 + a0*b3,
+                    a0*b0 - a1*b1 - a2*b2 - a3*b3,
+                    ], axis=1)
+
+
+def to_matrix(q):
+    """(N,4,4) rotation matrices of N quaternions, see utilities.quaternion_matrix()
+
+    :param q: [quaternions, normalised first as only unit quaternions are valid rotations]
+    :type q: (N,4) or (4,) array_like
+    :return: the rotation matrices
+    :rtype: (N,4,4) numpy array
+    """
+    q = normalise(q)
+    nxx, nyy, nzz = -q[:,1]*q[:,1], -q[:,2]*q[:,2], -q[:,3]*q[:,3]
+    qwx, qwy, qwz = q[:,0]*q[:,1], q[:,0]*q[:,2], q[:,0]*q[:,3]
+    qxy, qxz, qyz = q[:,1]*q[:,2], q[:,1]*q[:,3], q[:,2]*q[:,3]
+    mats = np.zeros((len(q), 4, 4))
+    mats[:,0,0], mats[:,0,1], mats[:,0,2] = 2*(nyy + nzz) + 1, 2*(qxy - qwz),       2*(qxz + qwy)
+    mats[:,1,0], mats[:,1,1], mats[:,1,2] = 2*(qxy + qwz),     2*(nxx + nzz) + 1,   2*(qyz - qwx)
+    mats[:,2,0], mats[:,2,1], mats[:,2,2] = 2*(qxz - qwy),     2*(qyz + qwx),       2*(nxx + nyy) + 1
+    mats[:,3,3] = 1.0
+    return mats
+
+
+def from_matrix(mats):
+    """N unit quaternions out of the rotation part of N matrices, the inverse of to_matrix()
+    https://www.euclideanspace.com/maths/geometry/rotations/conversions/matrixToQuaternion/index.htm
+    Each row picks the numerically stable branch (largest of trace, m00, m11, m22).
+
+    :param mats: [rotation matrices]
+    :type mats: (N,4,4), (N,3,3), (4,4) or (3,3) array_like
+    :return: quaternions q such that to_matrix(q) == mats
+    :rtype: (N,4) numpy array
+    """
+    mats = np.asarray(mats, dtype=np.float64)
+    mats = mats.reshape((-1,) + mats.shape[-2:])
+    m00, m11, m22 = mats[:,0,0], mats[:,1,1], mats[:,2,2]
+    m01, m02, m10 = mats[:,0,1], mats[:,0,2], mats[:,1,0]
+    m12, m20, m21 = mats[:,1,2], mats[:,2,0], mats[:,2,1]
+    trace = m00 + m11 + m22
+    branch = np.argmax(np.stack([trace, m00, m11, m22], axis=1), axis=1)
+    q = np.empty((len(mats), 4))
+
+    rows = branch == 0
+    s = np.sqrt(trace[rows] + 1.0) * 2 # s = 4 * w
+    q[rows] = np.stack([0.25 * s, (m21[rows] - m12[rows]) / s,
+                        (m02[rows] - m20[rows]) / s, (m10[rows] - m01[rows]) / s], axis=1)
+    rows = branch == 1
+    s = np.sqrt(1.0 + m00[rows] - m11[rows] - m22[rows]) * 2 # s = 4 * x
+    q[rows] = np.stack([(m21[rows] - m12[rows]) / s, 0.25 * s,
+                        (m01[rows] + m10[rows]) / s, (m02[rows] + m20[rows]) / s], axis=1)
+    rows = branch == 2
+    s = np.sqrt(1.0 + m11[rows] - m00[rows] - m22[rows]) * 2 # s = 4 * y
+    q[rows] = np.stack([(m02[rows] - m20[rows]) / s, (m01[rows] + m10[rows]) / s,
+                        0.25 * s, (m12[rows] + m21[rows]) / s], axis=1)
+    rows = branch == 3
+    s = np.sqrt(1.0 + m22[rows] - m00[rows] - m11[rows]) * 2 # s = 4 * z
+    q[rows] = np.stack([(m10[rows] - m01[rows]) / s, (m02[rows] + m20[rows]) / s,
+                        (m12[rows] + m21[rows]) / s, 0.25 * s], axis=1)
+    return q
+
+
+def nlerp(q0, q1, fraction):
+    """normalised linear interpolation of N pairs of quaternions along the shorter path:
+    http://number-none.com/product/Understanding%20Slerp,%20Then%20Not%20Using%20It/
+
+    :param q0: [start quaternions]
+    :type q0: (N,4) or (4,) array_like
+    :param q1: [end quaternions]
+    :type q1: (N,4) or (4,) array_like
+    :param fraction: [one value t, from 0.0 to 1.0, for all pairs or one per pair]
+    :type fraction: float or (N,) array_like
+    :return: the N interpolated unit quaternions
+    :rtype: (N,4) numpy array
+    """
+    q0, q1 = np.broadcast_arrays(normalise(q0), normalise(q1))
+    fraction = _fractions(fraction)
+    dot = np.einsum('ij,ij->i', q0, q1)[:, np.newaxis]
+    q1 = np.where(dot < 0., -q1, q1)
+    return normalise(q0 + fraction * (q1 - q0))
+
+
+def slerp(q0, q1, fraction):
+    """spherical linear interpolation of N pairs of quaternions, see utilities.quaternion_slerp()
+    Pairs closer than DOT_THRESHOLD are linearly interpolated and normalised, pairs in opposite
+    hemispheres (negative dot product) take the shorter path by reversing q1.
+
+    :param q0: [start quaternions]
+    :type q0: (N,4) or (4,) array_like
+    :param q1: [end quaternions]
+    :type q1: (N,4) or (4,) array_like
+    :param fraction: [one value t, from 0.0 to 1.0, for all pairs or one per pair]
+    :type fraction: float or (N,) array_like
+    :return: the N interpolated unit quaternions
+    :rtype: (N,4) numpy array
+    """
+    q0, q1 = np.broadcast_arrays(normalise(q0), normalise(q1))
+    fraction = _fractions(fraction)
+    dot = np.einsum('ij,ij->i', q0, q1)[:, np.newaxis]
+
+    # near-parallel pairs: linear interpolation, same test as quaternion_slerp() before the hemisphere flip
+    close = dot > DOT_THRESHOLD
+    lerped = normalise(q0 + fraction * (q1 - q0))
+
+    # opposite handedness: reverse q1 so that slerp takes the shorter path
+    q1, dot = np.where(dot > 0., q1, -q1), np.abs(dot)
+    theta = np.arccos(np.clip(dot, -1, 1)) * fraction   # angle between q0 and result
+    q2 = normalise(q1 - q0*dot)                          # {q0, q2} now orthonormal basis
+    slerped = q0*np.cos(theta) + q2*np.sin(theta)
+
+    return np.where(close, lerped, slerped)
@@ -0,0 +1,150 @@
+"""
+Test Archetype Unit tests, part of the glGA SDK ECSS
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+"""
+
+import unittest
+import numpy as np
+
+import pyglGA.ECSS.utilities as util
+from pyglGA.ECSS.Entity import Entity
+from pyglGA.ECSS.Component import BasicTransform, Camera, RenderMesh
+from pyglGA.ECSS.Archetype import Archetype, ArchetypeStorage
+from pyglGA.ECSS.ECSSManager import ECSSManager
+
+
+class TestArchetypeStorage(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Scenegraph:
+
+        root
+            |---------------|-----------|
+            node1,          node2,      node3
+            |               |-------|   |
+            trans1          trans2, mesh2
+        """
+        self.world = ECSSManager()
+        self.root = self.world.createEntity(Entity(name="root"))
+        self.node1 = self.world.createEntity(Entity(name="node1"))
+        self.node2 = self.world.createEntity(Entity(name="node2"))
+        self.node3 = self.world.createEntity(Entity(name="node3"))
+        self.world.addEntityChild(self.root, self.node1)
+        self.world.addEntityChild(self.root, self.node2)
+        self.world.addEntityChild(self.root, self.node3)
+        self.trans1 = self.world.addComponent(self.node1, BasicTransform(name="trans1", trs=util.translate(1.0,2.0,3.0)))
+        self.trans2 = self.world.addComponent(self.node2, BasicTransform(name="trans2", trs=util.translate(4.0,5.0,6.0)))
+        self.mesh2 = self.world.addComponent(self.node2, RenderMesh(name="mesh2"))
+
+    def test_archetypes(self):
+        """
+        Entities with the same Component types share one Archetype
+        """
+        print("TestArchetypeStorage:test_archetypes START".center(100, '-'))
+
+        transArchetypes = self.world.query("BasicTransform")
+        self.assertEqual(len(transArchetypes), 2)
+        meshArchetypes = self.world.query("BasicTransform", "RenderMesh")
+        self.assertEqual(len(meshArchetypes), 1)
+        self.assertEqual(meshArchetypes[0].entities, [self.node2])
+        self.assertEqual(meshArchetypes[0].components("RenderMesh"), [self.mesh2])
+
+        archetype, row = self.world.storage.location(self.root)
+        self.assertEqual(archetype.signature, frozenset())
+
+        print("TestArchetypeStorage:test_archetypes END".center(100, '-'))
+
+    def test_columnViews(self):
+        """
+        BasicTransform matrices are views into the Archetype (N,4,4) columns
+        """
+        print("TestArchetypeStorage:test_columnViews START".center(100, '-'))
+
+        self.node4 = self.world.createEntity(Entity(name="node4"))
+        self.world.addEntityChild(self.root, self.node4)
+        self.trans4 = self.world.addComponent(self.node4, BasicTransform(name="trans4", trs=util.translate(7.0,8.0,9.0)))
+
+        archetype, row = self.world.storage.location(self.node4)
+        trsColumn = archetype.column("BasicTransform", "trs")
+        self.assertEqual(trsColumn.shape, (2,4,4))
+        np.testing.assert_array_equal(trsColumn[row], util.translate(7.0,8.0,9.0))
+
+        # bulk write on the column is visible from the Component
+        l2worldColumn = archetype.column("BasicTransform", "l2world")
+        l2worldColumn[:] = util.scale(2.0)
+        np.testing.assert_array_equal(self.trans4.l2world, util.scale(2.0))
+        np.testing.assert_array_equal(self.trans1.l2world, util.scale(2.0))
+
+        # property write is visible in the column
+        self.trans4.trs = util.translate(1.0,1.0,1.0)
+        np.testing.assert_array_equal(archetype.column("BasicTransform", "trs")[row], util.translate(1.0,1.0,1.0))
+
+        # growing reallocates the columns: a column fetched before is stale and must be fetched again
+        stale = archetype.column("BasicTransform", "trs")
+        staleTrs = self.trans4.trs
+        capacity = archetype.capacity
+        for i in range(capacity + 1 - len(archetype)):
+            node = self.world.createEntity(Entity(name=f"crowd{i}"))
+            self.world.addEntityChild(self.root, node)
+            self.world.addComponent(node, BasicTransform(trs=util.identity()))
+        self.assertGreater(archetype.capacity, capacity)
+        fresh = archetype.column("BasicTransform", "trs")
+        self.assertIsNot(fresh, stale)
+        self.assertFalse(np.shares_memory(fresh, stale))
+        self.assertFalse(np.shares_memory(self.trans4.trs, staleTrs))
+        stale[row] = util.scale(3.0)
+        np.testing.assert_array_equal(self.trans4.trs, util.translate(1.0,1.0,1.0))
+        np.testing.assert_array_equal(fresh[row], util.translate(1.0,1.0,1.0))
+
+        print("TestArchetypeStorage:test_columnViews END".center(100, '-'))
+
+    def test_moveAndGrow(self):
+        """
+        Entities move between Archetypes and keep their data when columns grow
+        """
+        print("TestArchetypeStorage:test_moveAndGrow START".center(100, '-'))
+
+        # node1 moves from {BasicTransform} to {BasicTransform, RenderMesh}
+        self.world.addComponent(self.node1, RenderMesh(name="mesh1"))
+        archetype, row = self.world.storage.location(self.node1)
+        self.assertEqual(archetype.signature, frozenset({"BasicTransform", "RenderMesh"}))
+        self.assertIs(self.trans1._archetype, archetype)
+        np.testing.assert_array_equal(self.trans1.trs, util.translate(1.0,2.0,3.0))
+        np.testing.assert_array_equal(self.trans2.trs, util.translate(4.0,5.0,6.0))
+
+        # grow beyond initial capacity
+        nodes = []
+        for i in range(40):
+            node = self.world.createEntity(Entity(name=f"crowd{i}"))
+            self.world.addEntityChild(self.root, node)
+            self.world.addComponent(node, BasicTransform(trs=util.translate(float(i),0.0,0.0)))
+            nodes.append(node)
+        archetype, row = self.world.storage.location(nodes[0])
+        self.assertGreaterEqual(archetype.capacity, 40)
+        for i, node in enumerate(nodes):
+            np.testing.assert_array_equal(node.getChildByType("BasicTransform").trs, util.translate(float(i),0.0,0.0))
+
+        print("TestArchetypeStorage:test_moveAndGrow END".center(100, '-'))
+
+    def test_replaceComponent(self):
+        """
+        Replacing a Component keeps the row and unbinds the previous Component
+        """
+        print("TestArchetypeStorage:test_replaceComponent START".center(100, '-'))
+
+        trans5 = self.world.addComponent(self.node2, BasicTransform(name="trans5", trs=util.translate(0.0,0.0,5.0)))
+        archetype, row = self.world.storage.location(self.node2)
+        self.assertIs(archetype.components("BasicTransform")[row], trans5)
+        self.assertIsNone(self.trans2._archetype)
+        np.testing.assert_array_equal(self.trans2.trs, util.translate(4.0,5.0,6.0))
+        np.testing.assert_array_equal(archetype.column("BasicTransform", "trs")[row], util.translate(0.0,0.0,5.0))
+
+        print("TestArchetypeStorage:test_replaceComponent END".center(100, '-'))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[''], verbosity=3, exit=False)
@@ -7,11 +7,12 @@ glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
 """
 
 import unittest
+import threading
 import numpy as np
 
 import pyglGA.ECSS.utilities as util
 from pyglGA.ECSS.Entity import Entity, EntityDfsIterator
-from pyglGA.ECSS.Component import BasicTransform, Camera
+from pyglGA.ECSS.Component import BasicTransform, Camera, RenderMesh, BasicTransformDecorator
 from pyglGA.ECSS.System import System, TransformSystem, CameraSystem, RenderSystem
 import pyglGA.ECSS.ECSSManager
 
@@ -101,7 +102,12 @@ class TestECSSManager(unittest.TestCase):
         for key, value in self.WorldManager._entities_components.items():
             print("\n entity: ",key, ":: with components: ", value)
         
-        self.assertEqual(id(self.WorldManager), id(self.WorldManager2))
+        # every ECSSManager is an independent world
+        self.assertIsNot(self.WorldManager, self.WorldManager2)
+        self.assertIsNot(self.WorldManager.eventManager, self.WorldManager2.eventManager)
+        self.assertEqual(len(self.WorldManager2._entities), 0)
+        self.assertIsNone(self.WorldManager2.root)
+        self.assertIs(self.rootEntity.worldManager, self.WorldManager)
         self.assertEqual(self.rootEntity, self.WorldManager._root)
         self.assertIsInstance(self.transUpdate, TransformSystem)
         self.assertIsInstance(self.camUpdate, CameraSystem)
@@ -121,6 +127,64 @@ class TestECSSManager(unittest.TestCase):
         print("TestECSSManager:test_init END".center(100, '-'))
     
     
+    def test_multipleWorlds(self):
+        """
+        Independent ECSSManager worlds update concurrently, one per thread
+        """
+        
+        print("TestECSSManager:test_multipleWorlds START".center(100, '-'))
+        
+        def buildWorld(x):
+            world = pyglGA.ECSS.ECSSManager.ECSSManager()
+            root = world.createEntity(Entity(name="root"))
+            world.addComponent(root, BasicTransform(trs=util.translate(x, 0.0, 0.0)))
+            world.createEntities(np.arange(-1, 49), trs=np.stack([util.translate(x, 0.0, 0.0)] * 50), parent=root)
+            world.createSystem(TransformSystem(batched=True), scheduled=True)
+            return world
+        
+        worlds = [buildWorld(float(x)) for x in range(1, 5)]
+        threads = [threading.Thread(target=world.tick, args=(0.1,)) for world in worlds]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        for x, world in enumerate(worlds, 1):
+            self.assertEqual(len(world._entities), 51)
+            self.assertEqual(world.time, 0.1)
+            leaf = world._entities[-1].getChildByType("BasicTransform")
+            np.testing.assert_array_almost_equal(leaf.l2world, util.translate(51.0 * x, 0.0, 0.0))
+        
+        print("TestECSSManager:test_multipleWorlds END".center(100, '-'))
+        
+    def test_precision(self):
+        """
+        All matrices of a world keep its dtype, float32 by default, through the Transform and Camera Systems
+        """
+        
+        print("TestECSSManager:test_precision START".center(100, '-'))
+        
+        self.assertEqual(self.WorldManager.dtype, np.float32)
+        self.trans1.trs = util.translate(1.0,2.0,3.0) @ util.rotate((0.0,1.0,0.0), 30.0)
+        self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        self.WorldManager.traverse_visit(self.camUpdate, self.rootEntity)
+        for comp in (self.trans1, self.trans7):
+            for matrix in (comp.trs, comp.l2world, comp.l2cam):
+                self.assertEqual(matrix.dtype, np.float32)
+        self.assertEqual(self.orthoCam.projMat.dtype, np.float32)
+        self.assertEqual(self.orthoCam.root2cam.dtype, np.float32)
+        np.testing.assert_array_almost_equal(self.trans7.l2world, util.translate(16.0,16.0,16.0), decimal=5)
+        
+        # a float64 world for precision sensitive scenes
+        world = pyglGA.ECSS.ECSSManager.ECSSManager(dtype=np.float64)
+        root = world.createEntity(Entity(name="root"))
+        trans = world.addComponent(root, BasicTransform(trs=util.translate(1.0,2.0,3.0)))
+        world.traverse_visit(TransformSystem(), root)
+        self.assertEqual(trans.l2world.dtype, np.float64)
+        self.assertEqual(world.storage.location(root)[0].column("BasicTransform", "trs").dtype, np.float64)
+        
+        print("TestECSSManager:test_precision END".center(100, '-'))
+        
     def test_addComponent(self):
         """
         ECSSManager addComponent
@@ -145,6 +209,338 @@ class TestECSSManager(unittest.TestCase):
         
         print("TestECSSManager:test_addComponent END".center(100, '-'))
         
+    def test_componentIndex(self):
+        """
+        ECSSManager per Entity and per type Component indices
+        """
+        
+        print("TestECSSManager:test_componentIndex START".center(100, '-'))
+        
+        self.assertIs(self.WorldManager.getComponent(self.entityCam2, "BasicTransform"), self.trans2)
+        self.assertIs(self.WorldManager.getComponent(self.entityCam2, "Camera"), self.orthoCam)
+        self.assertIsNone(self.WorldManager.getComponent(self.rootEntity, "BasicTransform"))
+        self.assertEqual(self.WorldManager.getEntitiesByType("Camera"), {self.entityCam2})
+        self.assertEqual(len(self.WorldManager.getEntitiesByType("BasicTransform")), 7)
+        
+        #replace a component: indices point to the new one
+        trans9 = self.WorldManager.addComponent(self.node7, BasicTransform(name="trans9"))
+        self.assertIs(self.WorldManager.getComponent(self.node7, "BasicTransform"), trans9)
+        self.assertIs(self.node7.getChildByType("BasicTransform"), trans9)
+        self.assertEqual(self.node7.getNumberOfChildren(), 1)
+        self.assertEqual(len(self.WorldManager.getEntitiesByType("BasicTransform")), 7)
+        
+        #adding the same component twice does not duplicate it
+        self.WorldManager.addComponent(self.node7, trans9)
+        self.assertEqual(self.node7.getNumberOfChildren(), 1)
+        self.assertEqual(self.WorldManager._components.count(trans9), 1)
+        
+        print("TestECSSManager:test_componentIndex END".center(100, '-'))
+        
+    def test_bulkWrite(self):
+        """
+        bulk writes to Archetype columns are recalculated by the next TransformSystem traversal
+        """
+        
+        print("TestECSSManager:test_bulkWrite START".center(100, '-'))
+        
+        self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        archetype, row = self.WorldManager.storage.location(self.node4)
+        archetype.write("BasicTransform", "trs", util.translate(0.0, 40.0, 0.0), rows=[row])
+        self.assertTrue(self.trans4.dirty)
+        self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        np.testing.assert_array_almost_equal(self.trans4.l2world, util.translate(0.0, 40.0, 0.0))
+        
+        # raw column writes followed by markDirty(), also spreading to the descendants
+        for archetype in self.WorldManager.query("BasicTransform"):
+            archetype.column("BasicTransform", "trs")[:] = util.translate(1.0, 0.0, 0.0)
+            archetype.markDirty("BasicTransform")
+        self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        for trans in (self.trans2, self.trans7):
+            np.testing.assert_array_almost_equal(trans.l2world, self.transUpdate.getLocal2World(trans))
+        self.assertGreater(self.trans7.l2world[0,3], 1.0)
+        
+        print("TestECSSManager:test_bulkWrite END".center(100, '-'))
+        
+    def test_traverse_visit_batched(self):
+        """
+        ECSSManager traverse_visit with a batched TransformSystem
+        """
+        
+        print("TestECSSManager:test_traverse_visit_batched START".center(100, '-'))
+        
+        batchedUpdate = self.WorldManager.createSystem(TransformSystem("batchedUpdate", "TransformSystem", "002", batched=True))
+        self.WorldManager.traverse_visit(batchedUpdate, self.rootEntity)
+        
+        m7l2w = util.translate(7.0,7.0,7.0) @ util.translate(6.0,6.0,6.0) @ util.translate(3.0,3.0,3.0)
+        np.testing.assert_array_almost_equal(self.trans7.l2world, m7l2w, decimal=3)
+        np.testing.assert_array_almost_equal(self.trans2.l2world, util.translate(3.0,5.0,7.0), decimal=3)
+        np.testing.assert_array_almost_equal(self.trans4.l2world, util.identity(), decimal=3)
+        
+        print("TestECSSManager:test_traverse_visit_batched END".center(100, '-'))
+        
+    def test_createEntities(self):
+        """
+        ECSSManager bulk creation of a subtree of Entities with BasicTransforms
+        """
+        
+        print("TestECSSManager:test_createEntities START".center(100, '-'))
+        
+        # node8 -> node9 -> node10, node8 -> node11, all under node7
+        parents = np.array([-1, 0, 1, 0])
+        trs = np.stack([util.translate(float(i), 0.0, 0.0) for i in range(4)])
+        nodes = self.WorldManager.createEntities(parents, ["node8", "node9", "node10", "node11"], trs, parent=self.node7)
+        
+        self.assertEqual([node.name for node in nodes], ["node8", "node9", "node10", "node11"])
+        self.assertIs(nodes[0].getParent(), self.node7)
+        self.assertIs(nodes[2].getParent(), nodes[1])
+        self.assertIs(nodes[3].getParent(), nodes[0])
+        self.assertIn(nodes[0], self.WorldManager._entities_components[self.node7])
+        self.assertEqual(self.WorldManager._entities_components[nodes[0]][1:], [nodes[1], nodes[3]])
+        
+        trans10 = self.WorldManager.getComponent(nodes[2], "BasicTransform")
+        self.assertIs(nodes[2].getChildByType("BasicTransform"), trans10)
+        self.assertIn(nodes[2], self.WorldManager.getEntitiesByType("BasicTransform"))
+        archetype, row = self.WorldManager.storage.location(nodes[2])
+        self.assertIs(trans10._archetype, archetype)
+        np.testing.assert_array_equal(trans10.trs, util.translate(2.0, 0.0, 0.0))
+        
+        self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        m7l2w = util.translate(7.0,7.0,7.0) @ util.translate(6.0,6.0,6.0) @ util.translate(3.0,3.0,3.0)
+        np.testing.assert_array_almost_equal(trans10.l2world, util.translate(3.0, 0.0, 0.0) @ m7l2w)
+        
+        # a crowd of plain Entities under the root
+        crowd = self.WorldManager.createEntities(np.full(3, -1), parent=self.rootEntity)
+        self.assertEqual(len(crowd), 3)
+        self.assertIsNone(crowd[0].getChildByType("BasicTransform"))
+        with self.assertRaises(ValueError):
+            self.WorldManager.createEntities([1, -1], parent=self.rootEntity)
+        
+        print("TestECSSManager:test_createEntities END".center(100, '-'))
+        
+    def test_destroyEntity(self):
+        """
+        ECSSManager destroys Entity subtrees and their Components
+        """
+        
+        print("TestECSSManager:test_destroyEntity START".center(100, '-'))
+        
+        class GPUMesh(RenderMesh):
+            """ a RenderMesh that holds a GPU resource """
+            released = 0
+            def release(self):
+                GPUMesh.released += 1
+        
+        mesh7 = self.WorldManager.addComponent(self.node7, GPUMesh(name="mesh7"))
+        entityCount = len(self.WorldManager._entities)
+        componentCount = len(self.WorldManager._components)
+        
+        # non recursive: node6's child node7 moves up to node3
+        self.WorldManager.destroyEntity(self.node6, recursive=False)
+        self.assertIs(self.node7.getParent(), self.node3)
+        self.assertNotIn(self.node6, self.node3._children)
+        self.assertIn(self.node7, self.WorldManager._entities_components[self.node3])
+        self.assertNotIn(self.node6, self.WorldManager._entities_components[self.node3])
+        self.assertNotIn(self.node6, self.WorldManager._entities)
+        self.assertNotIn(self.trans6, self.WorldManager._components)
+        self.assertIsNone(self.WorldManager.storage.location(self.node6))
+        self.assertEqual(len(self.WorldManager._entities), entityCount - 1)
+        self.assertEqual(GPUMesh.released, 0)
+        
+        # recursive: node3, node5, node7 and their Components
+        self.WorldManager.destroyEntity(self.node3)
+        self.assertEqual(GPUMesh.released, 1)
+        self.assertNotIn(self.node3, self.rootEntity._children)
+        self.assertEqual(len(self.WorldManager._entities), entityCount - 4)
+        self.assertEqual(len(self.WorldManager._components), componentCount - 5)
+        for node in (self.node3, self.node5, self.node7):
+            self.assertNotIn(node, self.WorldManager._entities_components)
+            self.assertNotIn(node, self.WorldManager.getEntitiesByType("BasicTransform"))
+            self.assertIsNone(self.WorldManager.storage.location(node))
+        self.assertNotIn(self.node7, self.WorldManager.getEntitiesByType("GPUMesh"))
+        self.assertNotIn(self.trans7, self.WorldManager.getTraversalOrder(self.rootEntity))
+        for archetype in self.WorldManager.query("BasicTransform"):
+            self.assertNotIn(self.trans7, archetype.components("BasicTransform"))
+        
+        # the destroyed ids are reused
+        self.assertIn(BasicTransform().id, (self.node3.id, self.node5.id, self.node7.id, mesh7.id, 
+                                            self.trans3.id, self.trans5.id, self.trans7.id))
+        
+        # the remaining scene still updates
+        self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        np.testing.assert_array_almost_equal(self.trans2.l2world, util.translate(3.0,5.0,7.0), decimal=3)
+        
+        print("TestECSSManager:test_destroyEntity END".center(100, '-'))
+        
+    def test_destroyEntityTwice(self):
+        """
+        destroying an Entity twice, or one with an explicit id, never hands out an id twice
+        """
+        
+        print("TestECSSManager:test_destroyEntityTwice START".center(100, '-'))
+        
+        world = pyglGA.ECSS.ECSSManager.ECSSManager()
+        root = world.createEntity(Entity(name="root", id=1000001))
+        a = world.createEntity(Entity(name="a"))
+        world.addEntityChild(root, a)
+        transA = world.addComponent(a, BasicTransform(name="transA"))
+        explicit = world.createEntity(Entity(name="explicit", id=1000001))
+        world.addEntityChild(root, explicit)
+        
+        world.destroyEntity(a)
+        world.destroyEntity(a)
+        world.destroyEntity(explicit)
+        self.assertIsNone(transA.parent)
+        self.assertEqual(a._children, [])
+        
+        ids = [BasicTransform().id for _ in range(4)]
+        self.assertEqual(len(set(ids)), 4)
+        self.assertNotIn(root.id, ids)
+        self.assertEqual(len(set(ids) & {a.id, transA.id}), 2)
+        
+        print("TestECSSManager:test_destroyEntityTwice END".center(100, '-'))
+        
+    def test_getTraversalOrder(self):
+        """
+        ECSSManager cached flattened traversal order
+        """
+        
+        print("TestECSSManager:test_getTraversalOrder START".center(100, '-'))
+        
+        order = self.WorldManager.getTraversalOrder(self.rootEntity)
+        expected = [comp for comp in self.rootEntity if comp is not None]
+        self.assertEqual(order, expected)
+        # cached until the scenegraph structure changes
+        self.assertIs(self.WorldManager.getTraversalOrder(self.rootEntity), order)
+        
+        node8 = self.WorldManager.createEntity(Entity(name="node8"))
+        self.WorldManager.addEntityChild(self.node7, node8)
+        order = self.WorldManager.getTraversalOrder(self.rootEntity)
+        self.assertIn(node8, order)
+        self.assertEqual(order.index(node8), order.index(self.trans7) + 1)
+        self.assertEqual(order, [comp for comp in self.rootEntity if comp is not None])
+        
+        self.node7.remove(node8)
+        self.assertNotIn(node8, self.WorldManager.getTraversalOrder(self.rootEntity))
+        
+        # structural changes of another world (or hierarchy) keep this one's cache
+        order = self.WorldManager.getTraversalOrder(self.rootEntity)
+        otherRoot = self.WorldManager2.createEntity(Entity(name="root"))
+        self.WorldManager2.addEntityChild(otherRoot, self.WorldManager2.createEntity(Entity(name="otherChild")))
+        self.assertIs(self.WorldManager.getTraversalOrder(self.rootEntity), order)
+        
+        # a detached subtree is versioned on its own, also when it changed while detached
+        subtree = self.WorldManager.getTraversalOrder(self.node7)
+        self.node6.remove(self.node7)
+        self.node7.add(node8)
+        self.assertIn(node8, self.WorldManager.getTraversalOrder(self.node7))
+        self.assertIsNot(self.WorldManager.getTraversalOrder(self.node7), subtree)
+        
+        print("TestECSSManager:test_getTraversalOrder END".center(100, '-'))
+        
+    def test_queryComponents(self):
+        """
+        ECSSManager type-filtered traversal of the Components a System queries
+        """
+        
+        print("TestECSSManager:test_queryComponents START".center(100, '-'))
+        
+        self.assertEqual(self.transUpdate.queryTypes, ("BasicTransform",))
+        transforms = self.WorldManager.queryComponents(self.rootEntity, "BasicTransform")
+        self.assertEqual(transforms, [self.trans1, self.trans2, self.trans4, self.trans3, self.trans5, self.trans6, self.trans7])
+        cams = self.WorldManager.queryComponents(self.rootEntity, "Camera", "BasicTransform")
+        self.assertEqual(cams.index(self.orthoCam), cams.index(self.trans2) + 1)
+        
+        groups = self.WorldManager.queryComponents(self.rootEntity, "Camera", "BasicTransform", grouped=True)
+        self.assertEqual(groups[self.entityCam2], [self.trans2, self.orthoCam])
+        self.assertEqual(groups[self.node7], [self.trans7])
+        
+        # a System with no queryTypes visits every Entity and Component
+        self.assertIsNone(System().queryTypes)
+        self.assertIn(self.node7, self.WorldManager.getTraversalOrder(self.rootEntity, System().queryTypes))
+        
+        # subclasses and decorators of a queried type are visited too, as accept() is polymorphic
+        class AnimatedTransform(BasicTransform):
+            __slots__ = ()
+        node8 = self.WorldManager.createEntity(Entity(name="node8"))
+        self.WorldManager.addEntityChild(self.node7, node8)
+        animated = self.WorldManager.addComponent(node8, AnimatedTransform(name="animated"))
+        decorator = BasicTransformDecorator(self.trans7, name="decorated7")
+        self.node7.add(decorator)
+        transforms = self.WorldManager.queryComponents(self.rootEntity, *self.transUpdate.queryTypes)
+        self.assertIn(animated, transforms)
+        self.assertIn(decorator, transforms)
+        self.assertNotIn(decorator, self.WorldManager.queryComponents(self.rootEntity, "Camera"))
+        
+        print("TestECSSManager:test_queryComponents END".center(100, '-'))
+        
+    def test_traverse_visit_logging(self):
+        """
+        ECSSManager traverse_visit debug output goes through the pyglGA loggers
+        """
+        
+        print("TestECSSManager:test_traverse_visit_logging START".center(100, '-'))
+        
+        with self.assertLogs("pyglGA.ECSS", level="DEBUG") as logs:
+            self.WorldManager.traverse_visit(self.transUpdate, self.rootEntity)
+        messages = [record.getMessage() for record in logs.records]
+        self.assertIn("this is the transUpdate traversal START", messages)
+        self.assertTrue(any(message.startswith("transUpdate traversal took") for message in messages))
+        self.assertIn("pyglGA.ECSS.System", [record.name for record in logs.records])
+        
+        print("TestECSSManager:test_traverse_visit_logging END".center(100, '-'))
+        
+    def test_tick(self):
+        """
+        ECSSManager scheduler runs the scheduled Systems by priority and read/write conflicts
+        """
+        
+        print("TestECSSManager:test_tick START".center(100, '-'))
+        
+        class CountSystem(System):
+            """ counts the visited Cameras from a worker thread """
+            _queryTypes = ("Camera",)
+            _reads = ("Camera",)
+            _writes = ()
+            _threadSafe = True
+            def startTraversal(self, entity):
+                self.visits = 0
+            def apply2Camera(self, cam, event = None):
+                self.visits += 1
+        
+        transUpdate = self.WorldManager.createSystem(TransformSystem("transUpdate", "TransformSystem", "001"), scheduled=True)
+        camUpdate = self.WorldManager.createSystem(CameraSystem("camUpdate", "CameraUpdate", "200", self.orthoCam), scheduled=True)
+        counter = self.WorldManager.createSystem(CountSystem("counter"), scheduled=True)
+        transCounter = self.WorldManager.createSystem(CountSystem("transCounter"), scheduled=True)
+        transCounter.reads = ("BasicTransform", "Camera")
+        render = self.WorldManager.createSystem(System("render"), scheduled=True)
+        render.priority = 10
+        self.WorldManager.createSystem(System("init"))
+        
+        self.assertTrue(camUpdate.conflicts(transUpdate))
+        self.assertFalse(counter.conflicts(transUpdate))
+        self.assertTrue(transCounter.conflicts(transUpdate))
+        self.assertTrue(render.conflicts(counter))
+        self.assertFalse(counter.conflicts(transCounter))
+        # counter reads the Camera written by camUpdate, the two counters run concurrently
+        self.assertEqual(self.WorldManager.getSchedule(), [[transUpdate], [camUpdate], [counter, transCounter], [render]])
+        
+        self.WorldManager.tick(0.5, self.rootEntity, maxWorkers=2)
+        self.WorldManager.tick(0.25, self.rootEntity, maxWorkers=2)
+        self.assertEqual(self.WorldManager.dt, 0.25)
+        self.assertEqual(counter.visits, 1)
+        self.assertEqual(transCounter.visits, 1)
+        
+        trans2l2w = util.translate(2.0,3.0,4.0) @ util.translate(1.0,2.0,3.0)
+        mr2c = util.inverse(trans2l2w) @ util.ortho(-100.0, 100.0, -100.0, 100.0, 1.0, 100.0)
+        m7l2w = util.translate(7.0,7.0,7.0) @ util.translate(6.0,6.0,6.0) @ util.translate(3.0,3.0,3.0)
+        np.testing.assert_array_almost_equal(self.orthoCam.root2cam, mr2c, decimal=3)
+        np.testing.assert_array_almost_equal(self.trans7.l2world, m7l2w, decimal=3)
+        np.testing.assert_array_almost_equal(self.trans7.l2cam, m7l2w @ mr2c, decimal=3)
+        
+        self.WorldManager.shutdown()
+        
+        print("TestECSSManager:test_tick END".center(100, '-'))
+        
     def test_traverse_visit(self):
         """
         ECSSManager traverse_visit
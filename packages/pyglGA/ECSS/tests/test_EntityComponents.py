@@ -133,6 +133,15 @@ class TestEntity(unittest.TestCase):
         self.assertIn(gameObject2, gameObject._children)
         self.assertEqual(gameObject2.getNumberOfChildren(), 2)
         
+        #removing the first child of a type promotes the next one of the same type
+        trans6 = BasicTransform("trans6", "BasicTransform", "9")
+        gameObject2.add(trans6)
+        self.assertEqual(trans4, gameObject2.getChildByType("BasicTransform"))
+        gameObject2.remove(trans4)
+        self.assertEqual(trans6, gameObject2.getChildByType("BasicTransform"))
+        gameObject2.remove(trans6)
+        self.assertIsNone(gameObject2.getChildByType("BasicTransform"))
+        
         print("TestEntity:test_getChildByType() END")
     
     def test_isEntity(self):
@@ -244,6 +253,27 @@ class TestComponent(unittest.TestCase):
         self.assertEqual(myComponent.id, 100)
         
         print("TestComponent:test_init() END")
+    
+    def test_slotsAndIds(self):
+        """
+        Components have fixed attributes (no per instance __dict__) and increasing default ids
+        """
+        print("\nTestComponent:test_slotsAndIds() START")
+        
+        trans = BasicTransform()
+        entity = Entity()
+        cam = Camera()
+        for comp in (trans, entity, cam, RenderMesh()):
+            self.assertFalse(hasattr(comp, "__dict__"))
+        with self.assertRaises(AttributeError):
+            trans.undeclared = 1
+        
+        self.assertIsInstance(trans.id, int)
+        self.assertLess(trans.id, entity.id)
+        self.assertLess(entity.id, cam.id)
+        self.assertEqual(BasicTransform(id="101").id, "101")
+        
+        print("TestComponent:test_slotsAndIds() END")
 
 
 class TestComponentDecorator(unittest.TestCase):
@@ -274,7 +304,7 @@ class TestBasicTransform(unittest.TestCase):
             [0.0,1.0,0.0,2.0],
             [0.0,0.0,1.0,3.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertEqual(myComponent.name, "myComponent")
         self.assertEqual(myComponent.type,"BasicTransform")
@@ -372,6 +402,45 @@ class TestCamera(unittest.TestCase):
         
         print("TestCamera:test_update() END")
 
+    def test_projectionCache(self):
+        """
+        Camera keeps its projection parameters and rebuilds projMat and its inverse only when one changes
+        """
+        print("TestCamera:test_projectionCache START".center(100, '-'))
+        
+        cam = Camera(fovy=60.0, aspect=4.0/3.0, near=0.1, far=100.0)
+        self.assertEqual(cam.projection, "perspective")
+        np.testing.assert_array_almost_equal(cam.projMat, util.perspective(60.0, 4.0/3.0, 0.1, 100.0))
+        projMat, invProjMat = cam.projMat, cam.invProjMat
+        np.testing.assert_array_almost_equal(invProjMat @ projMat, util.identity())
+        
+        # same parameters: nothing is rebuilt
+        cam.setPerspective(60.0, 4.0/3.0, 0.1, 100.0)
+        self.assertIs(cam.projMat, projMat)
+        self.assertIs(cam.invProjMat, invProjMat)
+        
+        # only the aspect changes, e.g. on window resize
+        cam.aspect = 16.0/9.0
+        self.assertEqual(cam.projParams, dict(fovy=60.0, aspect=16.0/9.0, near=0.1, far=100.0))
+        np.testing.assert_array_almost_equal(cam.projMat, util.perspective(60.0, 16.0/9.0, 0.1, 100.0))
+        self.assertIsNot(cam.invProjMat, invProjMat)
+        np.testing.assert_array_almost_equal(cam.invProjMat @ cam.projMat, util.identity())
+        
+        # an ortho box keeps its height and centre
+        ortho = Camera(left=-10.0, right=10.0, bottom=-5.0, top=5.0, near=1.0, far=100.0)
+        self.assertEqual(ortho.aspect, 2.0)
+        ortho.aspect = 1.0
+        np.testing.assert_array_almost_equal(ortho.projMat, util.ortho(-5.0, 5.0, -5.0, 5.0, 1.0, 100.0))
+        
+        # a matrix set directly has no parameters
+        ortho.projMat = util.identity()
+        self.assertIsNone(ortho.projection)
+        self.assertIsNone(ortho.aspect)
+        ortho.aspect = 2.0
+        np.testing.assert_array_equal(ortho.projMat, util.identity())
+        
+        print("TestCamera:test_projectionCache END".center(100, '-'))
+
 if __name__ == "__main__":
     unittest.main(argv=[''], verbosity=3, exit=False)
         
\ No newline at end of file
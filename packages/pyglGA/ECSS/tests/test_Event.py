@@ -9,19 +9,31 @@ glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
 
 import unittest
 import time
+import asyncio
+import threading
 import numpy as np
 
 import pyglGA.ECSS.utilities as util
 from pyglGA.ECSS.System import System, TransformSystem, CameraSystem
 from pyglGA.ECSS.Entity import Entity
 from pyglGA.ECSS.Component import BasicTransform, Camera, RenderMesh
-from pyglGA.ECSS.Event import Event, EventManager
+from pyglGA.ECSS.Event import Event, EventManager, EventPool, TRSEvent, MouseMotionEvent, BUILTIN_IDS
 from pyglGA.GUI.Viewer import SDL2Window, ImGUIDecorator, RenderGLStateSystem
+from pyglGA.GUI.RenderWindow import HeadlessWindow
 from pyglGA.ECSS.ECSSManager import ECSSManager
 from pyglGA.ext.Shader import InitGLShaderSystem, Shader, ShaderGLDecorator, RenderGLShaderSystem
 from pyglGA.ext.VertexArray import VertexArray
 from pyglGA.ext.Scene import Scene
 
+class RecordingSystem(System):
+    """ actuator System that records the (RenderWindow, Event value) pairs it is applied to """
+    def __init__(self, name=None):
+        super().__init__(name)
+        self.received = []
+    def apply2RenderWindow(self, renderWindow, event = None):
+        self.received.append((renderWindow, event.value))
+
+
 class TestEvent(unittest.TestCase):
     
     def setUp(self):
@@ -116,7 +128,7 @@ class TestEvent(unittest.TestCase):
             [0.0,1.0,0.0,20.0],
             [0.0,0.0,1.0,30.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertEqual(mT.tolist(), e.value.tolist())
         self.assertEqual(e.name, "OnUpdate")
@@ -132,6 +144,285 @@ class TestEvent(unittest.TestCase):
         print("TestEvent:test_init END".center(100, '-'))
         
         
+    def test_dispatch(self):
+        """EventManager routes an Event to all its subscribers once per actuator, until they unsubscribe
+        """
+        print("TestEvent:test_dispatch START".center(100, '-'))
+        
+        eManager = EventManager()
+        window1, window2 = HeadlessWindow(eventManager=eManager), HeadlessWindow(eventManager=eManager)
+        actuator1, actuator2 = RecordingSystem("actuator1"), RecordingSystem("actuator2")
+        
+        updateTRS = Event(name="OnUpdateTRS", id=100, value=1)
+        self.assertEqual(eManager.registerEvent(updateTRS), 100)
+        eManager.subscribe(updateTRS, window1)
+        eManager.subscribe("OnUpdateTRS", window2)
+        eManager.actuate("OnUpdateTRS", actuator1)
+        eManager.actuate(updateTRS, actuator2)
+        eManager.notify(window1, updateTRS)
+        self.assertEqual(actuator1.received, [(window1, 1), (window2, 1)])
+        self.assertEqual(actuator2.received, [(window1, 1), (window2, 1)])
+        
+        # unsubscribed and unknown Events reach nobody
+        eManager.unsubscribe(updateTRS, window1)
+        eManager.unactuate("OnUpdateTRS", actuator2)
+        updateTRS.value = 2
+        eManager.notify(window1, updateTRS)
+        eManager.notify(window1, Event(name="OnUnknown", id=999, value=3))
+        self.assertEqual(actuator1.received[2:], [(window2, 2)])
+        self.assertEqual(len(actuator2.received), 2)
+        
+        # Events without id get the next free one, ids are unique per EventManager
+        updateBackground = Event(name="OnUpdateBackground", id=None, value=None)
+        self.assertEqual(eManager.registerEvent(updateBackground), 101)
+        with self.assertRaises(ValueError):
+            eManager.registerEvent(Event(name="OnOther", id=100, value=None))
+        
+        # an ad-hoc Event sharing a registered id is routed by its own name
+        eManager.notify(window1, Event(name="OnAdHoc", id=100, value=4))
+        self.assertEqual(len(actuator1.received), 3)
+        
+        # built-in Events use reserved ids: apps keep theirs, e.g. 100 for OnOther in a world
+        world = Scene().world
+        self.assertEqual(world.eventManager.getEvent(TRSEvent.NAME).id, BUILTIN_IDS)
+        self.assertEqual(world.eventManager.registerEvent(Event(name="OnOther", id=100, value=None)), 100)
+        self.assertEqual(world.eventManager.registerEvent(Event(name="OnAuto", id=None, value=None)), 101)
+        
+        print("TestEvent:test_dispatch END".center(100, '-'))
+    
+    def test_queue(self):
+        """posted Events are coalesced, bounded and dispatched in posting order by drain()
+        """
+        print("TestEvent:test_queue START".center(100, '-'))
+        
+        eManager = self.scene.world.eventManager
+        window = HeadlessWindow(eventManager=eManager)
+        actuator = RecordingSystem("actuator")
+        updateTRS = Event(name="OnUpdateTRS", id=100, value=None)
+        updateBackground = Event(name="OnUpdateBackground", id=200, value=None)
+        for event in (updateTRS, updateBackground):
+            eManager.subscribe(event, window)
+            eManager.actuate(event, actuator)
+        
+        # a slider drag: many OnUpdateTRS per Entity, only the latest value per Entity is kept
+        for value in range(100):
+            updateTRS.value = ("node4", value)
+            eManager.post(window, updateTRS, key=self.node4)
+            updateTRS.value = ("entityCam1", value)
+            eManager.post(window, updateTRS, key=self.entityCam1)
+        updateBackground.value = "black"
+        eManager.post(window, updateBackground)
+        self.assertEqual(actuator.received, [])
+        self.assertEqual(eManager.queued, 3)
+        
+        # ECSSManager.tick() drains the queue before running the Systems
+        self.scene.world.tick(0.1)
+        self.assertEqual([value for _, value in actuator.received], [("node4", 99), ("entityCam1", 99), "black"])
+        self.assertEqual(eManager.queued, 0)
+        
+        # bounded capacity and per drain budget
+        eManager.maxQueued = 2
+        for colour in ("red", "green", "blue"):
+            eManager.post(window, Event("OnUpdateBackground", 200, colour), key=colour)
+        self.assertEqual(eManager.dropped, 1)
+        self.assertEqual(eManager.drain(maxEvents=1), 1)
+        self.assertEqual(actuator.received[-1][1], "green")
+        self.assertEqual(eManager.drain(), 1)
+        self.assertEqual(actuator.received[-1][1], "blue")
+        
+        dropNewest = EventManager(maxQueued=1, overflow=EventManager.DROP_NEWEST)
+        self.assertTrue(dropNewest.post(window, Event("A", 1, None), key="a"))
+        self.assertFalse(dropNewest.post(window, Event("B", 2, None)))
+        self.assertTrue(dropNewest.post(window, Event("A", 1, "latest"), key="a"))
+        backPressure = EventManager(maxQueued=1, overflow=EventManager.RAISE)
+        backPressure.post(window, Event("A", 1, None))
+        with self.assertRaises(OverflowError):
+            backPressure.post(window, Event("B", 2, None))
+        
+        # without a key nothing is coalesced, and array values are snapshots
+        colour = np.array([0.0, 0.0, 0.0, 1.0])
+        for red in (0.25, 0.5):
+            colour[0] = red
+            eManager.post(window, Event("OnUpdateBackground", 200, colour))
+        self.assertEqual(eManager.drain(), 2)
+        self.assertEqual([value[0] for _, value in actuator.received[-2:]], [0.25, 0.5])
+        
+        # a failing actuator loses only its own Event, the rest of the batch stays queued
+        failing = RecordingSystem("failing")
+        def fail(renderWindow, event = None):
+            if event.value == "bad":
+                raise RuntimeError("actuator failed")
+        failing.apply2RenderWindow = fail
+        eManager.actuate("OnUpdateBackground", failing)
+        eManager.maxQueued = 1024
+        pool = eManager.getPool(TRSEvent)
+        for value in ("bad", "white", "grey"):
+            eManager.post(window, Event("OnUpdateBackground", 200, value))
+        eManager.post(window, pool.acquire().set(self.node4, util.identity()), key=self.node4)
+        with self.assertRaises(RuntimeError):
+            eManager.drain()
+        self.assertEqual(eManager.queued, 3)
+        self.assertEqual(eManager.drain(), 3)
+        self.assertEqual([value for _, value in actuator.received[-3:-1]], ["white", "grey"])
+        self.assertEqual(pool.free, pool.created)
+        eManager.unactuate("OnUpdateBackground", failing)
+        
+        print("TestEvent:test_queue END".center(100, '-'))
+    
+    def test_threadedPost(self):
+        """Events posted from worker threads and asyncio loops are delivered on the world thread by drain()
+        """
+        print("TestEvent:test_threadedPost START".center(100, '-'))
+        
+        eManager = EventManager(maxQueued=10000)
+        window = HeadlessWindow(eventManager=eManager)
+        actuator = RecordingSystem("actuator")
+        delivered = set()
+        actuator.apply2RenderWindow = lambda renderWindow, event = None: delivered.add((event.value, threading.get_ident()))
+        network = Event(name="OnNetworkMessage", id=300, value=None)
+        eManager.subscribe(network, window)
+        eManager.actuate(network, actuator)
+        
+        def worker(index):
+            event = Event("OnNetworkMessage", 300, None)
+            for i in range(500):
+                event.value = (index, i)
+                eManager.postThreadsafe(self, event, key=event.value)
+        
+        async def client():
+            for i in range(500):
+                await eManager.postAsync(self, Event("OnNetworkMessage", 300, ("async", i)), key=("async", i))
+        
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+        threads.append(threading.Thread(target=asyncio.run, args=(client(),)))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(delivered, set())
+        self.assertEqual(eManager.queued, 2500)
+        self.assertEqual(eManager.drain(), 2500)
+        self.assertEqual(len(delivered), 2500)
+        self.assertEqual({ident for _, ident in delivered}, {threading.get_ident()})
+        
+        # inbox Events that do not fit are dropped and counted, never raised on the world thread
+        backPressure = EventManager(maxQueued=1, overflow=EventManager.RAISE)
+        backPressure.postThreadsafe(self, Event("A", 1, None))
+        backPressure.postThreadsafe(self, Event("B", 2, None))
+        self.assertEqual(backPressure.drain(), 1)
+        self.assertEqual(backPressure.dropped, 1)
+        
+        print("TestEvent:test_threadedPost END".center(100, '-'))
+    
+    def test_pooledEvents(self):
+        """typed PooledEvents are recycled after dispatch, coalescing and dropping, without new allocations
+        """
+        print("TestEvent:test_pooledEvents START".center(100, '-'))
+        
+        eManager = EventManager(maxQueued=2, overflow=EventManager.DROP_NEWEST)
+        window = HeadlessWindow(eventManager=eManager)
+        actuator = RecordingSystem("actuator")
+        received = []
+        actuator.apply2RenderWindow = lambda renderWindow, event = None: received.append((event.entity, event.trs.copy()))
+        eManager.subscribe(TRSEvent.NAME, window)
+        eManager.actuate(TRSEvent.NAME, actuator)
+        
+        with self.assertRaises(AttributeError):
+            Event("OnUpdateBackground", 200, None).colour = "black"
+        
+        pool = eManager.getPool(TRSEvent)
+        self.assertIs(eManager.getPool(TRSEvent), pool)
+        trs = util.translate(1.0, 2.0, 3.0)
+        for frame in range(10):
+            for value in range(5):
+                trs[0,3] = value
+                eManager.post(window, pool.acquire().set(self.node4, trs), key=self.node4)
+            eManager.post(window, pool.acquire().set(self.entityCam1, trs), key=self.entityCam1)
+            eManager.post(window, pool.acquire().set(self.node4, trs), key="dropped")
+            eManager.drain()
+        # coalesced, dropped and dispatched Events all went back to the pool: at most 3 were ever alive
+        self.assertEqual(pool.created, 3)
+        self.assertEqual(pool.free, 3)
+        self.assertEqual(eManager.dropped, 10)
+        self.assertEqual(len(received), 20)
+        self.assertIs(received[0][0], self.node4)
+        np.testing.assert_array_equal(received[0][1], util.translate(4.0, 2.0, 3.0))
+        self.assertEqual(received[0][1].dtype, np.float32)
+        
+        # a PooledEvent that is not acquired is copied like any Event, payload included
+        owned = TRSEvent().set(self.node4, trs)
+        eManager.post(window, owned, key=self.node4)
+        owned.trs[...] = 0.0
+        eManager.drain()
+        np.testing.assert_array_equal(received[-1][1], trs)
+        
+        mousePool = EventPool(MouseMotionEvent, capacity=2)
+        event = mousePool.acquire().set(10, 20, dx=1, dy=-1)
+        self.assertEqual((event.name, event.x, event.dy, mousePool.free), ("OnMouseMotion", 10, -1, 1))
+        mousePool.release(event)
+        mousePool.release(event)
+        self.assertEqual(mousePool.free, 2)
+        
+        print("TestEvent:test_pooledEvents END".center(100, '-'))
+    
+    def test_updateTRS(self):
+        """the built-in OnUpdateTRS route writes one coalesced trs per Entity and recalculates only its subtree
+        """
+        print("TestEvent:test_updateTRS START".center(100, '-'))
+        
+        world = self.scene.world
+        transUpdate = world.createSystem(TransformSystem("trsTick"), scheduled=True)
+        world.tick(0.1)
+        self.assertEqual(transUpdate.recomputed, 3)
+        world.tick(0.1)
+        self.assertEqual(transUpdate.recomputed, 0)
+        
+        # a slider drag: many updates of entityCam1 within one frame, written once by the next tick
+        for x in range(50):
+            self.assertTrue(world.updateTRS(self.entityCam1, util.translate(float(x), 0.0, 0.0)))
+        np.testing.assert_array_equal(self.trans1.trs, util.identity())
+        self.assertEqual(world.eventManager.queued, 1)
+        world.tick(0.1)
+        np.testing.assert_array_almost_equal(self.trans1.trs, util.translate(49.0, 0.0, 0.0))
+        np.testing.assert_array_almost_equal(self.trans2.l2world, util.translate(49.0, 0.0, 0.0))
+        # entityCam1 and its child entityCam2, not node4
+        self.assertEqual(transUpdate.recomputed, 2)
+        self.assertFalse(self.trans4.dirty)
+        
+        # handles, BasicTransforms and pooled TRSEvents posted from another thread
+        world.updateTRS(self.node4.handle, util.translate(0.0, 4.0, 0.0))
+        world.updateTRS(self.trans2, util.translate(0.0, 0.0, 2.0))
+        event = world.eventManager.getPool(TRSEvent).acquire().set(self.node4, util.translate(0.0, 5.0, 0.0))
+        worker = threading.Thread(target=world.eventManager.postThreadsafe, args=(self, event), kwargs={"key": self.trans4})
+        worker.start()
+        worker.join()
+        world.tick(0.1)
+        np.testing.assert_array_almost_equal(self.trans4.l2world, util.translate(0.0, 5.0, 0.0))
+        np.testing.assert_array_almost_equal(self.trans2.l2world, util.translate(49.0, 0.0, 2.0))
+        self.assertEqual(transUpdate.recomputed, 2)
+        self.assertEqual(world.eventManager.getPool(TRSEvent).created, world.eventManager.getPool(TRSEvent).free)
+        
+        # one Entity addressed by handle, Entity and BasicTransform is coalesced into one write of the latest trs
+        world.updateTRS(self.node4.handle, util.translate(1.0, 0.0, 0.0))
+        world.updateTRS(self.trans4, util.translate(2.0, 0.0, 0.0))
+        world.updateTRS(self.node4, util.translate(2.5, 0.0, 0.0))
+        world.updateTRS(self.trans4.handle, util.translate(3.0, 0.0, 0.0))
+        self.assertEqual(world.eventManager.queued, 1)
+        world.tick(0.1)
+        self.assertEqual(self.trans4.trs[0,3], 3.0)
+        self.assertFalse(world.updateTRS(self.rootEntity, util.identity()))
+        
+        # handles stored in numpy arrays are numpy integers
+        handles = np.array([self.node4.handle, self.entityCam1.handle], dtype=np.uint64)
+        world.updateTRS(handles[0], util.translate(0.0, 6.0, 0.0))
+        world.updateTRS(handles[1], util.translate(7.0, 0.0, 0.0))
+        world.tick(0.1)
+        np.testing.assert_array_almost_equal(self.trans4.l2world, util.translate(0.0, 6.0, 0.0))
+        np.testing.assert_array_almost_equal(self.trans1.l2world, util.translate(7.0, 0.0, 0.0))
+        
+        print("TestEvent:test_updateTRS END".center(100, '-'))
+    
     @unittest.skip("test_notify_ImGUIDecorator() is not using ECSS, skipping the test")    
     def test_notify_ImGUIDecorator(self):
         """simple Event notification from GUI
@@ -150,18 +441,18 @@ class TestEvent(unittest.TestCase):
         updateTRS = Event(name="OnUpdateTRS", id=100, value=None)
         updateBackground = Event(name="OnUpdateBackground", id=200, value=None)
         #updateWireframe = Event(name="OnUpdateWireframe", id=201, value=None)
-        eManager._events[updateTRS.name] = updateTRS
-        eManager._events[updateBackground.name] = updateBackground
+        eManager.registerEvent(updateTRS)
+        eManager.registerEvent(updateBackground)
         
-        eManager._subscribers[updateTRS.name] = gGUI
-        eManager._subscribers[updateBackground.name] = gGUI
+        eManager.subscribe(updateTRS, gGUI)
+        eManager.subscribe(updateBackground, gGUI)
         # this is a special case below:
         # this event is published in ImGUIDecorator and the subscriber is SDLWindow
-        eManager._subscribers['OnUpdateWireframe'] = gWindow
-        eManager._actuators['OnUpdateWireframe'] = renderGLEventActuator
+        eManager.subscribe('OnUpdateWireframe', gWindow)
+        eManager.actuate('OnUpdateWireframe', renderGLEventActuator)
         
         # Add RenderWindow to the EventManager publishers
-        eManager._publishers[updateBackground.name] = gGUI
+        eManager.publish(updateBackground, gGUI)
         
         gGUI.init() #calls ImGUIDecorator::init()-->SDL2Window::init()
         gGUI.wrapeeWindow.eventManager.print()
@@ -272,24 +563,20 @@ class TestEvent(unittest.TestCase):
         updateTRS = Event(name="OnUpdateTRS", id=100, value=None)
         updateBackground = Event(name="OnUpdateBackground", id=200, value=None)
         #updateWireframe = Event(name="OnUpdateWireframe", id=201, value=None)
-        eManager._events[updateTRS.name] = updateTRS
-        eManager._events[updateBackground.name] = updateBackground
-        #eManager._events[updateWireframe.name] = updateWireframe # this is added inside ImGUIDecorator
+        eManager.registerEvent(updateTRS)
+        eManager.registerEvent(updateBackground)
+        #eManager.registerEvent(updateWireframe) # this is added inside ImGUIDecorator
         
         # Add RenderWindow to the EventManager subscribers
-        # @GPTODO
-        # values of these Dicts below should be List items, not objects only 
-        #   use subscribe(), publish(), actuate() methhods
-        #
-        eManager._subscribers[updateTRS.name] = gGUI
-        eManager._subscribers[updateBackground.name] = gGUI
+        eManager.subscribe(updateTRS, gGUI)
+        eManager.subscribe(updateBackground, gGUI)
         # this is a special case below:
         # this event is published in ImGUIDecorator and the subscriber is SDLWindow
-        eManager._subscribers['OnUpdateWireframe'] = gWindow
-        eManager._actuators['OnUpdateWireframe'] = renderGLEventActuator
+        eManager.subscribe('OnUpdateWireframe', gWindow)
+        eManager.actuate('OnUpdateWireframe', renderGLEventActuator)
         
         # Add RenderWindow to the EventManager publishers
-        eManager._publishers[updateBackground.name] = gGUI
+        eManager.publish(updateBackground, gGUI)
         
         while running:
             running = self.scene.render(running)
@@ -0,0 +1,85 @@
+"""
+Test Handle Unit tests, part of the glGA SDK ECSS
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+"""
+
+import unittest
+
+from pyglGA.ECSS.Entity import Entity
+from pyglGA.ECSS.Component import BasicTransform
+from pyglGA.ECSS.Handle import HandleTable
+from pyglGA.ECSS.ECSSManager import ECSSManager
+
+
+class TestHandleTable(unittest.TestCase):
+
+    def test_handles(self):
+        """
+        Handles resolve in O(1) and become stale when their slot is reused
+        """
+        print("TestHandleTable:test_handles START".center(100, '-'))
+
+        table = HandleTable()
+        a, b = Entity(name="a"), Entity(name="b")
+        ha = table.create(a)
+        hb = table.create(b)
+        self.assertEqual(len(table), 2)
+        self.assertIs(table.resolve(ha), a)
+        self.assertIs(table.resolve(hb), b)
+        self.assertEqual(HandleTable.index(hb), 1)
+        self.assertEqual(HandleTable.generation(hb), 0)
+
+        self.assertTrue(table.destroy(ha))
+        self.assertFalse(table.destroy(ha))
+        self.assertIsNone(table.resolve(ha))
+        self.assertFalse(table.isAlive(ha))
+
+        # the slot is reused with a new generation
+        c = Entity(name="c")
+        hc = table.create(c)
+        self.assertEqual(HandleTable.index(hc), HandleTable.index(ha))
+        self.assertEqual(HandleTable.generation(hc), 1)
+        self.assertIs(table.resolve(hc), c)
+        self.assertIsNone(table.resolve(ha))
+        self.assertFalse(table.isAlive(None))
+
+        print("TestHandleTable:test_handles END".center(100, '-'))
+
+    def test_ECSSManagerHandles(self):
+        """
+        ECSSManager gives handles to its Entities and Components and detects stale ones
+        """
+        print("TestHandleTable:test_ECSSManagerHandles START".center(100, '-'))
+
+        world = ECSSManager()
+        root = world.createEntity(Entity(name="root"))
+        node = world.createEntity(Entity(name="node"))
+        world.addEntityChild(root, node)
+        trans = world.addComponent(node, BasicTransform(name="trans"))
+        crowd = world.createEntities([-1, 0], trs=[BasicTransform().trs, BasicTransform().trs])
+
+        self.assertIs(world.resolve(node.handle), node)
+        self.assertIs(world.resolve(trans.handle), trans)
+        self.assertIs(world.resolve(crowd[1].handle), crowd[1])
+        self.assertIs(world.resolve(crowd[1].getChildByType("BasicTransform").handle), crowd[1].getChildByType("BasicTransform"))
+
+        nodeHandle, transHandle = node.handle, trans.handle
+        world.destroyEntity(node)
+        self.assertIsNone(node.handle)
+        self.assertFalse(world.isAlive(nodeHandle))
+        self.assertIsNone(world.resolve(transHandle))
+
+        # replaced Components lose their handle
+        replacedHandle = crowd[0].getChildByType("BasicTransform").handle
+        trans2 = world.addComponent(crowd[0], BasicTransform(name="trans2"))
+        self.assertIsNone(world.resolve(replacedHandle))
+        self.assertIs(world.resolve(trans2.handle), trans2)
+
+        print("TestHandleTable:test_ECSSManagerHandles END".center(100, '-'))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[''], verbosity=3, exit=False)
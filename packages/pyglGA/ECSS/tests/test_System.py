@@ -60,21 +60,21 @@ class TestTransformSystem(unittest.TestCase):
             [0.0,1.0,0.0,2.0],
             [0.0,0.0,1.0,3.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         mT2 = np.array([
             [1.0,0.0,0.0,2.0],
             [0.0,1.0,0.0,3.0],
             [0.0,0.0,1.0,4.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         mTf = np.array([
             [1.0,0.0,0.0,3.0],
             [0.0,1.0,0.0,5.0],
             [0.0,0.0,1.0,7.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         myComponent.l2world = mT
         
@@ -121,6 +121,153 @@ class TestTransformSystem(unittest.TestCase):
         
         print("TestTransformSystem:test_getLocal2World() END")
         
+    def test_getLocal2WorldBatched(self):
+        """
+        TransformSystem batched l2world propagation per hierarchy level
+        """
+        print("TestTransformSystem:test_getLocal2WorldBatched() START")
+        root = Entity("root", "Entity", "0")
+        node1 = Entity("node1", "Entity", "1")
+        node2 = Entity("node2", "Entity", "2")
+        node3 = Entity("node3", "Entity", "3")
+        node4 = Entity("node4", "Entity", "4")
+        transRoot = BasicTransform("transRoot", "BasicTransform", trs=util.scale(2.0))
+        trans1 = BasicTransform("trans1", "BasicTransform", trs=util.translate(1.0, 2.0, 3.0))
+        trans3 = BasicTransform("trans3", "BasicTransform", trs=util.rotate((0.0, 1.0, 0.0), 45.0))
+        trans4 = BasicTransform("trans4", "BasicTransform", trs=util.translate(4.0, 0.0, 0.0))
+        """ Scenegraph
+        root, transRoot
+            |-----------|
+            node1,      node4, trans4
+            |   
+            node2 (no BasicTransform), trans1
+                |       
+                node3, trans3
+        """
+        root.add(transRoot)
+        root.add(node1)
+        root.add(node4)
+        node1.add(trans1)
+        node1.add(node2)
+        node2.add(node3)
+        node3.add(trans3)
+        node4.add(trans4)
+        
+        levels = TransformSystem(batched=True).getHierarchyLevels(root)
+        self.assertEqual([len(transforms) for transforms, parents in levels], [1, 2, 1])
+        
+        transUpdate = TransformSystem("transUpdate", "TransformSystem", "001")
+        expected = [transUpdate.getLocal2World(trans) for trans in (transRoot, trans1, trans3, trans4)]
+        np.testing.assert_array_almost_equal(expected[2], trans3.trs @ trans1.trs @ transRoot.trs)
+        
+        batchedUpdate = TransformSystem("batchedUpdate", "TransformSystem", "002", batched=True)
+        # repeated traversals must not accumulate
+        batchedUpdate.apply2Hierarchy(root)
+        batchedUpdate.apply2Hierarchy(root)
+        for trans, l2world in zip((transRoot, trans1, trans3, trans4), expected):
+            np.testing.assert_array_almost_equal(trans.l2world, l2world)
+        
+        # a sub-hierarchy takes its ancestors into account
+        trans3.l2world = util.identity()
+        trans3.markDirty()
+        batchedUpdate.apply2Hierarchy(node2)
+        np.testing.assert_array_almost_equal(trans3.l2world, expected[2])
+        
+        print("TestTransformSystem:test_getLocal2WorldBatched() END")
+        
+    def test_dirtyTransforms(self):
+        """
+        TransformSystem only recalculates BasicTransforms whose trs, or an ancestor's trs, changed
+        """
+        print("TestTransformSystem:test_dirtyTransforms() START")
+        root = Entity("root", "Entity", "0")
+        node1 = Entity("node1", "Entity", "1")
+        node2 = Entity("node2", "Entity", "2")
+        node3 = Entity("node3", "Entity", "3")
+        trans1 = BasicTransform("trans1", "BasicTransform", trs=util.translate(1.0, 0.0, 0.0))
+        trans2 = BasicTransform("trans2", "BasicTransform", trs=util.translate(0.0, 2.0, 0.0))
+        trans3 = BasicTransform("trans3", "BasicTransform", trs=util.translate(0.0, 0.0, 3.0))
+        """ Scenegraph
+        root
+            |-----------|
+            node1,      node3, trans3
+            |   
+            node2, trans1
+                |       
+                trans2
+        """
+        root.add(node1)
+        root.add(node3)
+        node1.add(trans1)
+        node1.add(node2)
+        node2.add(trans2)
+        node3.add(trans3)
+        
+        for batched in (False, True):
+            transUpdate = TransformSystem("transUpdate", "TransformSystem", "001", batched=batched)
+            for trans in (trans1, trans2, trans3):
+                trans.markDirty()
+            
+            self.assertTrue(trans2.dirty)
+            self.assertEqual(self._traverse(transUpdate, root), 3)
+            self.assertFalse(trans2.dirty)
+            # nothing moved
+            self.assertEqual(self._traverse(transUpdate, root), 0)
+            
+            # parent moved: its subtree is recalculated only
+            trans1.trs = util.translate(5.0, 0.0, 0.0)
+            self.assertTrue(trans2.dirty)
+            self.assertFalse(trans3.dirty)
+            self.assertEqual(self._traverse(transUpdate, root), 2)
+            np.testing.assert_array_almost_equal(trans2.l2world, util.translate(5.0, 2.0, 0.0))
+            
+            # re-parenting flags the moved subtree
+            node1.remove(node2)
+            node3.add(node2)
+            self.assertEqual(self._traverse(transUpdate, root), 1)
+            np.testing.assert_array_almost_equal(trans2.l2world, util.translate(0.0, 2.0, 3.0))
+            node3.remove(node2)
+            node1.add(node2)
+            trans1.trs = util.translate(1.0, 0.0, 0.0)
+        
+        print("TestTransformSystem:test_dirtyTransforms() END")
+    
+    def test_dirtySubtreeTraversal(self):
+        """
+        a traversal from a child Entity does not lose the dirty flags of its ancestors' later changes
+        """
+        print("TestTransformSystem:test_dirtySubtreeTraversal() START")
+        for batched in (False, True):
+            root = Entity("root", "Entity", "0")
+            a = Entity("a", "Entity", "1")
+            transRoot = BasicTransform("transRoot", "BasicTransform", trs=util.identity())
+            transA = BasicTransform("transA", "BasicTransform", trs=util.translate(1.0, 0.0, 0.0))
+            root.add(transRoot)
+            root.add(a)
+            a.add(transA)
+            transUpdate = TransformSystem("transUpdate", "TransformSystem", "001", batched=batched)
+            self._traverse(transUpdate, root)
+            
+            transRoot.trs = util.translate(10.0, 0.0, 0.0)
+            self._traverse(transUpdate, a)
+            np.testing.assert_array_almost_equal(transA.l2world, util.translate(11.0, 0.0, 0.0))
+            transRoot.trs = util.translate(100.0, 0.0, 0.0)
+            self._traverse(transUpdate, root)
+            np.testing.assert_array_almost_equal(transA.l2world, util.translate(101.0, 0.0, 0.0))
+            self.assertFalse(transA.dirty)
+            self.assertEqual(self._traverse(transUpdate, root), 0)
+        print("TestTransformSystem:test_dirtySubtreeTraversal() END")
+    
+    def _traverse(self, system, root):
+        system.startTraversal(root)
+        if system.batched:
+            system.apply2Hierarchy(root)
+        else:
+            for comp in root:
+                if comp is not None:
+                    comp.accept(system)
+        return system.recomputed
+        
     def test_TransformSystem_use(self):
         """
         TransformSystem() use case test
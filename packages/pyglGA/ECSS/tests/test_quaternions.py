@@ -0,0 +1,87 @@
+"""
+Test quaternions Unit tests, part of the glGA SDK ECSS
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+"""
+
+import unittest
+import numpy as np
+
+import pyglGA.ECSS.utilities as util
+import pyglGA.ECSS.quaternions as quat
+
+
+class TestQuaternions(unittest.TestCase):
+    """ batched quaternion functions against their scalar utilities counterparts """
+
+    def setUp(self):
+        rng = np.random.default_rng(11)
+        self.n = 32
+        self.q0 = rng.normal(size=(self.n, 4))
+        self.q1 = rng.normal(size=(self.n, 4))
+        self.fractions = rng.uniform(0.0, 1.0, self.n)
+
+    def test_mulAndMatrix(self):
+        """
+        mul, normalise and to_matrix agree with quaternion_mul, normalise and quaternion_matrix
+        """
+        print("TestQuaternions:test_mulAndMatrix START".center(100, '-'))
+
+        products = quat.mul(self.q0, self.q1)
+        units = quat.normalise(self.q0)
+        mats = quat.to_matrix(self.q0)
+        self.assertEqual(mats.shape, (self.n, 4, 4))
+        for i in range(self.n):
+            np.testing.assert_array_almost_equal(products[i], util.quaternion_mul(self.q0[i], self.q1[i]))
+            np.testing.assert_array_almost_equal(units[i], util.normalise(self.q0[i]))
+            np.testing.assert_array_almost_equal(mats[i], util.quaternion_matrix(self.q0[i]))
+
+        # a single quaternion broadcasts against N
+        np.testing.assert_array_almost_equal(quat.mul(self.q0[0], self.q1), [util.quaternion_mul(self.q0[0], q) for q in self.q1])
+        np.testing.assert_array_equal(quat.normalise(np.zeros(4)), np.zeros((1, 4)))
+
+        print("TestQuaternions:test_mulAndMatrix END".center(100, '-'))
+
+    def test_fromMatrix(self):
+        """
+        from_matrix inverts to_matrix, up to the sign of the quaternion, on every branch
+        """
+        print("TestQuaternions:test_fromMatrix START".center(100, '-'))
+
+        # random rotations plus 180 degree turns around x, y, z that need the m00, m11, m22 branches
+        q = np.vstack([self.q0, [[0.0, 1.0, 0.0, 0.0], [0.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 1.0]]])
+        mats = quat.to_matrix(q)
+        back = quat.from_matrix(mats)
+        np.testing.assert_array_almost_equal(quat.to_matrix(back), mats)
+        dots = np.abs(np.einsum('ij,ij->i', back, quat.normalise(q)))
+        np.testing.assert_array_almost_equal(dots, np.ones(len(q)))
+        np.testing.assert_array_almost_equal(quat.from_matrix(mats[:, :3, :3]), back)
+
+        print("TestQuaternions:test_fromMatrix END".center(100, '-'))
+
+    def test_slerpAndNlerp(self):
+        """
+        slerp agrees with quaternion_slerp, including near-parallel and opposite hemisphere pairs
+        """
+        print("TestQuaternions:test_slerpAndNlerp START".center(100, '-'))
+
+        q1 = self.q1.copy()
+        q1[0] = self.q0[0] * 2.0 + 1e-4                  # near-parallel: normalised lerp branch
+        q1[1] = -self.q0[1] + 0.1                         # opposite hemisphere: reversed q1
+        slerped = quat.slerp(self.q0, q1, self.fractions)
+        for i in range(self.n):
+            np.testing.assert_array_almost_equal(slerped[i], util.quaternion_slerp(self.q0[i], q1[i], self.fractions[i]))
+        np.testing.assert_array_almost_equal(np.linalg.norm(slerped, axis=1), np.ones(self.n))
+        np.testing.assert_array_almost_equal(quat.slerp(self.q0, q1, 0.0), quat.normalise(self.q0))
+
+        nlerped = quat.nlerp(self.q0, self.q1, self.fractions)
+        np.testing.assert_array_almost_equal(np.linalg.norm(nlerped, axis=1), np.ones(self.n))
+        np.testing.assert_array_almost_equal(quat.nlerp(self.q0, -self.q0, 0.5), quat.normalise(self.q0))
+
+        print("TestQuaternions:test_slerpAndNlerp END".center(100, '-'))
+
+
+if __name__ == "__main__":
+    unittest.main(argv=[''], verbosity=3, exit=False)
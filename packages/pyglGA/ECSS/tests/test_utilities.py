@@ -23,7 +23,7 @@ class TestUtilities(unittest.TestCase):
         print("\nTestUtilities:test_vec() START")
         a = [1.0,0.0,0.0,1.0]
         vec_a = vec(a)  
-        np_a = np.array([1.0,0.0,0.0,1.0],dtype=np.float,order='F')
+        np_a = np.array([1.0,0.0,0.0,1.0],dtype=np.float64,order='F')
         
         self.assertEqual(vec_a.tolist(), np_a.tolist())
         np.testing.assert_array_equal(vec_a,np_a)
@@ -41,8 +41,8 @@ class TestUtilities(unittest.TestCase):
         vec_a = vec(a)  
         norm_vec = normalise(vec_a)
         norm_a = normalise(a) # in this case the simple list will be converted to numpy array first implicitly
-        np_a = np.array([2.0,2.0,0.0,1.0],dtype=np.float,order='F')
-        norm_np = np.array([0.666667,0.666667,0.0,0.333333],dtype=np.float,order='F')
+        np_a = np.array([2.0,2.0,0.0,1.0],dtype=np.float64,order='F')
+        norm_np = np.array([0.666667,0.666667,0.0,0.333333],dtype=np.float64,order='F')
         
         self.assertAlmostEqual(norm_vec.all(), norm_np.all())
         self.assertAlmostEqual(norm_a.all(), norm_np.all())
@@ -85,7 +85,7 @@ class TestUtilities(unittest.TestCase):
             [0.0,1.0,0.0,0.0],
             [0.0,0.0,1.0,0.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertEqual(matI.tolist(), np_i4.tolist())
         self.assertEqual(matI.tolist(), np_i.tolist())
@@ -108,14 +108,14 @@ class TestUtilities(unittest.TestCase):
             [0,1,0,2],
             [0,0,1,3],
             [0,0,0,1]
-        ],dtype=np.float,order='F') 
+        ],dtype=np.float64,order='F') 
         
         mLatInv = np.array([
             [1,0,0,-1],
             [0,1,0,-2],
             [0,0,1,-3],
             [0,0,0,1]
-        ],dtype=np.float,order='F') 
+        ],dtype=np.float64,order='F') 
         
         utilmLatInv = inverse(mLat)
         np.testing.assert_array_almost_equal(utilmLatInv,mLatInv,decimal=5)
@@ -126,6 +126,31 @@ class TestUtilities(unittest.TestCase):
     
         print("TestUtilities:test_inverse() END")
     
+    def test_inverseAffine(self):
+        """
+        test_inverseAffine: closed-form affine/rigid inverse against the general inverse
+        """
+        print("\nTestUtilities:test_inverseAffine() START")
+        
+        rigidMat = translate(1.0, 2.0, 3.0) @ rotate((1.0, 1.0, 0.0), 30.0)
+        affineMat = rigidMat @ scale(2.0, 3.0, 4.0)
+        projMat = perspective(45.0, 1.5, 0.1, 100.0)
+        singularMat = scale(1.0, 0.0, 1.0)
+        
+        np.testing.assert_array_almost_equal(inverse_affine(rigidMat, rigid=True), inverse(rigidMat))
+        np.testing.assert_array_almost_equal(inverse_affine(affineMat), inverse(affineMat))
+        np.testing.assert_array_almost_equal(inverse_affine(projMat), inverse(projMat))
+        self.assertEqual(inverse_affine(translate(1.0, 2.0, 3.0)).dtype, np.float32)
+        with self.assertRaises(np.linalg.LinAlgError):
+            inverse_affine(singularMat)
+        
+        stack = np.array([rigidMat, affineMat, projMat, identity()])
+        np.testing.assert_array_almost_equal(inverse_affine_batch(stack), inverse_batch(stack))
+        rigidStack = np.array([rigidMat, identity(), translate(4.0, 5.0, 6.0) @ rotate((0.0, 0.0, 1.0), 90.0)])
+        np.testing.assert_array_almost_equal(inverse_affine_batch(rigidStack, rigid=True), inverse_batch(rigidStack))
+        
+        print("TestUtilities:test_inverseAffine() END")
+    
     def test_ortho(self):
         """
         test_ortho function, 
@@ -138,7 +163,7 @@ class TestUtilities(unittest.TestCase):
             [0.0,0.01,0.0,0.0],
             [0.0,0.0,-0.020202,-1.0202],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertAlmostEqual(matOrtho.all(), np_Ortho.all())
        
@@ -159,7 +184,7 @@ class TestUtilities(unittest.TestCase):
             [0.0,1.0,0.0,0.0],
             [0.0,0.0,-1.002,-0.2002],
             [0.0,0.0,-1.0,0.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         matPersp2 = perspective(45.0, 1.33, 0.1, 100)
         np_Persp2 = np.array([
@@ -167,7 +192,7 @@ class TestUtilities(unittest.TestCase):
             [0.0,2.414,0.0,0.0],
             [0.0,0.0,-1.002,-0.2002],
             [0.0,0.0,-1.0,0.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         #self.assertAlmostEqual(matPersp.all(), np_Persp.all())
         np.testing.assert_array_almost_equal(matPersp,np_Persp,decimal=5)
@@ -190,7 +215,7 @@ class TestUtilities(unittest.TestCase):
             [0.0,0.01,0.0,0.0],
             [0.0,0.0,-1.002,-0.2002],
             [0.0,0.0,-1.0,0.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertAlmostEqual(matPersp.all(), np_Persp.all())
        
@@ -212,7 +237,7 @@ class TestUtilities(unittest.TestCase):
             [0.0,1.0,0.0,2.0],
             [0.0,0.0,1.0,3.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertEqual(matTrans.tolist(), mT.tolist())
         self.assertEqual(matTrans2.tolist(), mT.tolist())
@@ -240,13 +265,13 @@ class TestUtilities(unittest.TestCase):
             [0.0,2.0,0.0,0.0],
             [0.0,0.0,3.0,0.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         mT3 = np.array([
             [10.0,0.0,0.0,0.0],
             [0.0,10.0,0.0,0.0],
             [0.0,0.0,10.0,0.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         self.assertEqual(matTrans.tolist(), mT.tolist())
         self.assertEqual(matTrans2.tolist(), mT.tolist())
@@ -313,7 +338,7 @@ class TestUtilities(unittest.TestCase):
             [0.910684,0.333333,-0.244017,0.0],
             [-0.244017,0.910684,0.333333,0.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F')
+        ],dtype=np.float64,order='F')
         
         #self.assertAlmostEquals(matRot.all(), mR.all(),6)
         np.testing.assert_array_almost_equal(matRot,mR,decimal=6)
@@ -346,14 +371,14 @@ class TestUtilities(unittest.TestCase):
             [-0.408248,0.816497,-0.408248,-0.0],
             [-0.57735,-0.57735,-0.577353,1.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F') #glm.lookAtLH
+        ],dtype=np.float64,order='F') #glm.lookAtLH
         
         mLat2 = np.array([
             [1.0,0.0,0.0,-0.0],
             [0.0,1.0,0.0,-0.0],
             [0.0,0.0,1.0,1.0],
             [0.0,0.0,0.0,1.0],
-        ],dtype=np.float,order='F') #glm.lookAtLH
+        ],dtype=np.float64,order='F') #glm.lookAtLH
         
         #self.assertAlmostEquals(matRot.all(), mR.all(),6)
         np.testing.assert_array_almost_equal(matLookat,mLat,decimal=5)
@@ -366,6 +391,44 @@ class TestUtilities(unittest.TestCase):
     
         print("TestUtilities:test_lookat() END")
         
+    def test_batch(self):
+        """
+        test the *_batch functions against their scalar counterparts
+        """
+        print("\nTestUtilities:test_batch() START")
+        rng = np.random.default_rng(7)
+        n = 16
+        vectors = rng.uniform(-10.0, 10.0, (n, 3))
+        angles = rng.uniform(-180.0, 180.0, n)
+        eyes = rng.uniform(-10.0, 10.0, (n, 3))
+        targets = rng.uniform(-10.0, 10.0, (n, 3))
+        up = vec(0.0, 1.0, 0.0)
+        
+        matTrans = translate_batch(vectors)
+        self.assertEqual(matTrans.shape, (n, 4, 4))
+        self.assertEqual(matTrans.dtype, translate(1.0, 2.0, 3.0).dtype)
+        matScale = scale_batch(vectors)
+        matUniform = scale_batch(angles)
+        matRot = rotate_batch(vectors, angles)
+        matRotRad = rotate_batch(vec(0.0, 0.0, 1.0), radians=np.radians(angles))
+        matLookat = lookat_batch(eyes, targets, up)
+        matOrtho = ortho_batch(-vectors[:, 0] - 1.0, vectors[:, 0] + 1.0, -2.0, 2.0, 0.1, 100.0)
+        matPersp = perspective_batch(np.abs(angles) / 2.0 + 1.0, 1.5, 0.1, vectors[:, 2] + 20.0)
+        
+        for i in range(n):
+            np.testing.assert_array_almost_equal(matTrans[i], translate(vectors[i]), decimal=5)
+            np.testing.assert_array_almost_equal(matScale[i], scale(vectors[i]))
+            np.testing.assert_array_almost_equal(matUniform[i], scale(angles[i]))
+            np.testing.assert_array_almost_equal(matRot[i], rotate(vectors[i], angles[i]))
+            np.testing.assert_array_almost_equal(matRotRad[i], rotate((0.0, 0.0, 1.0), radians=np.radians(angles[i])))
+            np.testing.assert_array_almost_equal(matLookat[i], lookat(eyes[i], targets[i], up))
+            np.testing.assert_array_almost_equal(matOrtho[i], ortho(-vectors[i, 0] - 1.0, vectors[i, 0] + 1.0, -2.0, 2.0, 0.1, 100.0))
+            np.testing.assert_array_almost_equal(matPersp[i], perspective(abs(angles[i]) / 2.0 + 1.0, 1.5, 0.1, vectors[i, 2] + 20.0))
+        
+        np.testing.assert_array_almost_equal(inverse_batch(matRot @ matTrans) @ matRot @ matTrans, np.broadcast_to(identity(), (n, 4, 4)), decimal=4)
+        
+        print("TestUtilities:test_batch() END")
+    
     
     def test_quaternion(self):
         """
@@ -380,7 +443,7 @@ class TestUtilities(unittest.TestCase):
         quat_a_vec = quaternion(vec_a, 1.0)
         quat_a_vec_norm = normalise(quat_a_vec)
         
-        quat_np_a = np.array([1.0,1.0,1.0,1.0],dtype=np.float,order='F')
+        quat_np_a = np.array([1.0,1.0,1.0,1.0],dtype=np.float64,order='F')
         rot = R.from_quat(quat_np_a)
         
         quat_b = quaternion(1.0,2.0,3.0,4.0)
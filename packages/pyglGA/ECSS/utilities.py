@@ -24,7 +24,7 @@ def vec(*iterable):
     """
     return a numpy vector out of any iterable (list, tuple...) as column-major ('F')
     """
-    return np.asarray(iterable if len(iterable) > 1 else iterable[0],dtype=np.float, order='F')
+    return np.asarray(iterable if len(iterable) > 1 else iterable[0],dtype=np.float64, order='F')
 
 def normalise(vector):
     """standard vector normalization over any numpy array
@@ -64,20 +64,22 @@ def lerp(point_a, point_b, fraction):
 
 # ------------ convenience CG functions for vector, matrix and camera transformations --------------
 
-def identity(rank=4):
+def identity(rank=4, dtype=np.float64):
     """generate a numpy identity matrix
 
     :param rank: [description], defaults to 4 for 4x4 matrix, otherwise 3 for 3x3 or 2 for 2x2
     :type rank: int, optional
+    :param dtype: [element type, e.g. the ECSSManager dtype], defaults to np.float64
+    :type dtype: numpy dtype, optional
     """
     if(rank == 4):
-        return np.identity(4)
+        return np.identity(4, dtype)
     elif (rank == 3):
-        return np.identity(3)
+        return np.identity(3, dtype)
     elif (rank == 2):
-        return np.identity(2)
+        return np.identity(2, dtype)
     elif (rank < 2 and rank > 4):
-        return np.identity(4)
+        return np.identity(4, dtype)
     
 def inverse(matrix):
     """call numpy linalg.inv(a)[source] to compute the inverse of a numpy matrix
@@ -88,6 +90,36 @@ def inverse(matrix):
     if isinstance(matrix, np.ndarray):
         return inv(matrix)
     
+def inverse_affine(matrix, rigid=False):
+    """inverse of a 4x4 transform, using the closed-form affine formula when its last row is (0,0,0,1):
+    inv([A t; 0 1]) = [inv(A) -inv(A)t; 0 1], where inv(A) is the adjugate of A over its determinant, 
+    or simply the transpose of A for rigid (rotation + translation) transforms. 
+    Projective or singular matrices fall back to the general inverse().
+
+    :param matrix: [4x4 transform]
+    :type matrix: numpy array
+    :param rigid: [declares that the upper 3x3 is a pure rotation], defaults to False
+    :type rigid: bool, optional
+    """
+    (a, b, c, tx), (d, e, f, ty), (g, h, i, tz), last = matrix.tolist()
+    if last != [0.0, 0.0, 0.0, 1.0]:
+        return inverse(matrix)
+    if rigid:
+        i00, i01, i02, i10, i11, i12, i20, i21, i22 = a, d, g, b, e, h, c, f, i
+    else:
+        A, B, C = e*i - f*h, f*g - d*i, d*h - e*g
+        det = a*A + b*B + c*C
+        if det == 0.0:
+            return inverse(matrix)
+        r = 1.0/det
+        i00, i01, i02 = A*r, (c*h - b*i)*r, (b*f - c*e)*r
+        i10, i11, i12 = B*r, (a*i - c*g)*r, (c*d - a*f)*r
+        i20, i21, i22 = C*r, (b*g - a*h)*r, (a*e - b*d)*r
+    return np.array([[i00, i01, i02, -(i00*tx + i01*ty + i02*tz)],
+                     [i10, i11, i12, -(i10*tx + i11*ty + i12*tz)],
+                     [i20, i21, i22, -(i20*tx + i21*ty + i22*tz)],
+                     [0.0, 0.0, 0.0, 1.0]], dtype=matrix.dtype)
+    
 def ortho(left, right, bottom, top, near, far):
     """ Orthographic projection matrix creation function, where 
     the viewing volume is a rectangular parallelepiped, or more informally, a box. 
@@ -116,7 +148,7 @@ def ortho(left, right, bottom, top, near, far):
                      [0,    2/dy, 0,     ry],
                      [0,    0,    -2/dz, rz],
                      [0,    0,    0,     1]
-                     ], dtype=np.float,order='F')
+                     ], dtype=np.float64,order='F')
     
 def perspective(fovy, aspect, near, far):
     """Perspective projection matrix creation function, where 
@@ -143,7 +175,7 @@ def perspective(fovy, aspect, near, far):
     return np.array([[sx, 0,  0,  0],
                      [0,  sy, 0,  0],
                      [0,  0, zz, zw],
-                     [0,  0, -1,  0]], dtype=np.float,order='F')
+                     [0,  0, -1,  0]], dtype=np.float64,order='F')
     
 def frustum(xmin, xmax, ymin, ymax, zmin, zmax):
     """Alternative Perspective projection matrix creation function, where 
@@ -175,7 +207,7 @@ def frustum(xmin, xmax, ymin, ymax, zmin, zmax):
     return np.array([[sx, 0,  a, 0],
                      [0, sy,  b, 0],
                      [0,  0,  c, d],
-                     [0,  0, -1, 0]], dtype=np.float,order='F')
+                     [0,  0, -1, 0]], dtype=np.float64,order='F')
     
 
 def translate(x=0.0, y=0.0, z=0.0):
@@ -255,7 +287,7 @@ def rotate(axis=(1.0,0.0,0.0), angle=0.0, radians=None):
     return np.array([[x*x*nc + c,   x*y*nc - z*s, x*z*nc + y*s, 0],
                      [y*x*nc + z*s, y*y*nc + c,   y*z*nc - x*s, 0],
                      [x*z*nc - y*s, y*z*nc + x*s, z*z*nc + c,   0],
-                     [0,            0,            0,            1]], dtype=np.float,order='F')
+                     [0,            0,            0,            1]], dtype=np.float64,order='F')
     
     
 def lookat(eye, target, up):
@@ -300,6 +332,155 @@ def lookat(eye, target, up):
     
     return rotation
 
+# ------------ batched (vectorised) counterparts of the CG functions above --------------
+# Each *_batch function takes arrays of N parameters and returns a (N,4,4) stack whose i-th matrix
+# equals the scalar function called with the i-th parameters. Scalars broadcast against arrays.
+
+def _broadcast(*args):
+    """broadcast the arguments to float arrays of a common shape (at least 1D)"""
+    return np.broadcast_arrays(*(np.atleast_1d(np.asarray(arg, dtype=np.float64)) for arg in args))
+
+def _normalise_rows(vectors):
+    """normalise every row of a (N,k) array, leaving zero rows untouched like normalise()"""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=vectors.copy(), where=norms > 0.)
+
+def inverse_batch(matrices):
+    """inverse of every matrix of a (N,4,4) stack, see inverse()
+
+    :param matrices: [stack of matrices]
+    :type matrices: (N,4,4) numpy array
+    """
+    return inv(np.asarray(matrices))
+
+def inverse_affine_batch(matrices, rigid=False):
+    """inverse of every matrix of a (N,4,4) stack, see inverse_affine(): affine rows use the closed-form
+    formula, the remaining (projective or singular) rows fall back to the general inverse_batch()
+
+    :param matrices: [stack of transforms]
+    :type matrices: (N,4,4) numpy array
+    :param rigid: [declares that all upper 3x3 blocks are pure rotations], defaults to False
+    :type rigid: bool, optional
+    """
+    matrices = np.asarray(matrices)
+    A, t = matrices[:, :3, :3], matrices[:, :3, 3]
+    if rigid:
+        invA = np.swapaxes(A, 1, 2)
+        det = np.ones(len(matrices))
+    else:
+        # rows of the adjugate are cross products of the columns of A
+        a, b, c = A[:, :, 0], A[:, :, 1], A[:, :, 2]
+        adj = np.stack([np.cross(b, c), np.cross(c, a), np.cross(a, b)], axis=1)
+        det = np.einsum('ij,ij->i', a, adj[:, 0])
+        invA = adj / np.where(det == 0.0, 1.0, det)[:, np.newaxis, np.newaxis]
+    Imats = np.zeros_like(matrices)
+    Imats[:, :3, :3] = invA
+    Imats[:, :3, 3] = -np.einsum('nij,nj->ni', invA, t)
+    Imats[:, 3, 3] = 1.0
+    general = np.any(matrices[:, 3] != (0.0, 0.0, 0.0, 1.0), axis=1) | (det == 0.0)
+    if general.any():
+        Imats[general] = inverse_batch(matrices[general])
+    return Imats
+
+def translate_batch(vectors):
+    """stack of translation matrices, see translate()
+
+    :param vectors: [N translation vectors]
+    :type vectors: (N,3) array_like
+    """
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, 3)
+    Tmats = np.zeros((len(vectors), 4, 4), np.float32)
+    Tmats[:] = np.identity(4, np.float32)
+    Tmats[:, :3, 3] = vectors
+    return Tmats
+
+def scale_batch(factors):
+    """stack of scaling matrices, see scale()
+
+    :param factors: [N uniform scaling factors or N x,y,z scaling vectors]
+    :type factors: (N,) or (N,3) array_like
+    """
+    factors = np.asarray(factors, dtype=np.float64)
+    factors = np.repeat(factors.reshape(-1, 1), 3, axis=1) if factors.ndim < 2 else factors[:, :3]
+    Smats = np.zeros((len(factors), 4, 4))
+    Smats[:, [0, 1, 2], [0, 1, 2]] = factors
+    Smats[:, 3, 3] = 1.0
+    return Smats
+
+def rotate_batch(axes, angles=0.0, radians=None):
+    """stack of axis-angle rotation matrices, see rotate()
+
+    :param axes: [N rotation axes or one axis shared by all]
+    :type axes: (N,3) or (3,) array_like
+    :param angles: [N angles in degrees], defaults to 0.0
+    :type angles: (N,) array_like, optional
+    :param radians: [N angles in radians, used instead of angles if given], defaults to None
+    :type radians: (N,) array_like, optional
+    """
+    rads = np.radians(np.asarray(angles, dtype=np.float64)) if radians is None else radians
+    axes, rads = np.asarray(axes, dtype=np.float64).reshape(-1, 3), np.atleast_1d(np.asarray(rads, dtype=np.float64))
+    n = max(len(axes), len(rads))
+    axes = _normalise_rows(np.broadcast_to(axes, (n, 3)))
+    rads = np.broadcast_to(rads, (n,))
+    x, y, z = axes[:, 0], axes[:, 1], axes[:, 2]
+    s, c = np.sin(rads), np.cos(rads)
+    nc = 1 - c
+    Rmats = np.zeros((n, 4, 4))
+    Rmats[:, 0, 0], Rmats[:, 0, 1], Rmats[:, 0, 2] = x*x*nc + c,   x*y*nc - z*s, x*z*nc + y*s
+    Rmats[:, 1, 0], Rmats[:, 1, 1], Rmats[:, 1, 2] = y*x*nc + z*s, y*y*nc + c,   y*z*nc - x*s
+    Rmats[:, 2, 0], Rmats[:, 2, 1], Rmats[:, 2, 2] = x*z*nc - y*s, y*z*nc + x*s, z*z*nc + c
+    Rmats[:, 3, 3] = 1.0
+    return Rmats
+
+def lookat_batch(eyes, targets, ups):
+    """stack of camera lookat matrices, see lookat()
+
+    :param eyes: [N eye positions]
+    :type eyes: (N,3) array_like
+    :param targets: [N target positions]
+    :type targets: (N,3) array_like
+    :param ups: [N up vectors or one shared up vector]
+    :type ups: (N,3) or (3,) array_like
+    """
+    eyes, targets, ups = (np.asarray(v, dtype=np.float64).reshape(-1, np.shape(v)[-1])[:, :3] for v in (eyes, targets, ups))
+    eyes, targets, ups = np.broadcast_arrays(eyes, targets, ups)
+    eyes, targets = _normalise_rows(eyes), _normalise_rows(targets)
+    f = _normalise_rows(targets - eyes)
+    s = _normalise_rows(np.cross(_normalise_rows(ups), f))
+    u = np.cross(f, s)
+    Lmats = np.zeros((len(f), 4, 4))
+    Lmats[:, 0, :3], Lmats[:, 1, :3], Lmats[:, 2, :3] = s, u, f
+    Lmats[:, 0, 3] = -np.einsum('ij,ij->i', s, eyes)
+    Lmats[:, 1, 3] = -np.einsum('ij,ij->i', u, eyes)
+    Lmats[:, 2, 3] = -np.einsum('ij,ij->i', f, eyes)
+    Lmats[:, 3, 3] = 1.0
+    return Lmats
+
+def ortho_batch(left, right, bottom, top, near, far):
+    """stack of orthographic projection matrices, see ortho()
+    Each parameter is a scalar or an (N,) array_like
+    """
+    left, right, bottom, top, near, far = _broadcast(left, right, bottom, top, near, far)
+    dx, dy, dz = right - left, top - bottom, far - near
+    Pmats = np.zeros((len(dx), 4, 4))
+    Pmats[:, 0, 0], Pmats[:, 1, 1], Pmats[:, 2, 2] = 2/dx, 2/dy, -2/dz
+    Pmats[:, 0, 3], Pmats[:, 1, 3], Pmats[:, 2, 3] = -(right+left) / dx, -(top+bottom) / dy, -(far+near) / dz
+    Pmats[:, 3, 3] = 1.0
+    return Pmats
+
+def perspective_batch(fovy, aspect, near, far):
+    """stack of perspective projection matrices, see perspective()
+    Each parameter is a scalar or an (N,) array_like, fovy in degrees
+    """
+    fovy, aspect, near, far = _broadcast(fovy, aspect, near, far)
+    _scale = 1.0/np.tan(np.radians(fovy)/2.0)
+    Pmats = np.zeros((len(fovy), 4, 4))
+    Pmats[:, 0, 0], Pmats[:, 1, 1] = _scale / aspect, _scale
+    Pmats[:, 2, 2] = (far + near) / (near - far)
+    Pmats[:, 2, 3] = 2 * far * near/(near - far)
+    Pmats[:, 3, 2] = -1.0
+    return Pmats
+
 # -------------------- quaternion algebra convenience functions ----------------------
 
 #quaternion()
@@ -318,7 +499,7 @@ def quaternion(x=vec(0.0, 0.0, 0.0, 0.0), y=0.0, z=0.0, w=1.0):
     :type w: float, optional
     """
     x, y, z = (x, y, z) if isinstance(x, Number) else (x[0], x[1], x[2])
-    return np.array([x, y, z, w], dtype=np.float,order='F') 
+    return np.array([x, y, z, w], dtype=np.float64,order='F') 
 
 
 def quaternion_from_axis_angle(axis:vec, degrees=0.0, radians=None):
@@ -370,7 +551,7 @@ def quaternion_mul(q1, q2):
                             [q1[2],  q1[3],  q1[0], -q1[1]],
                             [q1[3], -q1[2],  q1[1],  q1[0]],
                             [q1[0], -q1[1], -q1[2], -q1[3]]
-                            ],dtype=np.float,order='F'), q2)
+                            ],dtype=np.float64,order='F'), q2)
                         
 
 def quaternion_matrix(q):
@@ -389,7 +570,7 @@ def quaternion_matrix(q):
                      [2 * (qxy + qwz), 2 * (nxx + nzz) + 1, 2 * (qyz - qwx), 0],
                      [2 * (qxz - qwy), 2 * (qyz + qwx), 2 * (nxx + nyy) + 1, 0],
                      [0, 0, 0, 1] 
-                     ], dtype=np.float,order='F')
+                     ], dtype=np.float64,order='F')
     
 
 def quaternion_slerp(q0, q1, fraction):
@@ -0,0 +1,169 @@
+"""
+RenderWindow classes, part of the pyglGA SDK ECSS
+    
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Copyright 2020-2021 George Papagiannakis
+    
+The RenderWindow abstract base class of the Viewer GUI/Display sub-system and its HeadlessWindow.
+
+This module does not import SDL2, ImGUI or OpenGL, so that a Scene can run its ECSS systems 
+headless e.g. on simulation servers or in CI. The SDL2 and ImGUI windows are in pyglGA.GUI.Viewer.
+"""
+
+from __future__         import annotations
+from abc                import ABC, abstractmethod
+import logging
+
+import pyglGA.ECSS.System
+
+logger = logging.getLogger(__name__)
+
+class RenderWindow(ABC):
+    """
+    The Abstract base class of the Viewer GUI/Display sub-system of pyglGA
+    based on the Decorator Pattern, this class is "wrapped" by decorators
+    in order to provide extra cpapabilities e.g. SDL2 window, context and ImGUI widgets    
+    """     
+    
+    def __init__(self):
+        self._eventManager = None
+        self._scene = None
+    
+    #define properties for EventManager, Scene objects
+    @property #name
+    def eventManager(self):
+        """ Get RenderWindow's eventManager """
+        return self._eventManager
+    @eventManager.setter
+    def eventManager(self, value):
+        self._eventManager = value
+        
+    @property #name
+    def scene(self):
+        """ Get RenderWindow's Scene reference """
+        return self._scene
+    @scene.setter
+    def scene(self, value):
+        self._scene = value
+    
+    @abstractmethod
+    def init(self):
+        raise NotImplementedError
+    
+    abstractmethod
+    def init_post(self):
+        raise NotImplementedError
+    
+    @abstractmethod
+    def display(self):
+        raise NotImplementedError
+    
+    @abstractmethod
+    def display_post(self):
+        raise NotImplementedError
+    
+    @abstractmethod
+    def shutdown(self):
+        raise NotImplementedError
+    
+    @abstractmethod
+    def event_input_process(self, running = True):
+        raise NotImplementedError
+    
+    @abstractmethod
+    def accept(self, system: pyglGA.ECSS.System, event = None):
+        """
+        Accepts a class object to operate on the RenderWindow, based on the Visitor pattern.
+
+        :param system: [a System object]
+        :type system: [System]
+        """
+        raise NotImplementedError
+    
+    def resize(self, windowWidth, windowHeight):
+        """
+        Keep the new window size and set only the aspect ratio of the Scene's Cameras, 
+        their projection matrices are then rebuilt once, on next use
+
+        :param windowWidth: new width in pixels
+        :type windowWidth: int
+        :param windowHeight: new height in pixels
+        :type windowHeight: int
+        """
+        self._windowWidth = windowWidth
+        self._windowHeight = windowHeight
+        if self._scene is not None and windowHeight > 0:
+            for camera in self._scene.world.cameras:
+                camera.aspect = windowWidth / windowHeight
+    
+    @classmethod
+    def getClassName(cls):
+        return cls.__name__
+
+
+class HeadlessWindow(RenderWindow):
+    """ The concrete subclass of RenderWindow with no window, GL context or input, 
+    for running the same Scene render loop on headless servers
+
+    :param RenderWindow: [description]
+    :type RenderWindow: [type]
+    """
+    
+    def __init__(self, windowWidth = None, windowHeight = None, windowTitle = None, scene = None, eventManager = None, maxFrames = None):
+        """Constructor HeadlessWindow, the window parameters are kept for the Systems that need them
+
+        :param maxFrames: number of frames after which event_input_process() stops the render loop, defaults to None to run forever
+        :type maxFrames: int, optional
+        """
+        super().__init__()
+        
+        self._windowWidth = 1024 if windowWidth is None else windowWidth
+        self._windowHeight = 768 if windowHeight is None else windowHeight
+        self._windowTitle = "HeadlessWindow" if windowTitle is None else windowTitle
+        self._maxFrames = maxFrames
+        self._frames = 0
+        
+        if eventManager is not None and scene is None:
+            self.eventManager = eventManager
+        
+        if scene is not None:
+            self._scene = scene
+            self.eventManager = scene.world.eventManager
+    
+    @property
+    def frames(self) -> int:
+        """ Get the number of displayed frames """
+        return self._frames
+    
+    @property
+    def maxFrames(self):
+        return self._maxFrames
+    @maxFrames.setter
+    def maxFrames(self, value):
+        self._maxFrames = value
+    
+    def init(self):
+        logger.info("%s: init()", self.getClassName())
+    
+    def init_post(self):
+        pass
+    
+    def display(self):
+        self._frames += 1
+    
+    def display_post(self):
+        pass
+    
+    def shutdown(self):
+        logger.info("%s: shutdown()", self.getClassName())
+    
+    def event_input_process(self, running = True):
+        """
+        no input to process, stops running after maxFrames frames
+        """
+        if self._maxFrames is not None and self._frames >= self._maxFrames:
+            running = False
+        return running
+    
+    def accept(self, system: pyglGA.ECSS.System, event = None):
+        system.apply2RenderWindow(self, event)
@@ -15,87 +15,23 @@ from __future__         import annotations
 from abc                import ABC, abstractmethod
 from typing             import List, Dict, Any
 from collections.abc    import Iterable, Iterator
+import logging
 
-import sdl2
-import sdl2.ext
-from sdl2.keycode import SDLK_ESCAPE
-from sdl2.video import SDL_WINDOWPOS_CENTERED, SDL_WINDOW_ALLOW_HIGHDPI
-import OpenGL.GL as gl
-from OpenGL.GL import shaders
-import imgui
-from imgui.integrations.sdl2 import SDL2Renderer
 
 import pyglGA.ECSS.System  
 import pyglGA.ECSS.utilities as util
 import pyglGA.ECSS.Event
 from pyglGA.ECSS.System import System 
+from pyglGA.GUI.RenderWindow import RenderWindow, HeadlessWindow
+from pyglGA import lazyImport
 
-class RenderWindow(ABC):
-    """
-    The Abstract base class of the Viewer GUI/Display sub-system of pyglGA
-    based on the Decorator Pattern, this class is "wrapped" by decorators
-    in order to provide extra cpapabilities e.g. SDL2 window, context and ImGUI widgets    
-    """     
-    
-    def __init__(self):
-        self._eventManager = None
-        self._scene = None
-    
-    #define properties for EventManager, Scene objects
-    @property #name
-    def eventManager(self):
-        """ Get RenderWindow's eventManager """
-        return self._eventManager
-    @eventManager.setter
-    def eventManager(self, value):
-        self._eventManager = value
-        
-    @property #name
-    def scene(self):
-        """ Get RenderWindow's Scene reference """
-        return self._scene
-    @scene.setter
-    def scene(self, value):
-        self._scene = value
-    
-    @abstractmethod
-    def init(self):
-        raise NotImplementedError
-    
-    abstractmethod
-    def init_post(self):
-        raise NotImplementedError
-    
-    @abstractmethod
-    def display(self):
-        raise NotImplementedError
-    
-    @abstractmethod
-    def display_post(self):
-        raise NotImplementedError
-    
-    @abstractmethod
-    def shutdown(self):
-        raise NotImplementedError
-    
-    @abstractmethod
-    def event_input_process(self, running = True):
-        raise NotImplementedError
-    
-    @abstractmethod
-    def accept(self, system: pyglGA.ECSS.System, event = None):
-        """
-        Accepts a class object to operate on the RenderWindow, based on the Visitor pattern.
-
-        :param system: [a System object]
-        :type system: [System]
-        """
-        raise NotImplementedError
-    
-    @classmethod
-    def getClassName(cls):
-        return cls.__name__
+# SDL2, OpenGL and ImGUI are loaded on first use
+sdl2 = lazyImport("sdl2")
+sdl2ext = lazyImport("sdl2.ext")
+gl = lazyImport("OpenGL.GL")
+imgui = lazyImport("imgui")
 
+logger = logging.getLogger(__name__)
 
 class SDL2Window(RenderWindow):
     """ The concrete subclass of RenderWindow for the SDL2 GUI API 
@@ -162,12 +98,12 @@ class SDL2Window(RenderWindow):
         """
         Initialise an SDL2 RenderWindow, not directly but via the SDL2Decorator
         """
-        print(f'{self.getClassName()}: init()')
+        logger.info("%s: init()", self.getClassName())
         
         #SDL_Init for the window initialization
         sdl_not_initialised = sdl2.SDL_Init(sdl2.SDL_INIT_VIDEO | sdl2.SDL_INIT_TIMER)
         if sdl_not_initialised !=0:
-            print("SDL2 could not be initialised! SDL Error: ", sdl2.SDL_GetError())
+            logger.error("SDL2 could not be initialised! SDL Error: %s", sdl2.SDL_GetError())
             exit(1)
         
         #setting OpenGL attributes for the GL state and context 4.1
@@ -194,23 +130,23 @@ class SDL2Window(RenderWindow):
                                               sdl2.SDL_WINDOWPOS_CENTERED,
                                               self._windowWidth,
                                               self._windowHeight,
-                                              sdl2.SDL_WINDOW_ALLOW_HIGHDPI)
+                                              sdl2.SDL_WINDOW_ALLOW_HIGHDPI | sdl2.SDL_WINDOW_RESIZABLE)
         if self._gWindow is None:
-            print("Window could not be created! SDL Error: ", sdl2.SDL_GetError())
+            logger.error("Window could not be created! SDL Error: %s", sdl2.SDL_GetError())
             exit(1)
             
         #create the OpenGL context for rendering into the SDL2Window that was constructed just before
         self._gContext = sdl2.SDL_GL_CreateContext(self._gWindow)
         if self._gContext is None:
-            print("OpenGL Context could not be created! SDL Error: ", sdl2.SDL_GetError())
+            logger.error("OpenGL Context could not be created! SDL Error: %s", sdl2.SDL_GetError())
             exit(1)
         sdl2.SDL_GL_MakeCurrent(self._gWindow, self._gContext)
         if sdl2.SDL_GL_SetSwapInterval(1) < 0:
-            print("Warning: Unable to set VSync! SDL Error: " + sdl2.SDL_GetError())
+            logger.warning("Unable to set VSync! SDL Error: %s", sdl2.SDL_GetError())
             exit(1)
         #obtain the GL versioning system info
         self._gVersionLabel = f'OpenGL {gl.glGetString(gl.GL_VERSION).decode()} GLSL {gl.glGetString(gl.GL_SHADING_LANGUAGE_VERSION).decode()} Renderer {gl.glGetString(gl.GL_RENDERER).decode()}'
-        print(self._gVersionLabel)
+        logger.info(self._gVersionLabel)
     
     
     def init_post(self):
@@ -254,7 +190,7 @@ class SDL2Window(RenderWindow):
         """
         Shutdown and cleanup SDL2 operations
         """
-        print(f'{self.getClassName()}: shutdown()')
+        logger.info("%s: shutdown()", self.getClassName())
         if (self._gContext and self._gWindow is not None):
             sdl2.SDL_GL_DeleteContext(self._gContext)
             sdl2.SDL_DestroyWindow(self._gWindow)
@@ -265,15 +201,25 @@ class SDL2Window(RenderWindow):
         """
         process SDL2 basic events and input
         """
-        events = sdl2.ext.get_events()
+        events = sdl2ext.get_events()
         for event in events:
             if event.type == sdl2.SDL_KEYDOWN:
                 if event.key.keysym.sym == sdl2.SDLK_ESCAPE:
                     running = False
             if event.type == sdl2.SDL_QUIT:
                 running = False
+            if event.type == sdl2.SDL_WINDOWEVENT and event.window.event == sdl2.SDL_WINDOWEVENT_SIZE_CHANGED:
+                self.resize(event.window.data1, event.window.data2)
         return running
     
+    def resize(self, windowWidth, windowHeight):
+        """
+        Resize the GL viewport and the aspect ratio of the Scene's Cameras, see RenderWindow.resize()
+        """
+        super().resize(windowWidth, windowHeight)
+        if self._gContext is not None:
+            gl.glViewport(0, 0, windowWidth, windowHeight)
+    
     def accept(self, system: pyglGA.ECSS.System, event = None):
         system.apply2SDLWindow(self, event)
 
@@ -302,7 +248,7 @@ class RenderDecorator(RenderWindow):
         [summary]
         """
         self._wrapeeWindow.init()
-        print(f'RenderDecorator: init()')
+        logger.info("RenderDecorator: init()")
         
         
     def display(self):
@@ -317,7 +263,7 @@ class RenderDecorator(RenderWindow):
         [summary]
         """
         self._wrapeeWindow.shutdown()
-        print(f'RenderDecorator: shutdown()')   
+        logger.info("RenderDecorator: shutdown()")   
         
         
     def event_input_process(self, running = True):
@@ -342,6 +288,12 @@ class RenderDecorator(RenderWindow):
         this should be ctypiically alled AFTER all other GL contexts have been created, e.g. ImGUI context
         """
         self._wrapeeWindow.init_post()
+    
+    def resize(self, windowWidth, windowHeight):
+        """
+        the wrapee RenderWindow owns the window size
+        """
+        self._wrapeeWindow.resize(windowWidth, windowHeight)
         
     def accept(self, system: pyglGA.ECSS.System, event = None):
         pass
@@ -374,14 +326,15 @@ class ImGUIDecorator(RenderDecorator):
         """
         self.wrapeeWindow.init()
         if self._imguiContext is None:
-            print("Window could not be created! ImGUI Error: ")
+            logger.error("Window could not be created! ImGUI Error: ")
             exit(1)
         else:
-            print("Yay! ImGUI context created successfully")
+            logger.info("Yay! ImGUI context created successfully")
         
         # GPTODO here is the issue: SDL2Decorator takes an SDLWindow as wrappee wheras
         # ImGUIDEcorator takes and SDL2Decorator and decorates it!
         if isinstance(self.wrapeeWindow, SDL2Window):   
+            from imgui.integrations.sdl2 import SDL2Renderer
             self._imguiRenderer = SDL2Renderer(self.wrapeeWindow._gWindow)
             
         #
@@ -389,10 +342,9 @@ class ImGUIDecorator(RenderDecorator):
         #
         self._updateWireframe = pyglGA.ECSS.Event.Event(name="OnUpdateWireframe", id=201, value=None)
         if self._wrapeeWindow.eventManager is not None:
-            self._wrapeeWindow.eventManager._events[self._updateWireframe.name] = self._updateWireframe
-            self._wrapeeWindow.eventManager._publishers[self._updateWireframe.name] = self
+            self._wrapeeWindow.eventManager.publish(self._updateWireframe, self)
         
-        print(f'{self.getClassName()}: init()')
+        logger.info("%s: init()", self.getClassName())
         
         
     def display(self):
@@ -411,13 +363,15 @@ class ImGUIDecorator(RenderDecorator):
         """
         process SDL2 basic events and input
         """
-        events = sdl2.ext.get_events()
+        events = sdl2ext.get_events()
         for event in events:
             if event.type == sdl2.SDL_KEYDOWN:
                 if event.key.keysym.sym == sdl2.SDLK_ESCAPE:
                     running = False
             if event.type == sdl2.SDL_QUIT:
                 running = False
+            if event.type == sdl2.SDL_WINDOWEVENT and event.window.event == sdl2.SDL_WINDOWEVENT_SIZE_CHANGED:
+                self.resize(event.window.data1, event.window.data2)
             #imgui event
             self._imguiRenderer.process_event(event)
         #imgui input
@@ -456,26 +410,26 @@ class ImGUIDecorator(RenderDecorator):
         imgui.separator()
         imgui.new_line()
         #
-        # wireframe Event updates the GL state
+        # wireframe Event updates the GL state, queued so that it applies at the start of the next frame
         self._changed, self._checkbox = imgui.checkbox("Wireframe", self._wireframeMode)
         if self._changed:
             if self._checkbox is True:
                 self._wireframeMode = True
                 self._updateWireframe.value = self._wireframeMode
                 if self._wrapeeWindow.eventManager is not None:
-                    self.wrapeeWindow.eventManager.notify(self, self._updateWireframe) 
-                print(f"wireframe: {self._wireframeMode}")
+                    self.wrapeeWindow.eventManager.post(self, self._updateWireframe, key=self)
+                logger.debug("wireframe: %s", self._wireframeMode)
             if self._checkbox is False:
                 self._wireframeMode = False
                 self._updateWireframe.value = self._wireframeMode
                 if self._wrapeeWindow.eventManager is not None:
-                    self.wrapeeWindow.eventManager.notify(self, self._updateWireframe) 
-                print(f"wireframe: {self._wireframeMode}")
+                    self.wrapeeWindow.eventManager.post(self, self._updateWireframe, key=self)
+                logger.debug("wireframe: %s", self._wireframeMode)
         #
         # simple slider for color
         self._changed, self._colorEditor = imgui.color_edit3("Color edit", *self._colorEditor)
         if self._changed:
-             print(f"_colorEditor: {self._colorEditor}")
+             logger.debug("_colorEditor: %s", self._colorEditor)
         imgui.separator()
         #
         # simple FPS counter
@@ -537,7 +491,7 @@ class RenderGLStateSystem(System):
         :type event: [type], optional
         """
         if event.name == "OnUpdateWireframe":
-            print(f"RenderGLStateSystem():apply2SDLWindow() actuator system for: {event}")
+            logger.debug("RenderGLStateSystem():apply2SDLWindow() actuator system for: %s", event)
             sdlWindow._wireframeMode = event.value
         
 
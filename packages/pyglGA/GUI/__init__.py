@@ -0,0 +1,9 @@
+"""
+GUI package, the display and windowing part of the glGA SDK
+
+Submodules are imported on first attribute access, e.g. pyglGA.GUI.Viewer
+"""
+
+from pyglGA import attachSubmodules
+
+__getattr__, __dir__, __all__ = attachSubmodules(__name__, ["RenderWindow", "Viewer"])
@@ -0,0 +1,79 @@
+"""
+pyglGA package, the python glGA SDK
+
+glGA SDK v2021 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+Heavy backends (PyOpenGL, PySDL2, ImGUI) are not loaded at import time: modules bind them with lazyImport()
+and the ECSS, ext and GUI subpackages expose their submodules with attachSubmodules(), so that
+e.g. a headless ECSS world never pays for the OpenGL or windowing start-up cost.
+"""
+
+import importlib
+import importlib.machinery
+import importlib.util
+import sys
+
+__all__ = ["ECSS", "ext", "GUI", "lazyImport", "attachSubmodules"]
+
+
+def lazyImport(name):
+    """
+    Return module name, deferring the execution of its code until the first attribute access.
+    The package of a submodule is imported lazily as well.
+
+    :param name: fully qualified module name, e.g. "OpenGL.GL"
+    :type name: str
+    :raises ModuleNotFoundError: if the module cannot be found
+    :return: the (lazy) module
+    :rtype: module
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    parentName = name.rpartition(".")[0]
+    if parentName:
+        # find_spec() would execute the package, look the submodule up in the package path instead
+        parent = lazyImport(parentName)
+        path = object.__getattribute__(parent, "__spec__").submodule_search_locations
+        spec = importlib.machinery.PathFinder.find_spec(name, path) if path is not None else None
+    else:
+        spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    if parentName:
+        setattr(parent, name.rpartition(".")[2], module)
+    return module
+
+
+def attachSubmodules(packageName, submodules):
+    """
+    Build the module level __getattr__, __dir__ and __all__ (PEP 562) of a package
+    so that its submodules are imported on first attribute access
+
+    :param packageName: the __name__ of the package
+    :type packageName: str
+    :param submodules: names of the submodules to expose
+    :type submodules: list of str
+    :return: __getattr__, __dir__, __all__
+    :rtype: tuple
+    """
+    submodules = sorted(submodules)
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(f"{packageName}.{name}")
+        raise AttributeError(f"module '{packageName}' has no attribute '{name}'")
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[packageName])) | set(submodules))
+
+    return __getattr__, __dir__, list(submodules)
+
+
+__getattr__, __dir__, _ = attachSubmodules(__name__, ["ECSS", "ext", "GUI"])
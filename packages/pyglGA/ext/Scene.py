@@ -17,6 +17,7 @@ The following is example restructured text doc example
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Dict
+import logging
 
 import numpy as np
 
@@ -25,28 +26,23 @@ from pyglGA.ECSS.Entity import Entity, EntityDfsIterator
 from pyglGA.ECSS.Component import BasicTransform, Camera
 from pyglGA.ECSS.System import System, TransformSystem, CameraSystem, RenderSystem
 from pyglGA.ECSS.ECSSManager import ECSSManager
-from pyglGA.GUI.Viewer import SDL2Window, ImGUIDecorator
+from pyglGA.GUI.RenderWindow import HeadlessWindow
+
+logger = logging.getLogger(__name__)
 
 class Scene():
     """
-    Singleton Scene that assembles ECSSManager and Viewer classes together for Scene authoring
+    Scene that assembles ECSSManager and Viewer classes together for Scene authoring
     in pyglGA. It also brings together the new extensions to pyglGA: Shader, VertexArray and 
     RenderMeshDecorators
-    """
-    _instance = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            print('Creating Scene Singleton Object')
-            cls._instance = super(Scene, cls).__new__(cls)
-            # add further init here
-        return cls._instance
     
+    Each Scene has its own ECSSManager world, several Scenes can live in one process.
+    """
     
-    def __init__(self):
+    def __init__(self, dtype=np.float32):
         self._renderWindow = None
         self._gContext = None
-        self._world = ECSSManager() #which also instantiates an EventManager
+        self._world = ECSSManager(dtype) #which also instantiates an EventManager, dtype is the matrix precision policy
     
     @property
     def renderWindow(self):
@@ -61,9 +57,22 @@ class Scene():
         return self._world
     
     
-    def init(self, sdl2 = True, imgui = False, windowWidth = None, windowHeight = None, windowTitle = None, customImGUIdecorator = None):
+    def init(self, sdl2 = True, imgui = False, windowWidth = None, windowHeight = None, windowTitle = None, customImGUIdecorator = None, headless = False, maxFrames = None):
         """call the init() of all systems attached to this Scene based on the Visitor pattern
+        
+        With headless=True the Scene runs without a window, GL context or input (and without importing SDL2/ImGUI), 
+        render() and render_post() then only count frames, up to maxFrames if given.
         """
+        if headless == True:
+            self._renderWindow = HeadlessWindow(windowWidth, windowHeight, windowTitle, self, maxFrames = maxFrames)
+            self._gContext = self._renderWindow
+            self._gContext.init()
+            self._gContext.init_post()
+            return
+        
+        # the SDL2/ImGUI Viewer is only imported when a window is needed
+        from pyglGA.GUI.Viewer import SDL2Window, ImGUIDecorator
+        
         #init Viewer GUI subsystem with just SDL2 window or also an ImGUI decorators
         if sdl2 == True:
             #create a basic SDL2 RenderWindow with a reference to the Scene and thus ECSSManager and EventManager
@@ -95,7 +104,10 @@ class Scene():
         
     def render(self, running:bool = True) ->bool :
         """call the render() of all systems attached to this Scene based on the Visitor pattern
+        
+        The Events posted since the last frame are dispatched first (nothing is left if ECSSManager.tick() already did)
         """
+        self._world.eventManager.drain()
         self._gContext.display()
         still_runnning = self._gContext.event_input_process(running)
         
@@ -117,13 +129,13 @@ class Scene():
 
 
 if __name__ == "__main__":
-    # The client singleton code.
+    # The client code.
 
     s1 = Scene()
     s2 = Scene()
 
-    if id(s1) == id(s2):
-        print("Singleton works, both Scenes contain the same instance.")
+    if s1.world is not s2.world:
+        print("Both Scenes contain independent worlds.")
     else:
-        print("Singleton failed, Scenes contain different instances.")
+        print("Scenes failed, both Scenes share one world.")
         
\ No newline at end of file
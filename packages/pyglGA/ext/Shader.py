@@ -22,16 +22,21 @@ from typing             import List
 from collections.abc    import Iterable, Iterator
 import os  
 import sys
+import logging
 
-import OpenGL.GL as gl
-from OpenGL.GL import shaders
+import numpy as np
+
+from pyglGA import lazyImport
 
 from pyglGA.ECSS.System import System, RenderSystem, SystemDecorator
 from pyglGA.ECSS.Component import Component, BasicTransform, Camera, ComponentDecorator, RenderMesh, CompNullIterator, BasicTransformDecorator
-import uuid  
 import pyglGA.ECSS.utilities as util
 from pyglGA.ext.VertexArray import VertexArray
 
+gl = lazyImport("OpenGL.GL")
+
+logger = logging.getLogger(__name__)
+
 class Shader(Component):
     """
     A concrete OpenGL-GLSL Shader container Component class
@@ -73,6 +78,9 @@ class Shader(Component):
         }
     """
     
+    __slots__ = ("_glid", "_mat4fDict", "_mat3fDict", "_float1fDict", "_float3fDict", "_float4fDict", 
+                 "_vertex_source", "_fragment_source")
+    
     def __init__(self, name=None, type=None, id=None, vertex_source=None, fragment_source=None):
         super().__init__(name, type, id)
         
@@ -151,10 +159,17 @@ class Shader(Component):
     def float4fDict(self, value):
         self._float4fDict = value
     
-    def __del__(self):
-        gl.glUseProgram(0)
+    def release(self):
+        """
+        Delete the GL shader program, e.g. when the Shader is destroyed by the ECSSManager
+        """
         if self._glid:
+            gl.glUseProgram(0)
             gl.glDeleteProgram(self._glid)
+            self._glid = None
+    
+    def __del__(self):
+        self.release()
     
     def disableShader(self):
         gl.glUseProgram(0)
@@ -191,18 +206,18 @@ class Shader(Component):
         gl.glCompileShader(shader)
         status = gl.glGetShaderiv(shader, gl.GL_COMPILE_STATUS)
         src = ('%3d: %s' % (i+1, l) for i,l in enumerate(src.splitlines()) ) 
-        print('Compile shader success for %s\n%s\n%s' % (shader_type, status, src))
+        logger.debug('Compile shader success for %s\n%s', shader_type, status)
         if not status:
             log = gl.glGetShaderInfoLog(shader).decode('ascii')
             gl.glDeleteShader(shader)
             src = '\n'.join(src)
-            print('Compile failed for %s\n%s\n%s' % (shader_type, log, src))
+            logger.error('Compile failed for %s\n%s\n%s', shader_type, log, src)
             return None
         return shader
         
     
     def update(self):
-        print(self.getClassName(), ": update() called")
+        logger.debug("%s: update() called", self.getClassName())
         
    
     def accept(self, system: System):
@@ -230,7 +245,7 @@ class Shader(Component):
             gl.glDeleteShader(frag)
             status = gl.glGetProgramiv(self._glid, gl.GL_LINK_STATUS)
             if not status:
-                print(gl.glGetProgramInfoLog(self._glid).decode('ascii'))
+                logger.error(gl.glGetProgramInfoLog(self._glid).decode('ascii'))
                 gl.glDeleteProgram(self._glid)
                 self._glid = None
     
@@ -247,6 +262,13 @@ class ShaderGLDecorator(ComponentDecorator):
     :param ComponentDecorator: [description]
     :type ComponentDecorator: [type]
     """
+    __slots__ = ("_uniformBuffers",)
+    
+    def __init__(self, comp, name=None, type=None, id=None):
+        super().__init__(comp, name, type, id)
+        # uniform name -> float32 array owned by the decorator, reused for every non float32 matrix value
+        self._uniformBuffers = {}
+    
     def init(self):
         self.component.init()
     
@@ -256,11 +278,24 @@ class ShaderGLDecorator(ComponentDecorator):
         # e.g.  loc = GL.glGetUniformLocation(shid, 'projection')
         #       GL.glUniformMatrix4fv(loc, 1, True, projection)
         
+    def _float32(self, key, value):
+        """ value itself if it is a float32 array (e.g. a column view of a float32 world), otherwise 
+        value converted into the preallocated float32 buffer of the uniform, so that per frame calls do not allocate """
+        value = np.asarray(value)
+        if value.dtype == np.float32:
+            return value
+        buffer = self._uniformBuffers.get(key)
+        if buffer is None or buffer.shape != value.shape:
+            buffer = self._uniformBuffers[key] = np.empty(value.shape, dtype=np.float32)
+        np.copyto(buffer, value, casting="same_kind")
+        return buffer
+    
     def setUniformVariable(self,key, value, mat4=False, mat3=False, float1=False, float3=False, float4=False):
+        # glUniformMatrix*fv take float32: convert here, without a new copy per call, and not on every enableShader()
         if mat4:
-            self.component.mat4fDict[key]=value
+            self.component.mat4fDict[key]=self._float32(key, value)
         if mat3:
-            self.component.mat3fDict[key]=value
+            self.component.mat3fDict[key]=self._float32(key, value)
         if float1:
             self.component.float1fDict[key]=value
         if float3:
@@ -295,6 +330,8 @@ class InitGLShaderSystem(System):
     """Initialise outside of the rendering loop RenderMesh, Shader, VertexArray, ShaderGLDecorator classes
 
     """
+    _queryTypes = ("RenderMesh", "VertexArray", "Shader", "ShaderGLDecorator")
+    
     def init(self):
         pass
     
@@ -310,7 +347,7 @@ class InitGLShaderSystem(System):
         when visits Components.
         
         """
-        print(f'\n{renderMesh} accessed within {self.getClassName()}::apply2RenderMesh() \n')
+        logger.debug("%s accessed within %s::apply2RenderMesh()", renderMesh, self.getClassName())
         self.update()
         
     def apply2VertexArray(self, vertexArray:VertexArray):
@@ -319,7 +356,7 @@ class InitGLShaderSystem(System):
         when visits Components.
         
         """
-        print(f'\n{vertexArray} accessed within {self.getClassName()}::apply2RenderMesh() \n')
+        logger.debug("%s accessed within %s::apply2VertexArray()", vertexArray, self.getClassName())
         # Access parent Entity's RenderMesh
         parentEntity = vertexArray.parent
         parentRenderMesh = parentEntity.getChildByType(RenderMesh.getClassName())
@@ -329,7 +366,7 @@ class InitGLShaderSystem(System):
             vertexArray.index = parentRenderMesh.vertex_index
             vertexArray.init()
         else:
-            print("\n no RenderMesh to copy vertex attributes from! \n")
+            logger.warning("no RenderMesh to copy vertex attributes from!")
         # Init vertexArray
         
     def apply2Shader(self, shader:Shader):
@@ -342,7 +379,7 @@ class InitGLShaderSystem(System):
         # for the moment assume that the user will not be directly adding both a shader and shaderDecorator at scenegraph level
         # we can prevent this at ECSSManager level, but not at scenegraph direct access level
         shader.init()
-        print(f'\n{shader} accessed within {self.getClassName()}::apply2Shader() \n')
+        logger.debug("%s accessed within %s::apply2Shader()", shader, self.getClassName())
     
     def apply2ShaderGLDecorator(self, shaderGLDecorator:ShaderGLDecorator):
         """
@@ -352,7 +389,7 @@ class InitGLShaderSystem(System):
         """
         #init ShaderGLDecorator if there is such a node
         shaderGLDecorator.init()
-        print(f'\n{shaderGLDecorator} accessed within {self.getClassName()}::apply2ShaderGLDecorator() \n')
+        logger.debug("%s accessed within %s::apply2ShaderGLDecorator()", shaderGLDecorator, self.getClassName())
 
 
 class RenderGLShaderSystem(System):
@@ -360,6 +397,8 @@ class RenderGLShaderSystem(System):
     VertexArray components attached to a specific Entity
 
     """
+    _queryTypes = ("VertexArray",)
+    
     def init(self):
         pass
         
@@ -403,4 +442,4 @@ class RenderGLShaderSystem(System):
         vertexArray.update()
         compShader.disableShader()
         
-        print(f'\nMain shader GL render within {self.getClassName()}::render() \n')
\ No newline at end of file
+        logger.debug("Main shader GL render within %s::render()", self.getClassName())
\ No newline at end of file
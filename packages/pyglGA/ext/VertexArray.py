@@ -22,14 +22,14 @@ from typing             import List
 from collections.abc    import Iterable, Iterator
 import ctypes
 
-import OpenGL.GL as gl
-from OpenGL.GL import shaders
 import numpy as np
 
 import pyglGA.ECSS.System
 from pyglGA.ECSS.Component import Component, BasicTransform, Camera, RenderMesh, CompNullIterator, BasicTransformDecorator
-import uuid  
 import pyglGA.ECSS.utilities as util
+from pyglGA import lazyImport
+
+gl = lazyImport("OpenGL.GL")
 
 
 class VertexArray(Component):
@@ -39,7 +39,9 @@ class VertexArray(Component):
     :param Component: [description]
     :type Component: [type]
     """
-    def __init__(self, name=None, type=None, id=None, attributes=None, index=None, primitive = gl.GL_TRIANGLES, usage=gl.GL_STATIC_DRAW):
+    __slots__ = ("_glid", "_buffers", "_draw_command", "_arguments", "_attributes", "_index", "_usage", "_primitive")
+    
+    def __init__(self, name=None, type=None, id=None, attributes=None, index=None, primitive = None, usage = None):
         super().__init__(name, type, id)
         
         
@@ -51,8 +53,8 @@ class VertexArray(Component):
         self._arguments = (0,0)
         self._attributes = attributes
         self._index = index
-        self._usage = usage
-        self._primitive = primitive #e.g. GL.GL_TRIANGLES
+        self._usage = gl.GL_STATIC_DRAW if usage is None else usage
+        self._primitive = gl.GL_TRIANGLES if primitive is None else primitive #e.g. GL.GL_TRIANGLES
         #self.init(attributes, index, usage) #init after a valid GL context is active
     
     @property
@@ -92,9 +94,18 @@ class VertexArray(Component):
     def primitive(self, value):
         self._primitive = value
     
+    def release(self):
+        """
+        Delete the GL vertex array and buffers, e.g. when the VertexArray is destroyed by the ECSSManager
+        """
+        if self._glid is not None:
+            gl.glDeleteVertexArrays(1, [self._glid])
+            gl.glDeleteBuffers(len(self._buffers), self._buffers)
+            self._glid = None
+            self._buffers = []
+    
     def __del__(self):
-        gl.glDeleteVertexArrays(1, [self._glid])
-        gl.glDeleteBuffers(len(self._buffers), self._buffers)
+        self.release()
     
     def draw(self):
         # draw a vertex Array as direct array or index array
@@ -0,0 +1,9 @@
+"""
+ext package, extensions of the glGA SDK ECSS
+
+Submodules are imported on first attribute access, e.g. pyglGA.ext.Scene
+"""
+
+from pyglGA import attachSubmodules
+
+__getattr__, __dir__, __all__ = attachSubmodules(__name__, ["Scene", "Shader", "VertexArray"])
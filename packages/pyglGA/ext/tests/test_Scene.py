@@ -8,6 +8,8 @@ glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
 
 
 import unittest
+import subprocess
+import sys
 
 import numpy as np
 
@@ -44,7 +46,7 @@ class TestScene(unittest.TestCase):
         """
         self.s1 = Scene()
         self.scene = Scene()    
-        self.assertEqual(self.s1, self.scene)
+        self.assertIsNot(self.s1, self.scene)
         
         # Scenegraph with Entities, Components
         self.rootEntity = self.scene.world.createEntity(Entity(name="RooT"))
@@ -136,7 +138,9 @@ class TestScene(unittest.TestCase):
         print("TestScene:test_init START".center(100, '-'))
         
         #check is scenegraph was initialised correctly by the world::ECSSManager
-        self.assertEqual(id(self.scene), id(self.s1))
+        # each Scene has its own world
+        self.assertIsNot(self.scene.world, self.s1.world)
+        self.assertIsNone(self.s1.world.root)
         self.assertEqual(self.rootEntity, self.scene.world.root)
         self.assertIsInstance(self.transUpdate, TransformSystem)
         self.assertIsInstance(self.camUpdate, CameraSystem)
@@ -154,6 +158,75 @@ class TestScene(unittest.TestCase):
         
     
     #@unittest.skip("Requires active GL context, skipping the test")
+    def test_headless(self):
+        """
+        headless Scene runs the ECSS systems and render loop stages without a window or GL context
+        """
+        print("TestScene:test_headless START".center(100, '-'))
+        
+        self.trans1.trs = util.translate(1.0, 2.0, 3.0)
+        self.scene.world.createSystem(TransformSystem("transTick"), scheduled=True)
+        self.scene.world.createSystem(CameraSystem("camTick", cameraComponent=self.orthoCam), scheduled=True)
+        self.scene.init(headless=True, maxFrames=100)
+        self.assertEqual(self.scene.renderWindow.getClassName(), "HeadlessWindow")
+        self.assertIs(self.scene.renderWindow.eventManager, self.scene.world.eventManager)
+        
+        running = True
+        while running:
+            self.scene.world.tick(1.0/60.0)
+            running = self.scene.render(running)
+            self.scene.render_post()
+        self.scene.shutdown()
+        
+        self.assertEqual(self.scene.renderWindow.frames, 100)
+        mr2c = util.inverse(util.translate(1.0, 2.0, 3.0)) @ self.orthoCam.projMat
+        np.testing.assert_array_almost_equal(self.trans2.l2world, util.translate(1.0, 2.0, 3.0))
+        np.testing.assert_array_almost_equal(self.orthoCam.root2cam, mr2c)
+        np.testing.assert_array_almost_equal(self.trans4.l2cam, mr2c)
+        
+        print("TestScene:test_headless END".center(100, '-'))
+    
+    def test_resize(self):
+        """
+        resizing the window sets the aspect of the world's Cameras
+        """
+        print("TestScene:test_resize START".center(100, '-'))
+        
+        persp = self.scene.world.addComponent(self.node4, Camera(fovy=45.0, aspect=1.0, near=0.1, far=100.0, name="persp"))
+        self.scene.init(headless=True, windowWidth=800, windowHeight=600)
+        self.scene.renderWindow.resize(1280, 720)
+        
+        self.assertEqual(persp.aspect, 1280/720)
+        np.testing.assert_array_almost_equal(persp.projMat, util.perspective(45.0, 1280/720, 0.1, 100.0))
+        # orthoCam was given its projection matrix directly, which is kept as is
+        self.assertIsNone(self.orthoCam.aspect)
+        np.testing.assert_array_almost_equal(self.orthoCam.projMat, util.ortho(-100.0, 100.0, -100.0, 100.0, 1.0, 100.0))
+        
+        print("TestScene:test_resize END".center(100, '-'))
+    
+    def test_lazyImports(self):
+        """
+        importing the Scene, Shader, VertexArray and Viewer modules does not load OpenGL, SDL2 or ImGUI
+        """
+        print("TestScene:test_lazyImports START".center(100, '-'))
+        
+        code = (
+            "import sys, types\n"
+            "import pyglGA.ext.Scene, pyglGA.ext.Shader, pyglGA.ext.VertexArray, pyglGA.GUI.Viewer\n"
+            "print([name for name in ('OpenGL.GL', 'sdl2', 'sdl2.ext', 'imgui') if type(sys.modules.get(name)) is types.ModuleType])\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "[]")
+        
+        # submodules are reachable from their package on first attribute access
+        import pyglGA.ext
+        self.assertIs(pyglGA.ext.Scene.Scene, Scene)
+        self.assertIn("VertexArray", dir(pyglGA.ext))
+        with self.assertRaises(AttributeError):
+            pyglGA.ext.NoSuchModule
+        
+        print("TestScene:test_lazyImports END".center(100, '-'))
+    
     def test_renderTriangle(self):
         """
         First time to test a RenderSystem in a Scene with Shader and VertexArray components
@@ -7,6 +7,7 @@ glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
 """
 
 import unittest
+import numpy as np
 
 import pyglGA.ECSS.utilities as util
 from pyglGA.ECSS.Entity import Entity
@@ -15,7 +16,7 @@ from pyglGA.ECSS.System import System, TransformSystem, CameraSystem, RenderSyst
 from pyglGA.ext.Scene import Scene
 from pyglGA.ECSS.ECSSManager import ECSSManager
 
-from pyglGA.ext.Shader import Shader
+from pyglGA.ext.Shader import Shader, ShaderGLDecorator
 
 @unittest.skip("Requires active GL context, skipping the test")
 class TestShader(unittest.TestCase):
@@ -46,5 +47,34 @@ class TestShader(unittest.TestCase):
         print("TestShader:test_update END".center(100, '-'))
         
 
+
+class TestShaderGLDecorator(unittest.TestCase):
+    
+    def test_setUniformVariable(self):
+        """
+        matrix uniforms are kept as float32 without a new array per call
+        """
+        print("TestShaderGLDecorator:test_setUniformVariable START".center(100, '-'))
+        
+        shaderDec = ShaderGLDecorator(Shader())
+        
+        # float32 values, e.g. column views of a float32 world, are used as they are
+        l2cam = util.translate(1.0, 2.0, 3.0).astype(np.float32)
+        shaderDec.setUniformVariable(key='modelViewProj', value=l2cam, mat4=True)
+        self.assertIs(shaderDec.component.mat4fDict['modelViewProj'], l2cam)
+        
+        # other dtypes are converted into one buffer per uniform, reused every frame
+        shaderDec.setUniformVariable(key='modelViewProj', value=util.translate(1.0, 0.0, 0.0).astype(np.float64), mat4=True)
+        buffer = shaderDec.component.mat4fDict['modelViewProj']
+        self.assertEqual(buffer.dtype, np.float32)
+        shaderDec.setUniformVariable(key='modelViewProj', value=util.translate(0.0, 5.0, 0.0).astype(np.float64), mat4=True)
+        self.assertIs(shaderDec.component.mat4fDict['modelViewProj'], buffer)
+        np.testing.assert_array_equal(buffer, util.translate(0.0, 5.0, 0.0))
+        np.testing.assert_array_equal(l2cam, util.translate(1.0, 2.0, 3.0))
+        
+        print("TestShaderGLDecorator:test_setUniformVariable END".center(100, '-'))
+
+
+
 if __name__ == "__main__":
     unittest.main(argv=[''], verbosity=3, exit=False)
\ No newline at end of file
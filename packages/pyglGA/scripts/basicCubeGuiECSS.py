@@ -10,6 +10,7 @@ pyglGA ECSS package
 """
 
 from __future__         import annotations
+import time
 import numpy as np
 import imgui
 
@@ -38,6 +39,7 @@ class ImGUIecssDecorator(ImGUIDecorator):
         self.translation = [0.0, 0.0, 0.0, 0.0]
         self.camOrthoLRBT = [-100.0, 100.0, -100.0, 100.0]
         self.camOrthoNF = [1.0, 100.0]
+        self.camChanged = False # the Camera LRBT or Near, Far values were edited since the Camera was last set
         self.mvpMat = None
         self.shaderDec = None
         
@@ -65,6 +67,7 @@ class ImGUIecssDecorator(ImGUIDecorator):
         self.camOrthoLRBT = list(orthoLRBT)
         changedNF, orthoNF = imgui.drag_float2("Camera Near, Far", *self.camOrthoNF)
         self.camOrthoNF = list(orthoNF)
+        self.camChanged = self.camChanged or changedLRBT or changedNF
         
         imgui.end()
         
@@ -95,23 +98,24 @@ class ImGUIecssDecorator(ImGUIDecorator):
                             selected = False
                             #check if the component is a BasicTransform
                             if (isinstance(comp, BasicTransform)):
-                                #set now the comp:
-                                comp.trs = util.translate(lastTranslation[0],lastTranslation[1],lastTranslation[2])
+                                #set now the comp, via the OnUpdateTRS Event written at the start of the next frame:
+                                trsMat = util.translate(lastTranslation[0],lastTranslation[1],lastTranslation[2])
+                                self.wrapeeWindow.scene.world.updateTRS(comp, trsMat, sender=self)
                                 #retrive the translation vector from the TRS matrix
                                 # @GPTODO this needs to be provided as utility method
-                                trsMat = comp.trs
                                 [x,y,z] = trsMat[:3,3]
                                 if translation is not None:
                                     translation[0] = x
                                     translation[1] = y
                                     translation[2] = z
                                     translation[3] = 1
-                            if (isinstance(comp, Camera)):
+                            if (isinstance(comp, Camera) and self.camChanged):
                                 print(comp, " ready to assign new camera values!")
-                                #set now camera params
+                                #set now camera params, only when edited so that a window resize keeps its aspect
                                 # @GPTODO
                                 # very dirty code, this is for a proof of concept only, should be replaced!
-                                comp.projMat = util.ortho(lastLRBT[0], lastLRBT[1],lastLRBT[2],lastLRBT[3],lastNF[0], lastNF[1])
+                                self.camChanged = False
+                                comp.setOrtho(lastLRBT[0], lastLRBT[1],lastLRBT[2],lastLRBT[3],lastNF[0], lastNF[1])
                                 self.mvpMat = comp.projMat 
                                 if self.shaderDec is not None:
                                     self.shaderDec.setUniformVariable(key='modelViewProj', value=self.mvpMat, mat4=True)
@@ -150,7 +154,8 @@ def main(imguiFlag = False):
     entityCam2 = scene.world.createEntity(Entity(name="entityCam2"))
     scene.world.addEntityChild(entityCam1, entityCam2)
     trans2 = scene.world.addComponent(entityCam2, BasicTransform(name="trans2", trs=util.identity()))
-    orthoCam = scene.world.addComponent(entityCam2, Camera(util.ortho(-100.0, 100.0, -100.0, 100.0, 1.0, 100.0), "orthoCam","Camera","500"))
+    # built from projection parameters (not a matrix), so that RenderWindow.resize() can set its aspect
+    orthoCam = scene.world.addComponent(entityCam2, Camera(None, "orthoCam","Camera","500", left=-100.0, right=100.0, bottom=-100.0, top=100.0, near=1.0, far=100.0))
     
     node4 = scene.world.createEntity(Entity(name="node4"))
     scene.world.addEntityChild(rootEntity, node4)
@@ -187,8 +192,10 @@ def main(imguiFlag = False):
                         4,5,6, 4,6,7,
                         5,4,0, 5,0,1), np.uint32) #rhombus out of two triangles
     # Systems
-    transUpdate = scene.world.createSystem(TransformSystem("transUpdate", "TransformSystem", "001"))
-    camUpdate = scene.world.createSystem(CameraSystem("camUpdate", "CameraUpdate", "200"))
+    # transUpdate and camUpdate are scheduled: run by scene.world.tick() once per frame, ordered by priority 
+    # and their BasicTransform, Camera read/write sets
+    transUpdate = scene.world.createSystem(TransformSystem("transUpdate", "TransformSystem", "001"), scheduled=True)
+    camUpdate = scene.world.createSystem(CameraSystem("camUpdate", "CameraUpdate", "200", orthoCam), scheduled=True)
     renderUpdate = scene.world.createSystem(RenderGLShaderSystem())
     initUpdate = scene.world.createSystem(InitGLShaderSystem())
     
@@ -207,14 +214,14 @@ def main(imguiFlag = False):
     #projMat = util.frustum(-10.0, 10.0,-10.0,10.0, -1.0, 10)
     #projMat = util.perspective(120.0, 1.33, 0.1, 100.0)
     #projMat = util.ortho(-100.0, 100.0, -100.0, 100.0, 1.0, 100.0)
-    projMat = util.ortho(-5.0, 5.0, -5.0, 5.0, -1.0, 5.0)
+    orthoCam.setOrtho(-5.0, 5.0, -5.0, 5.0, -1.0, 5.0)
+    projMat = orthoCam.projMat
     mvpMat = model @ view @ projMat
     #mvpMat =  projMat @ view @ model
     
     #
     # setup ECSS nodes pre-systems
     #
-    orthoCam.projMat = projMat
     trans2.trs = view
     trans1.trs = model
     #l2cMat = node4.l2cam
@@ -269,45 +276,41 @@ def main(imguiFlag = False):
     renderGLEventActuator = RenderGLStateSystem()
     
     #setup Events and add them to the EventManager
-    updateTRS = Event(name="OnUpdateTRS", id=100, value=None)
+    updateTRS = eManager.getEvent("OnUpdateTRS") # built into the ECSSManager, see ECSSManager.updateTRS()
     updateBackground = Event(name="OnUpdateBackground", id=200, value=None)
     #updateWireframe = Event(name="OnUpdateWireframe", id=201, value=None)
-    eManager._events[updateTRS.name] = updateTRS
-    eManager._events[updateBackground.name] = updateBackground
-    #eManager._events[updateWireframe.name] = updateWireframe # this is added inside ImGUIDecorator
+    eManager.registerEvent(updateBackground)
+    #eManager.registerEvent(updateWireframe) # this is added inside ImGUIDecorator
     
     # Add RenderWindow to the EventManager subscribers
-    # @GPTODO
-    # values of these Dicts below should be List items, not objects only 
-    #   use subscribe(), publish(), actuate() methhods
-    #
-    eManager._subscribers[updateTRS.name] = gGUI
-    eManager._subscribers[updateBackground.name] = gGUI
+    eManager.subscribe(updateTRS, gGUI)
+    eManager.subscribe(updateBackground, gGUI)
     # this is a special case below:
     # this event is published in ImGUIDecorator and the subscriber is SDLWindow
-    eManager._subscribers['OnUpdateWireframe'] = gWindow
-    eManager._actuators['OnUpdateWireframe'] = renderGLEventActuator
+    eManager.subscribe('OnUpdateWireframe', gWindow)
+    eManager.actuate('OnUpdateWireframe', renderGLEventActuator)
     
     # Add RenderWindow to the EventManager publishers
-    eManager._publishers[updateBackground.name] = gGUI
+    eManager.publish(updateBackground, gGUI)
     
+    lastTime = time.perf_counter()
     while running:
         # ---------------------------------------------------------
         # run Systems in the scenegraph
         # root node is accessed via ECSSManagerObject.root property
         # normally these are run within the rendering loop (except 4th GLInit  System)
         # --------------------------------------------------------
-        # 1. L2W traversal
-        scene.world.traverse_visit(transUpdate, scene.world.root) 
-        # 2. pre-camera Mr2c traversal
-        scene.world.traverse_visit_pre_camera(camUpdate, orthoCam)
-        # 3. run proper Ml2c traversal
-        scene.world.traverse_visit(camUpdate, scene.world.root)
+        # 1.-3. L2W traversal, then pre-camera Mr2c and proper Ml2c traversal, via the scheduler
+        now = time.perf_counter()
+        scene.world.tick(now - lastTime)
+        lastTime = now
         
         # 3.1 shader uniform variable allocation per frame
         #shaderDec4.setUniformVariable(key='modelViewProj', value=l2cMat, mat4=True)
         # direct uniform variable shader setup
         # should be called before ImGUI and before drawing Geometry
+        # the cached projMat follows window resizes and the Camera values edited in the GUI
+        mvpMat = model @ view @ orthoCam.projMat
         shaderDec4.setUniformVariable(key='modelViewProj', value=mvpMat, mat4=True)
         #shaderDec4.setUniformVariable(key='modelViewProj', value=l2cMat, mat4=True)
         #shaderDec4.setUniformVariable(key='modelViewProj', value=trans4.l2cam, mat4=True)
@@ -319,6 +322,7 @@ def main(imguiFlag = False):
         # 6. ImGUI post-display calls and SDLWindow swap 
         scene.render_post()
         
+    scene.world.shutdown()
     scene.shutdown()
 
 
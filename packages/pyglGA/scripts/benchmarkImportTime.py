@@ -0,0 +1,107 @@
+"""
+Import time benchmark, part of the pyglGA SDK
+
+glGA SDK v2021.0.5 ECSS (Entity Component System in a Scenegraph)
+@Coopyright 2020-2021 George Papagiannakis
+
+Measures the cold start time of the pyglGA packages: every sample imports a module in a fresh
+python interpreter and reports the elapsed time together with the heavy backends
+(OpenGL, SDL2, ImGUI) that were actually loaded.
+
+Usage:
+    python benchmarkImportTime.py [--repeat 10] [--save results.json] [--baseline results.json]
+"""
+
+from __future__         import annotations
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "pyglGA.ECSS",
+    "pyglGA.ext",
+    "pyglGA.GUI",
+    "pyglGA.ECSS.ECSSManager",
+    "pyglGA.ext.Scene",
+    "pyglGA.ext.Shader",
+    "pyglGA.GUI.Viewer",
+]
+
+BACKENDS = ["OpenGL.GL", "sdl2", "imgui"]
+
+_PROBE = """
+import json, sys, time, types
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+# modules bound with pyglGA.lazyImport() stay a LazyLoader subclass of ModuleType until first use
+loaded = [name for name in {backends!r} if type(sys.modules.get(name)) is types.ModuleType]
+print(json.dumps({{"seconds": elapsed, "loaded": loaded}}))
+"""
+
+
+def measureImport(module, python=None):
+    """
+    Import module in a fresh interpreter
+
+    :param module: fully qualified module name
+    :type module: str
+    :param python: python executable, defaults to sys.executable
+    :type python: str, optional
+    :return: {"seconds": import time, "loaded": list of loaded heavy backends}
+    :rtype: dict
+    """
+    code = _PROBE.format(module=module, backends=BACKENDS)
+    result = subprocess.run([python or sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def benchmark(modules=MODULES, repeat=10):
+    """
+    Measure the cold import time of each module repeat times
+
+    :return: per module min and median in milliseconds and the loaded backends
+    :rtype: dict
+    """
+    results = {}
+    for module in modules:
+        samples = [measureImport(module) for _ in range(repeat)]
+        times = [sample["seconds"] * 1000.0 for sample in samples]
+        results[module] = {
+            "min_ms": min(times),
+            "median_ms": statistics.median(times),
+            "loaded": samples[-1]["loaded"],
+        }
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="pyglGA cold import time benchmark")
+    parser.add_argument("--repeat", type=int, default=10, help="fresh interpreters per module")
+    parser.add_argument("--save", help="write the results to this json file")
+    parser.add_argument("--baseline", help="json file of a previous run to compare against")
+    args = parser.parse_args(argv)
+
+    results = benchmark(repeat=args.repeat)
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print(f"{'module':<28}{'min ms':>10}{'median ms':>12}{'vs baseline':>14}  backends loaded")
+    for module, result in results.items():
+        delta = ""
+        if module in baseline:
+            delta = f"{result['median_ms'] - baseline[module]['median_ms']:+.1f}"
+        print(f"{module:<28}{result['min_ms']:>10.1f}{result['median_ms']:>12.1f}{delta:>14}  {', '.join(result['loaded']) or '-'}")
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()